@@ -0,0 +1,57 @@
+"""BarAggregator: güncelleme başına maliyet (updates/sec) zaman dilimi sayısından bağımsız mı.
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_bar_aggregator.py --rows 200000
+
+Her satır 1m bar; ``resample`` satırı aynı veride her zaman dilimi için toplu
+``resample_ohlc`` süresidir (canlı akışta kullanılamaz, referans için).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from algo5.data._utils import resample_ohlc
+from algo5.data.aggregator import BarAggregator
+
+TIMEFRAMES = ["5min", "15min", "1h", "4h", "1D"]
+
+
+def _bars(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2020-01-01", periods=rows, freq="min", tz="UTC")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, rows)))
+    return pd.DataFrame(
+        {"open": close, "high": close, "low": close, "close": close, "volume": 1.0}, index=idx
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=200_000)
+    args = ap.parse_args()
+
+    df = _bars(args.rows)
+    ts = df.index.as_unit("ns").asi8.tolist()
+    c = df["close"].tolist()
+    print(f"rows={args.rows:,}")
+    for k in (1, 2, len(TIMEFRAMES)):
+        agg = BarAggregator(TIMEFRAMES[:k])
+        t0 = time.perf_counter()
+        for t, px in zip(ts, c, strict=True):
+            agg._update_ns("X", t, px, px, px, px, 1.0)
+        secs = time.perf_counter() - t0
+        print(f"  online  {k} tf  {secs:>7.3f} s  {args.rows / secs:>12,.0f} updates/s")
+    t0 = time.perf_counter()
+    for rule in TIMEFRAMES:
+        resample_ohlc(df, rule)
+    print(f"  resample {len(TIMEFRAMES)} tf {time.perf_counter() - t0:>7.3f} s (toplu)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""EventBus publish micro-benchmark (events/sec).
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_event_bus.py --events 1000000
+
+``legacy`` satırı eski publish yolunu (her event'te handler listesini kopyalayan,
+her çağrıyı try/except ile saran) taklit eder; diğer satırlar ``EventBus`` modlarıdır.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from collections import defaultdict
+from typing import Any
+
+from algo5.core.bus import EventBus
+
+log = logging.getLogger(__name__)
+
+
+class _LegacyBus:
+    def __init__(self) -> None:
+        self._subs: defaultdict[type[Any], list[Any]] = defaultdict(list)
+
+    def subscribe(self, event_type: type[Any], handler: Any) -> None:
+        self._subs[event_type].append(handler)
+
+    def publish(self, event: Any) -> None:
+        for h in list(self._subs.get(type(event), [])):
+            try:
+                h(event, self)
+            except Exception:
+                log.exception("handler %s failed", h.__name__)
+
+
+class _Ev:
+    __slots__ = ("i",)
+
+    def __init__(self, i: int) -> None:
+        self.i = i
+
+
+class _Nested:
+    __slots__ = ("depth",)
+
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+
+
+def _run(bus: Any, n_events: int, n_handlers: int) -> float:
+    acc = [0]
+
+    def handler(e: _Ev, _bus: Any) -> None:
+        acc[0] += 1
+
+    for _ in range(n_handlers):
+        bus.subscribe(_Ev, handler)
+    events = [_Ev(i) for i in range(n_events)]
+    publish = bus.publish
+    t0 = time.perf_counter()
+    for e in events:
+        publish(e)
+    dt = time.perf_counter() - t0
+    assert acc[0] == n_events * n_handlers
+    return n_events / dt
+
+
+def _run_nested(bus: Any, depth: int) -> float:
+    """Handler kendi içinden publish eder (zincir uzunluğu = depth)."""
+
+    def handler(e: _Nested, b: Any) -> None:
+        if e.depth > 0:
+            b.publish(_Nested(e.depth - 1))
+
+    bus.subscribe(_Nested, handler)
+    t0 = time.perf_counter()
+    bus.publish(_Nested(depth))
+    return (depth + 1) / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--events", type=int, default=1_000_000)
+    ap.add_argument("--handlers", type=int, default=3)
+    ap.add_argument("--depth", type=int, default=100_000, help="nested publish zinciri")
+    args = ap.parse_args()
+
+    cases: list[tuple[str, Any]] = [
+        ("legacy", _LegacyBus()),
+        ("compiled/log", EventBus()),
+        ("compiled/fast", EventBus(error_policy="fast")),
+        ("compiled/fast+queue", EventBus(error_policy="fast", queue_nested=True)),
+    ]
+    print(f"events={args.events} handlers={args.handlers}")
+    base = None
+    for name, bus in cases:
+        rate = _run(bus, args.events, args.handlers)
+        base = base or rate
+        print(f"  {name:<22} {rate:>14,.0f} ev/s  x{rate / base:.2f}")
+
+    # Recursion limiti yüzünden sadece kuyruklu mod derin zinciri taşıyabilir.
+    rate = _run_nested(EventBus(queue_nested=True), args.depth)
+    print(f"nested depth={args.depth}: queue_nested {rate:,.0f} ev/s (stack sabit)")
+
+
+if __name__ == "__main__":
+    main()
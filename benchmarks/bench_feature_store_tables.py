@@ -0,0 +1,90 @@
+"""FeatureStore tablo formatı: CSV vs mmap'li .npy kolonları (yükleme süresi ve RSS).
+
+Her yükleme ayrı bir süreçte ölçülür (peak RSS = ``ru_maxrss``).
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_feature_store_tables.py --rows 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algo5.data.feature_store.store import FeatureStore
+
+
+def _ohlcv(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2015-01-01", periods=rows, freq="min", tz="UTC")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, rows)))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.integers(1, 1_000, rows),
+        },
+        index=idx,
+    )
+
+
+def _child(root: str, key: str, kwargs: dict, q: mp.Queue) -> None:
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    df = FeatureStore(Path(root)).load(key, **kwargs)
+    elapsed = time.perf_counter() - t0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    q.put((elapsed, (peak - base) / 1024, len(df)))
+
+
+def _measure(root: str, key: str, **kwargs) -> tuple[float, float, int]:
+    ctx = mp.get_context("fork")
+    q = ctx.Queue()
+    p = ctx.Process(target=_child, args=(root, key, kwargs, q))
+    p.start()
+    out = q.get()
+    p.join()
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=2_000_000)
+    args = ap.parse_args()
+
+    df = _ohlcv(args.rows)
+    with tempfile.TemporaryDirectory() as root:
+        st = FeatureStore(Path(root))
+        t0 = time.perf_counter()
+        st.save("csv", df, format="csv")
+        csv_save = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        st.save("npy", df)
+        npy_save = time.perf_counter() - t0
+
+        last = df.index[-1]
+        month = {"start": last - pd.Timedelta(days=30), "end": last}
+        cases = [
+            ("csv  full", "csv", {}),
+            ("npy  full", "npy", {}),
+            ("csv  close, 30d", "csv", {"columns": ["close"], **month}),
+            ("npy  close, 30d", "npy", {"columns": ["close"], **month}),
+        ]
+        print(f"rows={args.rows:,}  save csv {csv_save:.2f} s  npy {npy_save:.2f} s")
+        for label, key, kwargs in cases:
+            secs, rss_mb, n = _measure(root, key, **kwargs)
+            print(f"  load {label:<16} {secs:>8.3f} s  +{rss_mb:>8.1f} MB  rows={n:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""``compute_metrics``: eski pandas implementasyonu vs NumPy çekirdeği vs batch.
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_metrics.py --curves 1000 --bars 2520
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from algo5.metrics.metrics import compute_metrics, compute_metrics_batch
+
+
+def _legacy(nav: pd.Series) -> dict[str, float]:
+    nav = nav.astype(float)
+    rets = nav.pct_change().dropna()
+    vol = float(rets.std() * np.sqrt(252)) if len(rets) else 0.0
+    sharpe = (
+        float((rets.mean() / rets.std()) * np.sqrt(252)) if len(rets) and rets.std() > 0 else 0.0
+    )
+    rollmax = nav.expanding().max()
+    mdd = float(((nav - rollmax) / rollmax).min()) if len(nav) else 0.0
+    total = float(nav.iloc[-1] / nav.iloc[0] - 1.0) if len(nav) else 0.0
+    return {"sharpe": sharpe, "max_drawdown": mdd, "total_return": total, "vol": vol}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--curves", type=int, default=1_000)
+    ap.add_argument("--bars", type=int, default=2_520)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    navs = np.cumprod(1 + rng.normal(0, 0.01, (args.curves, args.bars)), axis=1)
+    series = [pd.Series(row) for row in navs]
+
+    timings = []
+    for name, fn in [
+        ("pandas (legacy)", lambda: [_legacy(s) for s in series]),
+        ("numpy per curve", lambda: [compute_metrics(s) for s in series]),
+        ("numpy batch", lambda: compute_metrics_batch(navs)),
+    ]:
+        t0 = time.perf_counter()
+        fn()
+        timings.append((name, time.perf_counter() - t0))
+
+    print(f"curves={args.curves:,} bars={args.bars:,}")
+    base = timings[0][1]
+    for name, dt in timings:
+        print(f"  {name:<16} {dt * 1e3:>9.1f} ms  x{base / dt:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Order/Fill üretim hızı ve bellek benchmark'ı.
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_orders.py --n 10000000
+
+``legacy`` satırı eski modeli (``__dict__``'li dataclass + her emirde uuid4) taklit eder.
+Bellek ölçümü ``--mem-sample`` kadar nesneyi canlı tutarak tracemalloc ile yapılır.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from algo5.engine.execution.models import (
+    TIF,
+    Fill,
+    MonotonicIds,
+    Order,
+    OrderType,
+    Side,
+    set_order_id_factory,
+)
+
+
+@dataclass
+class _LegacyOrder:
+    side: Side
+    qty: float
+    type: OrderType
+    symbol: str = "AAPL"
+    limit_price: float | None = None
+    stop_price: float | None = None
+    tif: TIF = TIF.GTC
+    id: str = field(default_factory=lambda: uuid4().hex)
+
+
+@dataclass
+class _LegacyFill:
+    order_id: str
+    qty: float
+    price: float
+    commission: float = 0.0
+    slippage_bps: float = 0.0
+
+
+def _throughput(order_cls: Any, fill_cls: Any, n: int) -> float:
+    buy, mkt = Side.BUY, OrderType.MARKET
+    t0 = time.perf_counter()
+    for i in range(n):
+        o = order_cls(buy, 1.0, mkt)
+        fill_cls(o.id, 1.0, 100.0 + (i & 7))
+    return n / (time.perf_counter() - t0)
+
+
+def _bytes_per_pair(order_cls: Any, fill_cls: Any, n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    buy, mkt = Side.BUY, OrderType.MARKET
+    keep = []
+    for _ in range(n):
+        o = order_cls(buy, 1.0, mkt)
+        keep.append((o, fill_cls(o.id, 1.0, 100.0)))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return size / n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--n", type=int, default=10_000_000, help="order+fill çifti sayısı")
+    ap.add_argument("--mem-sample", type=int, default=200_000)
+    args = ap.parse_args()
+
+    cases: list[tuple[str, Any, Any, Callable[[], str] | None]] = [
+        ("legacy (dict + uuid4)", _LegacyOrder, _LegacyFill, None),
+        ("slots + uuid4", Order, Fill, None),
+        ("slots + MonotonicIds", Order, Fill, MonotonicIds("o")),
+    ]
+    print(f"n={args.n:,} mem-sample={args.mem_sample:,}")
+    base = None
+    for name, order_cls, fill_cls, ids in cases:
+        prev = set_order_id_factory(ids)
+        try:
+            rate = _throughput(order_cls, fill_cls, args.n)
+            mem = _bytes_per_pair(order_cls, fill_cls, args.mem_sample)
+        finally:
+            set_order_id_factory(prev)
+        base = base or rate
+        print(f"  {name:<24} {rate:>12,.0f} pairs/s  x{rate / base:.2f}  {mem:>7.0f} B/pair")
+
+
+if __name__ == "__main__":
+    main()
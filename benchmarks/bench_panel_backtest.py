@@ -0,0 +1,57 @@
+"""Parametre taraması: config başına ``run_vector_backtest`` vs tek ``run_panel_backtest``.
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_panel_backtest.py --params 200 --symbols 200
+
+Exposure'lar sentetik (rastgele 0/1); ölçülen sadece backtest + metrik maliyetidir.
+Döngü tarafı ``--loop-params`` kadar config için ölçülüp ölçeklenir.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from algo5.engine.execution.engine_v2 import close_panel, run_panel_backtest, run_vector_backtest
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--params", type=int, default=200)
+    ap.add_argument("--symbols", type=int, default=200)
+    ap.add_argument("--bars", type=int, default=2_520)
+    ap.add_argument("--loop-params", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    idx = pd.date_range("2015-01-01", periods=args.bars, freq="B")
+    syms = [f"S{i:03d}" for i in range(args.symbols)]
+    prices = {
+        s: pd.DataFrame({"close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, args.bars)))}, idx)
+        for s in syms
+    }
+    tensor = (rng.random((args.params, args.bars, args.symbols)) < 0.5).astype(float)
+
+    k = min(args.loop_params, args.params)
+    t0 = time.perf_counter()
+    for p in range(k):
+        exp = {s: pd.Series(tensor[p, :, j], idx) for j, s in enumerate(syms)}
+        run_vector_backtest(prices, lambda px, cfg, exp=exp: exp)
+    loop_s = (time.perf_counter() - t0) / k * args.params
+
+    t0 = time.perf_counter()
+    run_panel_backtest(close_panel(prices), tensor)
+    panel_s = time.perf_counter() - t0
+
+    print(f"params={args.params} symbols={args.symbols} bars={args.bars}")
+    print(f"  per-config loop (est.) {loop_s:>8.2f} s")
+    print(f"  panel                  {panel_s:>8.2f} s  x{loop_s / panel_s:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Portföy vol-target: bar başına pencere kovaryansı vs rank-1 streaming ve bloklu batch.
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_portfolio_vol.py --assets 100 500 2000 --bars 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from algo5.core.risk.portfolio import PortfolioVolTarget
+
+
+def _window_recompute(rets: np.ndarray, w: np.ndarray, lookback: int, target: float) -> None:
+    """Her barda son ``lookback`` getiriden tam kovaryans (naif yol)."""
+    for t in range(1, rets.shape[0]):
+        cov = np.cov(rets[max(0, t + 1 - lookback) : t + 1], rowvar=False)
+        vol = np.sqrt(w[t] @ cov @ w[t] * 252)
+        _ = w[t] * min(1.0, target / vol)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--assets", type=int, nargs="+", default=[100, 500, 2000])
+    ap.add_argument("--bars", type=int, default=250)
+    ap.add_argument("--lookback", type=int, default=60)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    for n in args.assets:
+        rets = rng.normal(0, 0.01, (args.bars, n))
+        w = np.full((args.bars, n), 1.0 / n)
+
+        t0 = time.perf_counter()
+        _window_recompute(rets, w, args.lookback, 0.10)
+        naive_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        pvt = PortfolioVolTarget(n, target_pct=10.0, lookback=args.lookback)
+        for t in range(args.bars):
+            pvt.on_return(rets[t])
+            pvt.target_weights(w[t])
+        stream_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        PortfolioVolTarget(n, target_pct=10.0, lookback=args.lookback).run(rets, w)
+        batch_s = time.perf_counter() - t0
+
+        print(f"assets={n:,} bars={args.bars:,}")
+        print(f"  window np.cov     {naive_s:>8.3f} s")
+        print(f"  rank-1 streaming  {stream_s:>8.3f} s  x{naive_s / stream_s:.1f}")
+        print(f"  blocked batch     {batch_s:>8.3f} s  x{naive_s / batch_s:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""OHLCV kalite taraması: kontrol başına pandas geçişi vs tek geçişli ``OhlcvScanner``.
+
+Tarayıcı, ``np.load(mmap_mode="r")`` ile açılan kolonları ``--chunk`` satırlık parçalarla
+okur; peak RSS her ölçüm için ayrı bir süreçte alınır (``ru_maxrss``).
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_quality_checks.py --rows 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from algo5.data.quality.checks import OhlcvScanner
+
+COLS = ("ts", "open", "high", "low", "close")
+
+
+def _write(root: Path, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    ts = pd.date_range("2015-01-01", periods=rows, freq="min", tz="UTC").as_unit("ns").asi8
+    ts = np.delete(ts, rng.integers(0, rows, rows // 1000))  # eksik barlar
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, ts.size)))
+    cols = {"ts": ts, "open": close, "high": close * 1.001, "low": close * 0.999, "close": close}
+    for name, arr in cols.items():
+        np.save(root / f"{name}.npy", arr)
+
+
+def _pandas(root: Path, chunk: int) -> int:
+    df = pd.DataFrame({c: np.load(root / f"{c}.npy") for c in COLS[1:]})
+    df.index = pd.to_datetime(np.load(root / "ts.npy"), utc=True)
+    dt = df.index.to_series().diff()
+    freq = dt[dt > pd.Timedelta(0)].median()
+    ret = df["close"].pct_change()
+    z = (ret - ret.expanding(30).mean().shift()) / ret.expanding(30).std().shift()
+    run = df["close"].ne(df["close"].shift()).cumsum()
+    counts = [
+        int(df.index.duplicated().sum()),
+        int((dt < pd.Timedelta(0)).sum()),
+        int((df["high"] < df[["open", "close", "low"]].max(axis=1)).sum()),
+        int((df["low"] > df[["open", "close", "high"]].min(axis=1)).sum()),
+        int((df[list(COLS[1:])] <= 0).any(axis=1).sum()),
+        int((dt[dt > freq] // freq - 1).sum()),
+        int(df.isna().any(axis=1).sum()),
+        int((z.abs() > 6).sum()),
+        int((df["close"].groupby(run).size() >= 5).sum()),
+    ]
+    return sum(counts)
+
+
+def _fused(root: Path, chunk: int) -> int:
+    mm = {c: np.load(root / f"{c}.npy", mmap_mode="r") for c in COLS}
+    sc = OhlcvScanner()
+    for i in range(0, len(mm["ts"]), chunk):
+        sc.update(*(mm[c][i : i + chunk] for c in COLS))
+    return sum(sc.finish().counts.values())
+
+
+def _child(fn, root: str, chunk: int, q: mp.Queue) -> None:
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    total = fn(Path(root), chunk)
+    elapsed = time.perf_counter() - t0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    q.put((elapsed, (peak - base) / 1024, total))
+
+
+def _measure(fn, root: str, chunk: int) -> tuple[float, float, int]:
+    ctx = mp.get_context("fork")
+    q = ctx.Queue()
+    p = ctx.Process(target=_child, args=(fn, root, chunk, q))
+    p.start()
+    out = q.get()
+    p.join()
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=5_000_000)
+    ap.add_argument("--chunk", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        _write(Path(root), args.rows)
+        print(f"rows={args.rows:,}  chunk={args.chunk:,}")
+        for label, fn in (("pandas per-check", _pandas), ("fused mmap scan", _fused)):
+            secs, rss_mb, total = _measure(fn, root, args.chunk)
+            print(f"  {label:<18} {secs:>8.3f} s  +{rss_mb:>8.1f} MB  issues={total:,}")
+
+
+if __name__ == "__main__":
+    main()
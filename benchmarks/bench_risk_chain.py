@@ -0,0 +1,49 @@
+"""RiskChain: sembol başına Series pipeline'ı vs derlenmiş matris zinciri.
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_risk_chain.py --symbols 1000 --bars 2520
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from algo5.engine.risk.chain import RiskChain
+from algo5.engine.risk.rules import FloorCapRule, MaxPositionRule, VolTargetRule
+from algo5.engine.risk.sizer import Sizer
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--symbols", type=int, default=1_000)
+    ap.add_argument("--bars", type=int, default=2_520)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    rets = rng.normal(0, 0.01, (args.bars, args.symbols))
+    sig = (rng.random((args.bars, args.symbols)) < 0.5).astype(float)
+    chain = RiskChain(Sizer(), [VolTargetRule(), MaxPositionRule(0.5), FloorCapRule()])
+
+    t0 = time.perf_counter()
+    for j in range(args.symbols):
+        chain.run(pd.Series(rets[:, j]), pd.Series(sig[:, j]))
+    series_s = time.perf_counter() - t0
+
+    compiled = chain.compile()
+    compiled.run(rets, sig)  # tamponları ısıt
+    t0 = time.perf_counter()
+    compiled.run(rets, sig)
+    matrix_s = time.perf_counter() - t0
+
+    print(f"symbols={args.symbols:,} bars={args.bars:,}")
+    print(f"  series per symbol {series_s:>8.3f} s")
+    print(f"  compiled matrix   {matrix_s:>8.3f} s  x{series_s / matrix_s:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Bekleyen emir simülasyonu: bar bar ``match_order_on_bar`` vs vektörize kernel.
+
+Kullanım::
+
+    PYTHONPATH=src python benchmarks/bench_vector_matcher.py --bars 500000 --orders 2000
+
+Her emir ``submit_bar``'ından itibaren ilk fill'e kadar taranır; döngü tarafı sadece
+``--loop-orders`` kadar emir için ölçülüp emir başı süre üzerinden ölçeklenir.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from algo5.engine.execution.matcher import match_order_on_bar
+from algo5.engine.execution.models import Order, OrderType, Side
+from algo5.engine.execution.vector_matcher import OrderTable, match_orders_on_bars
+
+
+def _bars(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    c = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    o = np.r_[100.0, c[:-1]]
+    h = np.maximum(o, c) * (1 + rng.uniform(0, 0.001, n))
+    low = np.minimum(o, c) * (1 - rng.uniform(0, 0.001, n))
+    return o, h, low, c
+
+
+def _orders(n: int, n_bars: int, c: np.ndarray, seed: int):
+    rng = np.random.default_rng(seed + 1)
+    submit = rng.integers(0, n_bars, n)
+    out = []
+    for s in submit:
+        side = Side.BUY if rng.random() < 0.5 else Side.SELL
+        off = float(c[s] * (1 + rng.normal(0, 0.05)))
+        t = OrderType.LIMIT if rng.random() < 0.5 else OrderType.STOP
+        kw = {"limit_price": off} if t is OrderType.LIMIT else {"stop_price": off}
+        out.append(Order(side=side, qty=1.0, type=t, **kw))
+    return out, submit
+
+
+def _loop(o, h, low, c, orders, submit) -> int:
+    n, filled = len(o), 0
+    for od, s in zip(orders, submit, strict=True):
+        for i in range(s, n):
+            if match_order_on_bar(od, o=o[i], h=h[i], low=low[i], c=c[i]) is not None:
+                filled += 1
+                break
+    return filled
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--bars", type=int, default=500_000)
+    ap.add_argument("--orders", type=int, default=2_000)
+    ap.add_argument("--loop-orders", type=int, default=50)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    o, h, low, c = _bars(args.bars, args.seed)
+    orders, submit = _orders(args.orders, args.bars, c, args.seed)
+    # döngü için numpy skalerleri yerine Python float listeleri (adil karşılaştırma)
+    lo, lh, ll, lc = (x.tolist() for x in (o, h, low, c))
+
+    k = min(args.loop_orders, args.orders)
+    t0 = time.perf_counter()
+    _loop(lo, lh, ll, lc, orders[:k], submit[:k])
+    loop_s = (time.perf_counter() - t0) / k * args.orders
+
+    t0 = time.perf_counter()
+    table = OrderTable.from_orders(orders, submit)
+    res = match_orders_on_bars(o, h, low, c, table)
+    vec_s = time.perf_counter() - t0
+
+    print(f"bars={args.bars:,} orders={args.orders:,} filled={int(res.filled.sum()):,}")
+    print(f"  bar-by-bar (est.) {loop_s:>9.3f} s")
+    print(f"  vectorized        {vec_s:>9.3f} s  x{loop_s / vec_s:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+import pandas as pd
 
 from algo5.core.bus import EventBus
+from algo5.core.risk import RiskConfig, StreamingRiskEngine
 from algo5.core.events import (
     OrderAuthorized,
     OrderFilled,
@@ -11,10 +16,12 @@ from algo5.core.events import (
     OrderRequested,
     PortfolioUpdated,
     Tick,
+    TickBatch,
 )
 from algo5.engine.execution.gateways.paper import PaperGateway
 from algo5.engine.execution.matcher import match_order_on_bar
 from algo5.engine.execution.models import Order, OrderType, Side
+from algo5.engine.execution.trailing_oco import TrailingState
 
 logger = logging.getLogger(__name__)
 
@@ -26,35 +33,51 @@ class Strategy:
     strategy_id: str = "simple_mean_reversion"
     state: str = "flat"
     last_tick: Tick | None = None
+    _prev_c: float | None = field(default=None, repr=False)
 
     def on_tick(self, event: Tick, bus: EventBus) -> None:
-        prev = self.last_tick
         self.last_tick = event
+        lo = getattr(event, "l", getattr(event, "low", None))
+        hi = getattr(event, "h", getattr(event, "high", None))
+        self._decide(event.symbol, event.o, hi, lo, event.c, bus)
+
+    def on_bar(self, batch: TickBatch, i: int, bus: EventBus) -> None:
+        """``TickBatch`` satırı için ``on_tick`` eşdeğeri (Tick nesnesi üretmez)."""
+        _, sym, o, h, low, c, _ = batch.columns()
+        self._decide(batch.symbols[sym[i]], o[i], h[i], low[i], c[i], bus)
+
+    def on_tick_batch(self, event: TickBatch, bus: EventBus) -> None:
+        for i in range(len(event)):
+            self.on_bar(event, i, bus)
+
+    def _decide(
+        self, symbol: str, o: float, h: float | None, low: float | None, c: float, bus: EventBus
+    ) -> None:
+        prev_c = self._prev_c
+        self._prev_c = c
 
         # 1) flat & up bar -> MARKET BUY
-        if self.state == "flat" and event.c > event.o:
+        if self.state == "flat" and c > o:
             order = Order(
                 side=Side.BUY,
                 qty=1.0,
                 type=OrderType.MARKET,
-                symbol=event.symbol,
+                symbol=symbol,
             )
             bus.publish(OrderRequested(order=order, strategy_id=self.strategy_id))
             self.state = "long"
             return
 
         # 2) long & new bar -> LIMIT SELL at prev close * 1.02 if in range
-        if self.state == "long" and prev is not None:
-            target = round(prev.c * 1.02, 2)
-            lo = getattr(event, "l", getattr(event, "low", None))
-            hi = getattr(event, "h", getattr(event, "high", None))
-            if lo is not None and hi is not None and lo <= target <= hi:
+        if self.state == "long" and prev_c is not None:
+            target = round(prev_c * 1.02, 2)
+            if low is not None and h is not None and low <= target <= h:
                 order = Order(
                     side=Side.SELL,
                     qty=1.0,
                     type=OrderType.LIMIT,
                     limit_price=target,
-                    symbol=event.symbol,
+                    symbol=symbol,
                 )
                 bus.publish(OrderRequested(order=order, strategy_id=self.strategy_id))
                 self.state = "flat"
@@ -62,15 +85,64 @@ class Strategy:
 
 @dataclass
 class RiskGuard:
-    """Risk kontrolü - pozisyon ve notional limitleri."""
+    """Risk kontrolü - pozisyon ve notional limitleri.
+
+    ``risk_cfg`` verilirse sembol başına bir ``StreamingRiskEngine`` tick'lerle (O(1))
+    güncellenir ve pozisyonu büyüten emirlerin miktarı vol-target ölçeği x stop
+    çarpanı ile küçültülür (çarpan 0 ise emir reddedilir).
+    """
 
     max_position: float = 10.0
     max_notional: float = 10000.0
     current_position: float = 0.0
     current_notional: float = 0.0
+    risk_cfg: RiskConfig | None = None
+    engines: dict[str, StreamingRiskEngine] = field(default_factory=dict)
+
+    def _engine(self, symbol: str) -> StreamingRiskEngine:
+        eng = self.engines.get(symbol)
+        if eng is None:
+            eng = self.engines[symbol] = StreamingRiskEngine(self.risk_cfg)
+        return eng
+
+    def on_tick(self, event: Tick, bus: EventBus) -> None:
+        if self.risk_cfg is not None:
+            self._engine(event.symbol).on_price(event.c)
+
+    def on_bar(self, batch: TickBatch, i: int, bus: EventBus) -> None:
+        """``TickBatch`` satırı için ``on_tick`` eşdeğeri."""
+        if self.risk_cfg is not None:
+            _, sym, _, _, _, c, _ = batch.columns()
+            self._engine(batch.symbols[sym[i]]).on_price(c[i])
+
+    def _scale(self, order: Order) -> Order | None:
+        """Pozisyonu büyüten emri risk çarpanıyla ölçekler (0 ise None).
+
+        Azaltan emirler mevcut pozisyonla sınırlanır (ölçeklenmiş girişten sonra
+        sabit miktarlı çıkış ters pozisyon açmasın).
+        """
+        pos = self.current_position
+        buy = order.side == Side.BUY
+        if pos != 0 and buy == (pos < 0):
+            return replace(order, qty=abs(pos)) if order.qty > abs(pos) else order
+        eng = self.engines.get(order.symbol)
+        if eng is None:
+            return order
+        mult = float(eng.multiplier())  # type: ignore[arg-type]
+        if mult >= 1.0:
+            return order
+        if mult <= 0.0:
+            return None
+        return replace(order, qty=order.qty * mult)
 
     def on_order_requested(self, event: OrderRequested, bus: EventBus) -> None:
         order = event.order
+        if self.risk_cfg is not None:
+            scaled = self._scale(order)
+            if scaled is None:
+                bus.publish(OrderRejected(order=order, reason="Risk scale is zero (stop/vol)"))
+                return
+            order = scaled
 
         position_change = order.qty if order.side == Side.BUY else -order.qty
         new_position = self.current_position + position_change
@@ -110,25 +182,47 @@ class ExecutionEngine:
     pending_orders: dict[str, Order] = field(default_factory=dict)
     last_tick: Tick | None = None
     order_counter: int = 0
+    trailing: TrailingState = field(default_factory=TrailingState, repr=False)
+    _batch: TickBatch | None = field(default=None, repr=False)
+    _row: int = field(default=0, repr=False)
 
     def on_tick(self, event: Tick, bus: EventBus) -> None:
         self.last_tick = event
+        self._batch = None
         if not self.pending_orders:
             return
 
         # l / low alias desteği
         low_arg = getattr(event, "l", getattr(event, "low", None))
-
+        self._match_pending(event.o, event.h, low_arg, event.c, bus)
+
+    def on_bar(self, batch: TickBatch, i: int, bus: EventBus) -> None:
+        """``TickBatch`` satırı için ``on_tick`` eşdeğeri (Tick nesnesi üretmez)."""
+        self.last_tick = None
+        self._batch, self._row = batch, i
+        if self.pending_orders:
+            _, _, o, h, low, c, _ = batch.columns()
+            self._match_pending(o[i], h[i], low[i], c[i], bus)
+
+    def on_tick_batch(self, event: TickBatch, bus: EventBus) -> None:
+        for i in range(len(event)):
+            self.on_bar(event, i, bus)
+
+    def _match_pending(
+        self, o: float, h: float, low: float | None, c: float, bus: EventBus
+    ) -> None:
         to_remove = []
         for oid, order in list(self.pending_orders.items()):
             f = match_order_on_bar(
                 order=order,
-                o=event.o,
-                h=event.h,
-                low=low_arg,
-                c=event.c,
+                o=o,
+                h=h,
+                low=low,
+                c=c,
+                trail=self.trailing,
             )
             if f is not None:
+                self.trailing.discard(order.id)
                 bus.publish(OrderFilled(fill=f, order_id=oid))
                 to_remove.append(oid)
 
@@ -141,6 +235,8 @@ class ExecutionEngine:
         self.pending_orders[oid] = event.order
         if self.last_tick is not None:
             self.on_tick(self.last_tick, bus)
+        elif self._batch is not None:
+            self.on_bar(self._batch, self._row, bus)
 
 
 @dataclass
@@ -153,6 +249,8 @@ class PortfolioManager:
     unrealized_pnl: float = 0.0
     realized_pnl: float = 0.0
     last_tick: Tick | None = None
+    _px: float | None = field(default=None, repr=False)
+    _ts: pd.Timestamp | None = field(default=None, repr=False)
 
     def on_order_filled(self, event: OrderFilled, bus: EventBus) -> None:
         f = event.fill
@@ -182,17 +280,27 @@ class PortfolioManager:
 
     def on_tick(self, event: Tick, bus: EventBus) -> None:
         self.last_tick = event
+        self._px, self._ts = event.c, event.ts
         self._publish_update(bus)
 
+    def on_bar(self, batch: TickBatch, i: int, bus: EventBus) -> None:
+        """``TickBatch`` satırı için ``on_tick`` eşdeğeri (Tick nesnesi üretmez)."""
+        self._px, self._ts = batch.columns()[5][i], batch.timestamps()[i]
+        self._publish_update(bus)
+
+    def on_tick_batch(self, event: TickBatch, bus: EventBus) -> None:
+        for i in range(len(event)):
+            self.on_bar(event, i, bus)
+
     def _publish_update(self, bus: EventBus) -> None:
-        if self.last_tick is None:
+        if self._px is None or self._ts is None:
             return
-        px = self.last_tick.c
+        px = self._px
         self.unrealized_pnl = (px - self.entry_price) * self.position
         equity = self.cash + self.position * px
         bus.publish(
             PortfolioUpdated(
-                timestamp=self.last_tick.ts,
+                timestamp=self._ts,
                 cash=self.cash,
                 position=self.position,
                 equity=equity,
@@ -200,3 +308,20 @@ class PortfolioManager:
                 realized_pnl=self.realized_pnl,
             )
         )
+
+
+@dataclass
+class BatchReplayer:
+    """``TickBatch``'i bar bar, bileşenlerin ``on_bar`` adımlarını sırayla çağırarak oynatır.
+
+    Adım sırası, ``Tick`` aboneliklerinin sırasıyla aynı olmalıdır; böylece bir bar
+    içinde üretilen emir/fill/portföy event'leri per-tick replay ile aynı sırada akar.
+    """
+
+    steps: list[Callable[[TickBatch, int, Any], None]]
+
+    def on_tick_batch(self, event: TickBatch, bus: EventBus) -> None:
+        steps = self.steps
+        for i in range(len(event)):
+            for step in steps:
+                step(event, i, bus)
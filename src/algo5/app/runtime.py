@@ -2,18 +2,35 @@
 """Event-driven runtime wiring (Week-4/5)."""
 from __future__ import annotations
 
-from algo5.app.components import ExecutionEngine, PortfolioManager, RiskGuard, Strategy
+from algo5.app.components import (
+    BatchReplayer,
+    ExecutionEngine,
+    PortfolioManager,
+    RiskGuard,
+    Strategy,
+)
+from algo5.core.async_bus import AsyncEventBus
 from algo5.core.bus import EventBus
-from algo5.core.events import OrderAuthorized, OrderFilled, OrderRequested, Tick
+from algo5.core.events import OrderAuthorized, OrderFilled, OrderRequested, Tick, TickBatch
+from algo5.core.risk import RiskConfig
 from algo5.engine.execution.gateways.paper import PaperGateway
 
 
 def build_event_driven_app(
     initial_cash: float = 10_000.0,
-) -> tuple[EventBus, Strategy, RiskGuard, ExecutionEngine, PortfolioManager]:
-    bus = EventBus()
+    bus: EventBus | AsyncEventBus | None = None,
+    risk_cfg: RiskConfig | None = None,
+) -> tuple[EventBus | AsyncEventBus, Strategy, RiskGuard, ExecutionEngine, PortfolioManager]:
+    """Bileşenleri verilen bus'a bağlar (varsayılan: senkron ``EventBus``).
+
+    ``AsyncEventBus`` verilirse her handler kendi kuyruğundan beslenir; tick'ler
+    ``await bus.publish_async(...)`` ile gönderilip ``await bus.drain()`` ile beklenir.
+    ``risk_cfg`` verilirse ``RiskGuard`` tick'lerle streaming vol-target/stop durumunu
+    günceller ve yeni emirleri bu duruma göre ölçekler.
+    """
+    bus = bus if bus is not None else EventBus()
     strat = Strategy()
-    risk = RiskGuard()
+    risk = RiskGuard(risk_cfg=risk_cfg)
 
     gateway = PaperGateway(initial_capital=initial_cash, fees_bps=0.0, slippage_bps=0.0)
     exe = ExecutionEngine(gateway=gateway)
@@ -23,22 +40,33 @@ def build_event_driven_app(
     # 1) Tick'i önce execution görsün (pending emirleri bu bar üzerinde eşleştirebilsin)
     bus.subscribe(Tick, exe.on_tick)
 
-    # 2) Sonra strateji karar versin (OrderRequested yayınlar)
+    # 2) Risk durumu (vol/stop) stratejiden önce bu barla güncellensin
+    if risk_cfg is not None:
+        bus.subscribe(Tick, risk.on_tick)
+
+    # 3) Sonra strateji karar versin (OrderRequested yayınlar)
     bus.subscribe(Tick, strat.on_tick)
 
-    # 3) Risk kontrolü -> onay/red
+    # 4) Risk kontrolü -> onay/red
     bus.subscribe(OrderRequested, risk.on_order_requested)
 
-    # 4) Onaylanan emir execution'a düşsün (hemen mevcut bara karşı denenir)
+    # 5) Onaylanan emir execution'a düşsün (hemen mevcut bara karşı denenir)
     bus.subscribe(OrderAuthorized, exe.on_order_authorized)
 
-    # 5) Fill'ler portföye ve risk'e işlensin
+    # 6) Fill'ler portföye ve risk'e işlensin
     bus.subscribe(OrderFilled, pf.on_order_filled)
     bus.subscribe(OrderFilled, risk.on_order_filled)
 
-    # 6) Portföy her Tick'te equity'yi güncellesin
+    # 7) Portföy her Tick'te equity'yi güncellesin
     bus.subscribe(Tick, pf.on_tick)
 
+    # 8) TickBatch: aynı sırayı bar bar uygulayan tek handler (Tick nesnesi üretmeden)
+    steps = [exe.on_bar, strat.on_bar, pf.on_bar]
+    if risk_cfg is not None:
+        steps.insert(1, risk.on_bar)
+    replayer = BatchReplayer(steps)
+    bus.subscribe(TickBatch, replayer.on_tick_batch)
+
     return bus, strat, risk, exe, pf
 
 
@@ -21,9 +21,13 @@ from .events import (
 from .events import (
     Tick as Tick,
 )
+from .events import (
+    TickBatch as TickBatch,
+)
 
 __all__ = [
     "Tick",
+    "TickBatch",
     "OrderRequested",
     "OrderAuthorized",
     "OrderRejected",
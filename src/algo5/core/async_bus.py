@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections import defaultdict, deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+log = logging.getLogger(__name__)
+
+AsyncHandler = Callable[[Any, Any], Any]  # fn(event, bus) -> None | Awaitable
+OverflowPolicy = Literal["block", "drop_oldest", "conflate"]
+KeyFn = Callable[[Any], Hashable | None]
+
+
+def symbol_key(event: Any) -> Hashable | None:
+    """Conflation anahtarı: event.symbol ya da event.order.symbol (yoksa None)."""
+    sym = getattr(event, "symbol", None)
+    if sym is None:
+        sym = getattr(getattr(event, "order", None), "symbol", None)
+    return sym
+
+
+@dataclass
+class _Subscription:
+    event_type: type[Any]
+    handler: AsyncHandler
+    policy: OverflowPolicy
+    queue: asyncio.Queue[Any]
+    key_fn: KeyFn
+    latest: dict[Hashable, Any] = field(default_factory=dict)  # conflate: key -> son event
+    backlog: deque[Any] = field(default_factory=deque)  # block + senkron publish taşması
+    feeder: asyncio.Task[None] | None = None
+    worker: asyncio.Task[None] | None = None
+    inflight: int = 0  # kuyrukta/işlenmekte olan event sayısı
+    processed: int = 0
+    dropped: int = 0
+    conflated: int = 0
+
+    @property
+    def name(self) -> str:
+        return str(getattr(self.handler, "__name__", repr(self.handler)))
+
+    @property
+    def idle(self) -> bool:
+        return self.inflight == 0 and not self.backlog
+
+
+class AsyncEventBus:
+    """asyncio tabanlı pub/sub bus; ``EventBus`` ile aynı subscribe/publish yüzeyi.
+
+    Her abonenin kendi sınırlı kuyruğu ve worker task'ı vardır; yavaş bir handler
+    diğerlerini bekletmez. Kuyruk dolunca davranış ``overflow`` ile seçilir:
+
+    - ``"block"``: ``await publish_async`` yer açılana kadar bekler (backpressure).
+      Senkron ``publish`` bloklayamaz; taşanlar sırayı koruyarak aboneye ait
+      backlog'a alınır ve arka planda kuyruğa beslenir.
+    - ``"drop_oldest"``: en eski bekleyen event atılır.
+    - ``"conflate"``: aynı anahtar (varsayılan: sembol) için sadece son event tutulur.
+
+    Handler'lar ``fn(event, bus)`` imzalı senkron fonksiyon ya da coroutine olabilir.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = "block",
+        key_fn: KeyFn = symbol_key,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if overflow not in ("block", "drop_oldest", "conflate"):
+            raise ValueError(f"unknown overflow policy: {overflow!r}")
+        self.maxsize = maxsize
+        self.overflow: OverflowPolicy = overflow
+        self.key_fn = key_fn
+        self._subs: defaultdict[type[Any], list[_Subscription]] = defaultdict(list)
+        self._table: dict[type[Any], tuple[_Subscription, ...]] = {}
+        self._closed = False
+
+    # ---------- subscriptions ----------
+    def subscribe(
+        self,
+        event_type: type[Any],
+        handler: AsyncHandler,
+        *,
+        maxsize: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> None:
+        sub = _Subscription(
+            event_type=event_type,
+            handler=handler,
+            policy=overflow or self.overflow,
+            queue=asyncio.Queue(maxsize=maxsize or self.maxsize),
+            key_fn=self.key_fn,
+        )
+        self._subs[event_type].append(sub)
+        self._table[event_type] = tuple(self._subs[event_type])
+        log.debug("subscribed %s -> %s (%s)", sub.name, event_type.__name__, sub.policy)
+
+    def _all(self) -> list[_Subscription]:
+        return [s for subs in self._subs.values() for s in subs]
+
+    # ---------- publish ----------
+    def publish(self, event: Any) -> None:
+        """Bloklamayan publish (handler içinden de çağrılabilir)."""
+        for sub in self._table.get(type(event), ()):
+            self._offer(sub, event)
+
+    async def publish_async(self, event: Any) -> None:
+        """``block`` politikasında dolu kuyrukta yer açılmasını bekler."""
+        for sub in self._table.get(type(event), ()):
+            if sub.policy == "block":
+                if self._closed:
+                    raise RuntimeError("AsyncEventBus is closed")
+                self._ensure_worker(sub)
+                if sub.feeder is not None and not sub.feeder.done():
+                    # önce senkron taşmalar kuyruğa girsin (sıra korunur)
+                    await asyncio.shield(sub.feeder)
+                sub.inflight += 1
+                await sub.queue.put(event)
+            else:
+                self._offer(sub, event)
+
+    def publish_many(self, events: list[Any]) -> None:
+        for e in events:
+            self.publish(e)
+
+    def _offer(self, sub: _Subscription, event: Any) -> None:
+        if self._closed:
+            raise RuntimeError("AsyncEventBus is closed")
+        self._ensure_worker(sub)
+        q = sub.queue
+
+        if sub.policy == "conflate":
+            key = sub.key_fn(event)
+            if key is not None and key in sub.latest:
+                sub.latest[key] = event
+                sub.conflated += 1
+                return
+            token: Hashable = key if key is not None else object()
+            if q.full():
+                self._drop_oldest(sub)
+            sub.latest[token] = event
+            sub.inflight += 1
+            q.put_nowait(token)
+            return
+
+        if not q.full() and not sub.backlog:
+            sub.inflight += 1
+            q.put_nowait(event)
+        elif sub.policy == "drop_oldest":
+            self._drop_oldest(sub)
+            sub.inflight += 1
+            q.put_nowait(event)
+        else:  # block: senkron çağrıda bekleyemeyiz -> backlog
+            sub.backlog.append(event)
+            if sub.feeder is None or sub.feeder.done():
+                sub.feeder = asyncio.get_running_loop().create_task(self._feed(sub))
+
+    @staticmethod
+    def _drop_oldest(sub: _Subscription) -> None:
+        old = sub.queue.get_nowait()
+        sub.queue.task_done()
+        if sub.policy == "conflate":
+            sub.latest.pop(old, None)
+        sub.inflight -= 1
+        sub.dropped += 1
+
+    async def _feed(self, sub: _Subscription) -> None:
+        while sub.backlog:
+            event = sub.backlog[0]
+            await sub.queue.put(event)
+            sub.backlog.popleft()
+            sub.inflight += 1
+
+    # ---------- workers ----------
+    def _ensure_worker(self, sub: _Subscription) -> None:
+        if sub.worker is None or sub.worker.done():
+            sub.worker = asyncio.get_running_loop().create_task(self._work(sub))
+
+    async def _work(self, sub: _Subscription) -> None:
+        q = sub.queue
+        while True:
+            item = await q.get()
+            event = sub.latest.pop(item) if sub.policy == "conflate" else item
+            try:
+                res = sub.handler(event, self)
+                if inspect.isawaitable(res):
+                    await res
+            except Exception:
+                log.exception("handler %s failed for %s", sub.name, type(event).__name__)
+            finally:
+                sub.processed += 1
+                sub.inflight -= 1
+                q.task_done()
+
+    async def drain(self) -> None:
+        """Tüm kuyruklar (handler'ların ürettiği yeni event'ler dahil) boşalana kadar bekler."""
+        while True:
+            pending = [s for s in self._all() if not s.idle]
+            if not pending:
+                return
+            for s in pending:
+                if s.feeder is not None:
+                    await s.feeder
+                await s.queue.join()
+
+    async def aclose(self) -> None:
+        """Kuyrukları boşaltır ve worker task'larını durdurur."""
+        await self.drain()
+        self._closed = True
+        tasks = [s.worker for s in self._all() if s.worker is not None]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> AsyncEventBus:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    # ---------- introspection ----------
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Abone başına sayaçlar: ``{"<Event>:<handler>": {...}}``."""
+        return {
+            f"{s.event_type.__name__}:{s.name}": {
+                "queued": s.queue.qsize() + len(s.backlog),
+                "processed": s.processed,
+                "dropped": s.dropped,
+                "conflated": s.conflated,
+            }
+            for s in self._all()
+        }
+
+
+__all__ = ["AsyncEventBus", "OverflowPolicy", "symbol_key"]
@@ -1,31 +1,94 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Literal
 
 log = logging.getLogger(__name__)
 Handler = Callable[[Any, "EventBus"], None]
+ErrorPolicy = Literal["log", "fast"]
+
+
+def _name(fn: Any) -> str:
+    return str(getattr(fn, "__name__", repr(fn)))
 
 
 class EventBus:
-    """Basit in-memory publish/subscribe bus (handler imzası: fn(event, bus))."""
+    """Basit in-memory publish/subscribe bus (handler imzası: fn(event, bus)).
 
-    def __init__(self) -> None:
+    - Abonelikler event tipi başına immutable tuple olarak derlenir; tablo sadece
+      subscribe/unsubscribe'da yeniden kurulur (publish'te kopya yok).
+    - ``error_policy="log"``: her handler ayrı korunur, hata loglanır (varsayılan).
+      ``error_policy="fast"``: koruma yok, ilk hata publish çağıranına yükselir.
+    - ``queue_nested=True``: handler içinden yapılan publish'ler kuyruğa alınır ve
+      mevcut dispatch bitince sırayla işlenir (recursion yok, stack büyümez).
+    """
+
+    def __init__(self, *, error_policy: ErrorPolicy = "log", queue_nested: bool = False) -> None:
+        if error_policy not in ("log", "fast"):
+            raise ValueError(f"unknown error_policy: {error_policy!r}")
         self._subs: defaultdict[type[Any], list[Handler]] = defaultdict(list)
+        self._table: dict[type[Any], tuple[Handler, ...]] = {}
+        self.error_policy: ErrorPolicy = error_policy
+        self.queue_nested = queue_nested
+        self._pending: deque[Any] = deque()
+        self._dispatching = False
+        self._dispatch: Callable[[Any], None] = (
+            self._dispatch_fast if error_policy == "fast" else self._dispatch_logged
+        )
 
     def subscribe(self, event_type: type[Any], handler: Handler) -> None:
         self._subs[event_type].append(handler)
-        log.debug("subscribed %s -> %s", handler.__name__, event_type.__name__)
+        self._table[event_type] = tuple(self._subs[event_type])
+        log.debug("subscribed %s -> %s", _name(handler), event_type.__name__)
+
+    def unsubscribe(self, event_type: type[Any], handler: Handler) -> bool:
+        """Handler'ı kaldırır; kayıtlı değilse False döner."""
+        handlers = self._subs.get(event_type)
+        if not handlers or handler not in handlers:
+            return False
+        handlers.remove(handler)
+        if handlers:
+            self._table[event_type] = tuple(handlers)
+        else:
+            del self._subs[event_type]
+            self._table.pop(event_type, None)
+        return True
+
+    def handlers(self, event_type: type[Any]) -> tuple[Handler, ...]:
+        return self._table.get(event_type, ())
 
     def publish(self, event: Any) -> None:
-        for h in list(self._subs.get(type(event), [])):
-            try:
-                h(event, self)
-            except Exception:
-                log.exception("handler %s failed for %s", h.__name__, type(event).__name__)
+        if not self.queue_nested:
+            self._dispatch(event)
+            return
+
+        self._pending.append(event)
+        if self._dispatching:
+            return  # dıştaki döngü işleyecek
+        self._dispatching = True
+        try:
+            while self._pending:
+                self._dispatch(self._pending.popleft())
+        except BaseException:
+            self._pending.clear()
+            raise
+        finally:
+            self._dispatching = False
 
     def publish_many(self, events: list[Any]) -> None:
         for e in events:
             self.publish(e)
+
+    # ---------- dispatch ----------
+    def _dispatch_logged(self, event: Any) -> None:
+        for h in self._table.get(type(event), ()):
+            try:
+                h(event, self)
+            except Exception:
+                log.exception("handler %s failed for %s", _name(h), type(event).__name__)
+
+    def _dispatch_fast(self, event: Any) -> None:
+        for h in self._table.get(type(event), ()):
+            h(event, self)
@@ -8,10 +8,12 @@ from .events import (
     PortfolioUpdated,
     SystemHealth,
     Tick,
+    TickBatch,
 )
 
 __all__ = [
     "Tick",
+    "TickBatch",
     "OrderRequested",
     "OrderAuthorized",
     "OrderRejected",
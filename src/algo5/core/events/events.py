@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from algo5.engine.execution.models import Fill, Order
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tick:
     """Piyasa veri tick'i / bar."""
 
@@ -19,9 +22,118 @@ class Tick:
     c: float
     v: float
     exchange: str = "NYSE"
-
-
-@dataclass(frozen=True)
+    timeframe: str | None = None  # None: ham tick/bar; aggregator çıktısında "5min" vb.
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TickBatch:
+    """Kolon bazlı bar paketi (bar başına nesne üretmeden replay için).
+
+    ``ts`` UTC epoch nanosaniye (int64), fiyat/hacim kolonları float64, ``sym`` ise
+    ``symbols`` içindeki indeksleri tutan sembol kodlarıdır.
+    """
+
+    ts: np.ndarray
+    sym: np.ndarray
+    o: np.ndarray
+    h: np.ndarray
+    low: np.ndarray
+    c: np.ndarray
+    v: np.ndarray
+    symbols: tuple[str, ...]
+    tz: str | None = None
+    exchange: str = "NYSE"
+    _lists: list[list[Any]] = field(default_factory=list, init=False, repr=False)
+    _stamps: list[pd.Timestamp] = field(default_factory=list, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return int(self.ts.shape[0])
+
+    def columns(self) -> list[list[Any]]:
+        """[ts, sym, o, h, low, c, v] kolonlarını Python listesi olarak (cache'li) döner."""
+        if not self._lists:
+            cols = (self.ts, self.sym, self.o, self.h, self.low, self.c, self.v)
+            self._lists.extend(col.tolist() for col in cols)
+        return self._lists
+
+    def timestamps(self) -> list[pd.Timestamp]:
+        """Satır zaman damgaları (toplu kutulanır ve cache'lenir)."""
+        if not self._stamps:
+            idx = pd.DatetimeIndex(self.ts.view("M8[ns]"))
+            if self.tz is not None:
+                idx = idx.tz_localize("UTC").tz_convert(self.tz)
+            self._stamps.extend(idx)
+        return self._stamps
+
+    def timestamp(self, i: int) -> pd.Timestamp:
+        return self.timestamps()[i]
+
+    def tick(self, i: int) -> Tick:
+        """i. satırı ``Tick`` olarak üretir (debug / geriye uyumluluk için)."""
+        ts, sym, o, h, low, c, v = (col[i] for col in self.columns())
+        return Tick(self.timestamp(i), self.symbols[sym], o, h, low, c, v, self.exchange)
+
+    @classmethod
+    def from_ticks(cls, ticks: Sequence[Tick]) -> TickBatch:
+        if not ticks:
+            raise ValueError("from_ticks(): empty tick list")
+        tz = ticks[0].ts.tz
+        codes: dict[str, int] = {}
+        sym = [codes.setdefault(t.symbol, len(codes)) for t in ticks]
+        if any(t.ts.tz != tz for t in ticks):
+            raise ValueError("from_ticks(): mixed timezones")
+        return cls(
+            ts=np.fromiter((t.ts.value for t in ticks), dtype=np.int64, count=len(ticks)),
+            sym=np.asarray(sym, dtype=np.int32),
+            o=np.fromiter((t.o for t in ticks), dtype=np.float64, count=len(ticks)),
+            h=np.fromiter((t.h for t in ticks), dtype=np.float64, count=len(ticks)),
+            low=np.fromiter((t.low for t in ticks), dtype=np.float64, count=len(ticks)),
+            c=np.fromiter((t.c for t in ticks), dtype=np.float64, count=len(ticks)),
+            v=np.fromiter((t.v for t in ticks), dtype=np.float64, count=len(ticks)),
+            symbols=tuple(codes),
+            tz=None if tz is None else str(tz),
+            exchange=ticks[0].exchange,
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, symbol: str | Iterable[str]) -> TickBatch:
+        """OHLCV DataFrame'den (open/high/low/close/volume; büyük-küçük harf serbest).
+
+        ``symbol`` tek bir sembol ya da satır başına sembol dizisi olabilir.
+        """
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("from_frame(): index must be a DatetimeIndex")
+        cols = {str(c).lower(): c for c in df.columns}
+        missing = [k for k in ("open", "high", "low", "close") if k not in cols]
+        if missing:
+            raise ValueError(f"from_frame(): missing columns {missing}")
+
+        def col(name: str) -> np.ndarray:
+            if name not in cols:
+                return np.zeros(len(df), dtype=np.float64)
+            return df[cols[name]].to_numpy(dtype=np.float64)
+
+        if isinstance(symbol, str):
+            symbols: tuple[str, ...] = (symbol,)
+            sym = np.zeros(len(df), dtype=np.int32)
+        else:
+            codes_, uniq = pd.factorize(pd.Index(list(symbol)))
+            symbols, sym = tuple(str(s) for s in uniq), codes_.astype(np.int32)
+        idx = df.index
+        return cls(
+            ts=idx.as_unit("ns").asi8.copy(),
+            sym=sym,
+            o=col("open"),
+            h=col("high"),
+            low=col("low"),
+            c=col("close"),
+            v=col("volume"),
+            symbols=symbols,
+            tz=None if idx.tz is None else str(idx.tz),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class OrderRequested:
     """Stratejiden emir talebi."""
 
@@ -29,7 +141,7 @@ class OrderRequested:
     strategy_id: str = "default"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderAuthorized:
     """Riskten geçen emir."""
 
@@ -37,7 +149,7 @@ class OrderAuthorized:
     reason: str | None = "approved"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderRejected:
     """Risk tarafından reddedilen emir."""
 
@@ -45,7 +157,7 @@ class OrderRejected:
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderFilled:
     """Emrin fill olması."""
 
@@ -53,7 +165,7 @@ class OrderFilled:
     order_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioUpdated:
     """Portföy güncellemesi (testler `position` bekliyor)."""
 
@@ -65,7 +177,7 @@ class PortfolioUpdated:
     realized_pnl: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemHealth:
     """Sistem sağlık durumu."""
 
@@ -2,6 +2,7 @@
 
 import json
 import uuid
+from dataclasses import fields, is_dataclass
 from datetime import datetime, timezone
 from typing import Any, cast
 
@@ -17,6 +18,9 @@ def _normalize(obj: Any) -> Any:
         return [_normalize(x) for x in obj]
     if isinstance(obj, dict):
         return {str(k): _normalize(v) for k, v in obj.items()}
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # __slots__'lu dataclass'larda vars() yok
+        return {f.name: _normalize(getattr(obj, f.name)) for f in fields(obj)}
     if hasattr(obj, "__dict__"):
         try:
             return _normalize(vars(obj))
@@ -1,4 +1,15 @@
 ﻿from .config import RiskConfig
 from .engine import RiskEngine
+from .portfolio import EwmCov, PortfolioVolTarget
+from .stops import StopEvents, segmented_stops
+from .streaming import StreamingRiskEngine
 
-__all__ = ["RiskConfig", "RiskEngine"]
+__all__ = [
+    "EwmCov",
+    "PortfolioVolTarget",
+    "RiskConfig",
+    "RiskEngine",
+    "StopEvents",
+    "StreamingRiskEngine",
+    "segmented_stops",
+]
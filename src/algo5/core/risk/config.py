@@ -10,3 +10,5 @@ class RiskConfig:
     vol_lookback: int = 20
     ann_factor: int = 252
     stop_loss_pct: float | None = None  # % cinsinden; None => kapalı
+    stop_reentry: str = "next_signal"  # "next_signal" | "cooloff" (işlem bazlı stoplar)
+    stop_cooloff_bars: int = 0  # "cooloff": stop sonrası düz kalınacak bar sayısı
@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 
 from .config import RiskConfig
+from .stops import StopEvents, segmented_stops
 
 
 class RiskEngine:
@@ -34,14 +35,31 @@ class RiskEngine:
         return sized
 
     def apply_stops(
-        self, strategy_returns: pd.Series, price: pd.Series
+        self,
+        strategy_returns: pd.Series,
+        price: pd.Series,
+        position: pd.Series | None = None,
     ) -> tuple[pd.Series, list[dict]]:
+        """Stop çarpanı (0/1) ve loglar.
+
+        ``position`` verilmezse fiyatın global koşan tepesine göre; verilirse işlem bazlı
+        (``apply_trade_stops``; tepe her işlemde sıfırlanır, cool-off/yeniden giriş ile).
+        """
         logs: list[dict] = []
         sl = self.cfg.stop_loss_pct
         idx = price.index
         if not (self.cfg.enabled and sl and sl > 0):
             return pd.Series(1.0, index=idx), logs
 
+        if position is not None:
+            pos = position.astype(float).reindex(idx).fillna(0.0)
+            adj_pos, events = self.apply_trade_stops(pos, price)
+            adj = pd.Series(np.where((pos != 0) & (adj_pos == 0), 0.0, 1.0), index=idx)
+            logs.extend(
+                {"type": "stop_triggered", **rec} for rec in events.to_dict(orient="records")
+            )
+            return adj, logs
+
         px = price.astype(float)
         roll_max = px.cummax()
         dd = px / roll_max - 1.0
@@ -53,3 +71,30 @@ class RiskEngine:
         if (adj == 0.0).any():
             logs.append({"type": "stop_triggered", "count": int((adj == 0.0).sum())})
         return adj, logs
+
+    def apply_trade_stops(
+        self, exposure: pd.Series | pd.DataFrame, price: pd.Series | pd.DataFrame
+    ) -> tuple[pd.Series | pd.DataFrame, pd.DataFrame]:
+        """İşlem bazlı stop: (stop uygulanmış exposure, stop olay tablosu).
+
+        DataFrame girdide her sütun bir semboldür; hepsi tek geçişte işlenir.
+        """
+        sl = self.cfg.stop_loss_pct
+        if not (self.cfg.enabled and sl and sl > 0):
+            return exposure.copy(), StopEvents.empty().to_frame()
+
+        px = price.reindex(exposure.index)
+        if isinstance(exposure, pd.DataFrame):
+            px = px.reindex(columns=exposure.columns)
+        adj, events = segmented_stops(
+            exposure.to_numpy(dtype=float),
+            px.to_numpy(dtype=float),
+            float(sl),
+            cooloff_bars=int(self.cfg.stop_cooloff_bars),
+            reentry=self.cfg.stop_reentry,  # type: ignore[arg-type]
+        )
+        cols = exposure.columns if isinstance(exposure, pd.DataFrame) else None
+        log = events.to_frame(index=exposure.index, columns=cols)
+        if cols is None:
+            return pd.Series(adj, index=exposure.index, name=exposure.name), log
+        return pd.DataFrame(adj, index=exposure.index, columns=cols), log
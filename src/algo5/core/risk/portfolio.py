@@ -0,0 +1,215 @@
+"""Portföy seviyesinde (korelasyonlu) vol-target: EWMA kovaryans + rank-1 güncelleme.
+
+``EwmVar`` özyinelemesinin matris hali: ``d = x - ortalama_önceki`` ile
+
+    cov' = (1 - a) * (cov + a * d dᵀ)
+
+(pandas ``ewm(adjust=False).cov(bias=False)`` ile aynı; köşegen ``EwmVar`` ile aynıdır).
+Bar başına maliyet O(n²) tek dış çarpım; tam kovaryansı pencereden yeniden kurmanın
+O(L·n²) maliyeti yoktur. Batch modunda barlar bloklanır: blok içindeki her barın
+``wᵀΣw``'si blok başındaki kovaryans ve blok getirilerinden GEMM ile, blok sonu
+kovaryansı tek bir rank-B güncellemeyle hesaplanır (bar başına matris taraması yok).
+"""
+
+from __future__ import annotations
+
+from math import sqrt
+
+import numpy as np
+
+from .config import RiskConfig
+
+
+class EwmCov:
+    """n varlık için EWMA ortalama vektörü ve kovaryans matrisi (bias düzeltmeli)."""
+
+    __slots__ = ("alpha", "n", "mean", "cov", "sum_wt2", "_d", "_buf")
+
+    def __init__(self, span: float, n_assets: int) -> None:
+        if span < 1:
+            raise ValueError("span must be >= 1")
+        self.alpha = 2.0 / (float(span) + 1.0)
+        self.n = 0  # gözlem sayısı
+        self.mean = np.zeros(n_assets)
+        self.cov = np.zeros((n_assets, n_assets))
+        self.sum_wt2 = 1.0
+        self._d = np.empty(n_assets)
+        self._buf = np.empty((n_assets, n_assets))
+
+    @property
+    def n_assets(self) -> int:
+        return int(self.mean.shape[0])
+
+    def update(self, x: np.ndarray) -> None:
+        """Bir getiri vektörü ekler (NaN -> 0)."""
+        x = np.nan_to_num(np.asarray(x, dtype=np.float64).reshape(-1), nan=0.0)
+        if self.n == 0:
+            self.mean[:] = x
+            self.n = 1
+            return
+        a = self.alpha
+        np.subtract(x, self.mean, out=self._d)
+        self.mean += a * self._d
+        np.multiply.outer(self._d, a * self._d, out=self._buf)
+        self.cov += self._buf
+        self.cov *= 1.0 - a
+        self.sum_wt2 = self.sum_wt2 * (1.0 - a) ** 2 + a * a
+        self.n += 1
+
+    def update_block(self, x: np.ndarray, w: np.ndarray) -> np.ndarray:
+        """(B, n) getiri bloğunu ekler; her bar için düzeltilmiş ``w_tᵀ Σ_t w_t`` döner.
+
+        ``update`` + ``quad``'ın bar bar uygulanmasıyla (yuvarlama farkı dışında) aynıdır.
+        """
+        x = np.nan_to_num(np.asarray(x, dtype=np.float64), nan=0.0)
+        out = np.full(x.shape[0], np.nan)
+        start = 0
+        if self.n == 0 and x.shape[0]:
+            self.update(x[0])
+            start = 1
+        x, w = x[start:], w[start:]
+        b = x.shape[0]
+        if b == 0:
+            return out
+
+        a = self.alpha
+        q = 1.0 - a
+        d = np.empty_like(x)
+        den = np.empty(b)
+        m, s2 = self.mean, self.sum_wt2
+        for t in range(b):  # O(B·n): ortalama ve ağırlık toplamı sıralı
+            np.subtract(x[t], m, out=d[t])
+            m += a * d[t]
+            s2 = s2 * q * q + a * a
+            den[t] = 1.0 - s2
+        self.sum_wt2 = s2
+
+        k = np.arange(b)
+        lag = k[:, None] - k[None, :]  # t - k
+        decay = np.where(lag >= 0, a * q ** (np.maximum(lag, 0) + 1), 0.0)
+        base = np.einsum("ij,ij->i", w @ self.cov, w)
+        quad = q ** (k + 1) * base + (decay * (w @ d.T) ** 2).sum(axis=1)
+
+        self.cov *= q**b
+        self.cov += (d * (a * q ** (b - k))[:, None]).T @ d
+        self.n += b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[start:] = np.where(den > 0, quad / den, np.nan)
+        return out
+
+    def covariance(self) -> np.ndarray:
+        """Bias düzeltmeli kovaryans (ilk gözlemde NaN)."""
+        den = 1.0 - self.sum_wt2
+        if self.n < 2 or den <= 0:
+            return np.full_like(self.cov, np.nan)
+        return self.cov / den
+
+    def quad(self, w: np.ndarray) -> float:
+        """Düzeltilmiş ``wᵀ Σ w`` (matris kopyalamadan)."""
+        den = 1.0 - self.sum_wt2
+        if self.n < 2 or den <= 0:
+            return float("nan")
+        return float(w @ self.cov @ w) / den
+
+
+class PortfolioVolTarget:
+    """Ağırlık vektörünü ``sqrt(wᵀΣw) * sqrt(ann) = hedef`` olacak şekilde ölçekler.
+
+    ``max_scale`` (varsayılan 1.0, ``RiskEngine`` gibi) yalnızca küçültmeye izin verir;
+    vol 0/NaN ise ölçek 1'dir. Streaming: ``on_return`` / ``on_price`` + ``target_weights``;
+    batch: ``run(returns, weights)``. Bar t'nin ağırlığı t dahil getirilerle hesaplanan
+    kovaryansı kullanır (``size_positions`` ile aynı hizalama).
+    """
+
+    def __init__(
+        self,
+        n_assets: int,
+        target_pct: float = 15.0,
+        lookback: int = 20,
+        ann_factor: int = 252,
+        max_scale: float = 1.0,
+    ) -> None:
+        self.target = float(target_pct) / 100.0
+        self.ann = sqrt(float(ann_factor))
+        self.max_scale = float(max_scale)
+        self.lookback = max(2, int(lookback))
+        self.cov = EwmCov(self.lookback, int(n_assets))
+        self.last_price = np.full(int(n_assets), np.nan)
+        self.last_scale = 1.0
+
+    @classmethod
+    def from_config(cls, cfg: RiskConfig, n_assets: int) -> PortfolioVolTarget:
+        return cls(
+            n_assets,
+            target_pct=cfg.vol_target_pct or 0.0,
+            lookback=cfg.vol_lookback,
+            ann_factor=cfg.ann_factor,
+        )
+
+    @property
+    def n_assets(self) -> int:
+        return self.cov.n_assets
+
+    # ---------- streaming ----------
+    def on_return(self, ret: np.ndarray) -> None:
+        self.cov.update(ret)
+
+    def on_price(self, price: np.ndarray) -> None:
+        """Fiyat vektörü ekler; getiri (pct_change, ilk bar/NaN -> 0) kovaryansa işlenir."""
+        px = np.asarray(price, dtype=np.float64).reshape(-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ret = px / self.last_price - 1.0
+        ret[~np.isfinite(ret)] = 0.0
+        self.last_price = px.copy()
+        self.cov.update(ret)
+
+    def portfolio_vol(self, weights: np.ndarray) -> float:
+        """Yıllıklandırılmış portföy volatilitesi."""
+        w = np.nan_to_num(np.asarray(weights, dtype=np.float64).reshape(-1), nan=0.0)
+        return sqrt(max(self.cov.quad(w), 0.0)) * self.ann
+
+    def scale(self, weights: np.ndarray) -> float:
+        if self.target <= 0:
+            return 1.0
+        vol = self.portfolio_vol(weights)
+        s = self.target / vol if vol > 0 else 1.0  # NaN/0 -> 1
+        return min(s, self.max_scale) if s == s else 1.0
+
+    def target_weights(self, weights: np.ndarray) -> np.ndarray:
+        """Güncel kovaryansla ölçeklenmiş ağırlıklar."""
+        w = np.nan_to_num(np.asarray(weights, dtype=np.float64).reshape(-1), nan=0.0)
+        self.last_scale = self.scale(w)
+        return w * self.last_scale
+
+    # ---------- batch ----------
+    def _scales(self, quad: np.ndarray) -> np.ndarray:
+        if self.target <= 0:
+            return np.ones_like(quad)
+        vol = np.sqrt(np.maximum(quad, 0.0)) * self.ann
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = self.target / vol
+        s[~np.isfinite(s) | ~(vol > 0)] = 1.0  # NaN/0 -> 1
+        return np.minimum(s, self.max_scale)
+
+    def run(
+        self, returns: np.ndarray, weights: np.ndarray, block: int = 64
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(T, n) getiri/ağırlık paneli -> (ölçeklenmiş ağırlıklar, bar başına ölçek).
+
+        Kovaryans state'i mevcut durumdan devam eder; sonuç streaming ile aynıdır
+        (yuvarlama farkı dışında).
+        """
+        r = np.asarray(returns, dtype=np.float64)
+        w = np.nan_to_num(np.asarray(weights, dtype=np.float64), nan=0.0)
+        if r.shape != w.shape or r.ndim != 2 or r.shape[1] != self.n_assets:
+            raise ValueError(f"expected (T, {self.n_assets}) returns/weights")
+        scales = np.ones(r.shape[0])
+        step = max(1, int(block))
+        for t0 in range(0, r.shape[0], step):
+            t1 = t0 + step
+            scales[t0:t1] = self._scales(self.cov.update_block(r[t0:t1], w[t0:t1]))
+        self.last_scale = float(scales[-1]) if len(scales) else self.last_scale
+        return w * scales[:, None], scales
+
+
+__all__ = ["EwmCov", "PortfolioVolTarget"]
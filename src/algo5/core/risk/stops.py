@@ -0,0 +1,196 @@
+"""İşlem (trade) bazlı, vektörize stop-loss ve cool-off/yeniden giriş.
+
+Pozisyon serisindeki her kesintisiz aynı yönlü blok bir işlemdir. İşlem içinde fiyatın
+koşan tepesi (long) / dibi (short) segmentli cummax ile hesaplanır: ``seg + 1j*fiyat``
+kompleks dizisinin ``maximum.accumulate``'i (kompleks sıralama önce reel kısma bakar)
+her segmentte sıfırlanan tepeyi tam olarak verir.
+
+Stop, kapanışın tepeden ``stop_pct`` kadar düştüğü ilk barda tetiklenir; pozisyon o
+barın kapanışında kapanır, yani exposure bir sonraki bardan itibaren sıfırlanır.
+Yeniden giriş politikası:
+
+- ``"next_signal"``: işlem bitene (pozisyon sinyali sıfırlanana / yön değiştirene) kadar düz.
+- ``"cooloff"``: ``cooloff_bars`` bar sonra sinyal hâlâ açıksa yeni bir işlem olarak
+  girilir (tepe yeniden başlar). Bu girişler tur tur işlenir; tur sayısı bir işlemdeki
+  en fazla stop sayısıdır, her tur O(n).
+
+Birden çok sembol (sütun) tek düz dizide, sütun sınırlarında kesilen segmentlerle işlenir.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+ReentryPolicy = Literal["next_signal", "cooloff"]
+
+
+@dataclass(frozen=True)
+class StopEvents:
+    """Stop olay kaydı (olay başına bir satır, paralel diziler)."""
+
+    symbol: np.ndarray  # sütun indeksi
+    entry_bar: np.ndarray  # işlem(parça) başlangıç barı
+    stop_bar: np.ndarray  # tetik barı
+    reentry_bar: np.ndarray  # yeniden giriş barı, yoksa -1
+    extreme: np.ndarray  # tetikteki tepe (long) / dip (short)
+    price: np.ndarray  # tetik barı kapanışı
+    drawdown: np.ndarray  # tepeden/dipten ters yönlü hareket (negatif)
+
+    @classmethod
+    def empty(cls) -> StopEvents:
+        i, f = np.empty(0, dtype=np.int64), np.empty(0)
+        return cls(i, i, i, i, f, f, f)
+
+    def __len__(self) -> int:
+        return int(self.stop_bar.shape[0])
+
+    def to_frame(
+        self, index: pd.Index | None = None, columns: pd.Index | None = None
+    ) -> pd.DataFrame:
+        df = pd.DataFrame(
+            {
+                "symbol": self.symbol,
+                "entry_bar": self.entry_bar,
+                "stop_bar": self.stop_bar,
+                "reentry_bar": self.reentry_bar,
+                "extreme": self.extreme,
+                "price": self.price,
+                "drawdown": self.drawdown,
+            }
+        )
+        if columns is not None:
+            df["symbol"] = np.asarray(columns)[self.symbol]
+        if index is not None and len(df):
+            df.insert(3, "ts", index[self.stop_bar])
+        return df
+
+
+def _flat(a: np.ndarray) -> np.ndarray:
+    """(T, S) -> sütun sütun düz dizi (S*T,)."""
+    return np.ascontiguousarray(a.T).reshape(-1)
+
+
+def segmented_stops(  # noqa: C901
+    exposure: np.ndarray,
+    price: np.ndarray,
+    stop_pct: float,
+    *,
+    cooloff_bars: int = 0,
+    reentry: ReentryPolicy = "next_signal",
+) -> tuple[np.ndarray, StopEvents]:
+    """(T,) ya da (T, S) exposure/fiyat için stop uygulanmış exposure ve olay kaydı.
+
+    ``stop_pct`` yüzde cinsindendir (5.0 -> %5). NaN fiyatlar sütun içinde ileri doldurulur.
+    """
+    if reentry not in ("next_signal", "cooloff"):
+        raise ValueError(f"unknown reentry policy: {reentry!r}")
+    exp = np.asarray(exposure, dtype=np.float64)
+    one_d = exp.ndim == 1
+    exp2 = exp.reshape(exp.shape[0], -1)
+    px2 = pd.DataFrame(np.asarray(price, dtype=np.float64).reshape(exp2.shape)).ffill()
+    t_len, n_sym = exp2.shape
+    n = t_len * n_sym
+
+    x = np.nan_to_num(_flat(exp2), nan=0.0)
+    p = _flat(px2.to_numpy())
+    sign = np.sign(x)
+    col_start = np.zeros(n, dtype=bool)
+    if t_len:
+        col_start[::t_len] = True
+    bar = np.tile(np.arange(t_len), n_sym)
+
+    active = sign != 0
+    start = active.copy()
+    start[1:] &= col_start[1:] | (sign[1:] != sign[:-1])
+    # signed price: short'ta dip = (-fiyat)'ın tepesi
+    sp = np.where(sign < 0, -p, p)
+    thr = float(stop_pct) / 100.0
+    co = max(0, int(cooloff_bars))
+
+    ev_idx: list[np.ndarray] = []
+    ev_start: list[np.ndarray] = []
+    ev_re: list[np.ndarray] = []
+    ev_peak: list[np.ndarray] = []
+    ev_move: list[np.ndarray] = []
+    done = np.zeros(n, dtype=bool)  # kaydedilmiş tetikler
+
+    sp_inf = np.nan_to_num(sp, nan=-np.inf)
+    z = np.empty(n, dtype=np.complex128)
+    while True:
+        seg = np.cumsum(start)
+        # segmentli koşan tepe (tam; bkz. modül dokümanı)
+        z.real = seg
+        z.imag = np.where(active, sp_inf, -np.inf)  # 1j*-inf NaN üretir; parça parça yazılır
+        peak = np.maximum.accumulate(z).imag
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = sp / peak - 1.0  # short: fiyat/dip - 1
+            move = np.where(sign < 0, -ratio, ratio)  # ters yönlü hareket (<= 0)
+        trig = active & ~done & (move <= -thr)
+        hit = np.flatnonzero(trig)
+        if not hit.size:
+            break
+        _, first = np.unique(seg[hit], return_index=True)
+        hit = hit[first]
+        done[hit] = True
+
+        # segment sonları (aktif ve sonraki eleman bu segmentin devamı değil)
+        cont = np.zeros(n, dtype=bool)
+        cont[:-1] = active[1:] & ~start[1:]
+        ends = np.flatnonzero(active & ~cont)
+        starts = np.flatnonzero(start)
+        seg_end = ends[seg[hit] - 1]
+        seg_begin = starts[seg[hit] - 1]
+
+        off_from = hit + 1
+        if reentry == "cooloff":
+            re = off_from + co
+            can = re <= seg_end
+            off_to = np.where(can, re, seg_end + 1)  # [off_from, off_to) düz
+            re_bar = np.where(can, bar[np.minimum(re, n - 1)], -1)
+            start[re[can]] = True
+        else:
+            off_to = seg_end + 1
+            re_bar = np.full(hit.shape, -1)
+
+        diff = np.zeros(n + 1, dtype=np.int64)
+        np.add.at(diff, off_from, 1)
+        np.add.at(diff, off_to, -1)
+        off = np.cumsum(diff[:-1]) > 0
+        active &= ~off
+        start &= active
+
+        ev_idx.append(hit)
+        ev_start.append(bar[seg_begin])
+        ev_re.append(re_bar)
+        ev_peak.append(peak[hit])
+        ev_move.append(move[hit])
+
+    if ev_idx:
+        idx = np.concatenate(ev_idx)
+        order = np.argsort(idx, kind="stable")
+        idx = idx[order]
+        peak_v = np.concatenate(ev_peak)[order]
+        move_v = np.concatenate(ev_move)[order]
+        sgn = sign[idx]
+        events = StopEvents(
+            symbol=idx // max(t_len, 1),
+            entry_bar=np.concatenate(ev_start)[order],
+            stop_bar=bar[idx],
+            reentry_bar=np.concatenate(ev_re)[order],
+            extreme=np.where(sgn < 0, -peak_v, peak_v),
+            price=p[idx],
+            drawdown=move_v,
+        )
+    else:
+        events = StopEvents.empty()
+
+    adj = np.where(active, x, 0.0).reshape(n_sym, t_len).T
+    # orijinal NaN exposure'lar korunmaz: stop katmanı 0 döner
+    return (adj[:, 0].copy() if one_d else adj), events
+
+
+__all__ = ["ReentryPolicy", "StopEvents", "segmented_stops"]
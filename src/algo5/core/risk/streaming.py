@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from math import sqrt
+
+import numpy as np
+
+from algo5.engine.risk.ewm import EwmVar
+
+from .config import RiskConfig
+
+
+class StreamingRiskEngine:
+    """``RiskEngine``'in tick başına O(1) güncellenen durumlu versiyonu.
+
+    Her bar için ``size_positions`` ve ``apply_stops``'un o bardaki değerlerini verir:
+
+    - EWMA varyans (``ewm(span, adjust=False).std(bias=False)`` ile birebir) -> vol-target ölçeği
+    - fiyatın koşan tepesi -> stop-loss çarpanı (0/1)
+
+    ``n_symbols=None`` tek seri modudur (skaler girdi/çıktı); aksi halde sembol vektörü.
+    """
+
+    def __init__(self, cfg: RiskConfig | None = None, n_symbols: int | None = None) -> None:
+        self.cfg = cfg or RiskConfig()
+        self._scalar = n_symbols is None
+        n = 1 if n_symbols is None else int(n_symbols)
+        self._ewm = EwmVar(max(2, int(self.cfg.vol_lookback)), n)
+        self._var = np.full(n, np.nan)
+        self.scale = np.ones(n)
+        self.last_price = np.full(n, np.nan)
+        self.peak = np.full(n, np.nan)
+        self.stop_adj = np.ones(n)
+        self.n_bars = 0
+        self.stop_bars = 0  # stop'un aktif olduğu (sembol, bar) sayısı
+
+    @property
+    def vol_targeting(self) -> bool:
+        t = self.cfg.vol_target_pct
+        return bool(self.cfg.enabled and t and t > 0)
+
+    @property
+    def stops_enabled(self) -> bool:
+        sl = self.cfg.stop_loss_pct
+        return bool(self.cfg.enabled and sl and sl > 0)
+
+    def _out(self, x: np.ndarray) -> float | np.ndarray:
+        return float(x[0]) if self._scalar else x.copy()
+
+    # ---------- updates ----------
+    def on_return(self, ret: float | np.ndarray) -> float | np.ndarray:
+        """Bir getiri ekler (NaN -> 0); güncel vol-target ölçeğini döner."""
+        r = np.nan_to_num(np.asarray(ret, dtype=np.float64).reshape(-1), nan=0.0)
+        self._ewm.update(r, out=self._var)
+        self.n_bars += 1
+        if self.vol_targeting:
+            ann_vol = np.sqrt(np.maximum(self._var, 0.0)) * sqrt(float(self.cfg.ann_factor))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                s = (float(self.cfg.vol_target_pct) / 100.0) / ann_vol
+            s[~np.isfinite(s)] = 1.0  # ann_vol 0/NaN -> 1
+            np.minimum(s, 1.0, out=self.scale)
+        return self._out(self.scale)
+
+    def on_price(self, price: float | np.ndarray) -> tuple[float | np.ndarray, float | np.ndarray]:
+        """Fiyat ekler: getiriyi (pct_change) vol'e, fiyatı stop durumuna işler.
+
+        ``(vol-target ölçeği, stop çarpanı)`` döner.
+        """
+        px = np.asarray(price, dtype=np.float64).reshape(-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ret = px / self.last_price - 1.0
+        ret[~np.isfinite(ret)] = 0.0
+        self.last_price = px.copy()
+        self.on_return(ret)
+
+        if self.stops_enabled:
+            np.fmax(self.peak, px, out=self.peak)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                dd = px / self.peak - 1.0
+            stopped = dd <= -float(self.cfg.stop_loss_pct) / 100.0  # type: ignore[operator]
+            self.stop_adj = np.where(stopped, 0.0, 1.0)
+            self.stop_bars += int(stopped.sum())
+        return self._out(self.scale), self._out(self.stop_adj)
+
+    # ---------- outputs ----------
+    def weight(self, signal: float | np.ndarray = 1.0) -> float | np.ndarray:
+        """``size_positions``'ın bu bardaki değeri: clip(signal) * ölçek."""
+        w = np.nan_to_num(np.asarray(signal, dtype=np.float64).reshape(-1), nan=0.0)
+        w = np.clip(w, 0.0, 1.0)
+        if self.cfg.enabled:
+            w = np.clip(w * self.scale, 0.0, 1.0)
+        return self._out(w)
+
+    def multiplier(self) -> float | np.ndarray:
+        """Emir miktarı çarpanı: vol-target ölçeği x stop çarpanı."""
+        m = self.scale if self.cfg.enabled else np.ones_like(self.scale)
+        return self._out(m * self.stop_adj)
+
+
+__all__ = ["StreamingRiskEngine"]
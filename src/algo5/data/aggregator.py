@@ -0,0 +1,271 @@
+"""Online (artımlı) çoklu zaman dilimli bar üretimi.
+
+``BarAggregator`` tick'leri ya da ince barları (ör. 1m kline) tüketir ve her sembol için
+birkaç zaman dilimini (ör. ``5min``, ``1h``, ``1D``) aynı anda tutar. Durum NumPy
+dizilerindedir (satır = sembol, kolon = zaman dilimi). Sembol başına en yakın kova sınırı
+saklanır: sınır geçilmedikçe güncelleme yerinde max/min/son/toplamdır, geçildiğinde tüm
+zaman dilimleri tek vektörel adımda işlenir. Güncelleme maliyeti O(1)'dir; tamamlanan
+barlar ``Tick(timeframe=...)`` olarak ince dilimden kaba dilime sırayla yayınlanır.
+
+Kovalar ``resample_ohlc`` (``df.resample(rule)``) ile aynıdır: sol kapalı, sol etiketli,
+başlangıç (origin) sembolün ilk ts'sinin gün başı. Boş kovalar üretilmez (``.dropna()``
+karşılığı); açık barlar ``flush()`` ya da saat ilerledikçe ``advance(ts)`` ile kapanır.
+Sabit genişlikli kovalar epoch ns üzerinde hesaplanır: UTC/naive indeksler için birebir,
+DST'li yerel saat dilimlerinde gün sınırları UTC'ye göre kayabilir.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from algo5.core.bus import EventBus
+from algo5.core.events import Tick, TickBatch
+
+_DAY = 86_400 * 10**9
+_NONE = np.iinfo(np.int64).min
+
+
+class BarAggregator:
+    """Sembol başına OHLCV durumu; ``update`` tamamlanan barları döner (ve yayınlar).
+
+    ``source`` yalnız ``Tick.timeframe == source`` olan olayların tüketilmesini sağlar
+    (varsayılan ham tick/bar: ``None``); üretilen barlar bu yüzden tekrar tüketilmez.
+    Bir semboldeki geriye giden ts'ler düşürülür ve ``late`` içinde sayılır.
+    """
+
+    def __init__(
+        self,
+        timeframes: Sequence[str | pd.Timedelta] = ("5min",),
+        *,
+        bus: EventBus | None = None,
+        source: str | None = None,
+        capacity: int = 8,
+    ) -> None:
+        tfs = sorted((pd.Timedelta(t).value, str(t)) for t in timeframes)
+        if not tfs or tfs[0][0] <= 0 or len({f for f, _ in tfs}) != len(tfs):
+            raise ValueError("timeframes must be positive and distinct")
+        if source in {lbl for _, lbl in tfs}:
+            raise ValueError("source timeframe cannot be re-aggregated into itself")
+        self.labels = tuple(lbl for _, lbl in tfs)
+        self._freq = np.array([f for f, _ in tfs], dtype=np.int64)
+        self.bus = bus
+        self.source = source
+        self.tz: Any = None
+        self.exchange = "NYSE"
+        self.late = 0
+        self.symbols: dict[str, int] = {}
+        self._names: list[str] = []
+        # sembol başına skalerler (sıcak yolda Python int karşılaştırması)
+        self._origin: list[int] = []
+        self._last: list[int] = []
+        self._next: list[int] = []  # açık kovaların en yakın bitişi; ts >= ise kova değişir
+        self._open_nan: list[bool] = []  # açılış NaN geldi: ilk geçerli değer beklenir
+        k, cap = len(tfs), int(capacity)
+        self._bucket = np.full((cap, k), _NONE, dtype=np.int64)  # _NONE: açık bar yok
+        self._o = np.full((cap, k), np.nan)
+        self._h = np.full((cap, k), np.nan)
+        self._l = np.full((cap, k), np.nan)
+        self._c = np.full((cap, k), np.nan)
+        self._v = np.zeros((cap, k))
+
+    # ---------- state ----------
+    def _row(self, symbol: str, ts: int) -> int:
+        j = self.symbols.get(symbol)
+        if j is not None:
+            return j
+        j = len(self._names)
+        if j == self._bucket.shape[0]:
+            self._grow()
+        self.symbols[symbol] = j
+        self._names.append(symbol)
+        self._origin.append(ts - ts % _DAY)  # resample origin="start_day"
+        self._last.append(_NONE)
+        self._next.append(_NONE)
+        self._open_nan.append(False)
+        return j
+
+    def _grow(self) -> None:
+        def pad(a: np.ndarray, fill: Any) -> np.ndarray:
+            return np.concatenate([a, np.full_like(a, fill)])
+
+        self._bucket = pad(self._bucket, _NONE)
+        self._o, self._h = pad(self._o, np.nan), pad(self._h, np.nan)
+        self._l, self._c = pad(self._l, np.nan), pad(self._c, np.nan)
+        self._v = pad(self._v, 0.0)
+
+    def _bar(self, j: int, i: int) -> Tick | None:
+        o, h, lo, c = self._o[j, i], self._h[j, i], self._l[j, i], self._c[j, i]
+        if np.isnan(o) or np.isnan(h) or np.isnan(lo) or np.isnan(c):
+            return None  # resample_ohlc(...).dropna() karşılığı
+        start = int(self._origin[j] + self._bucket[j, i] * self._freq[i])
+        ts = pd.Timestamp(start, tz="UTC")
+        ts = ts.tz_localize(None) if self.tz is None else ts.tz_convert(self.tz)
+        return Tick(
+            ts,
+            self._names[j],
+            float(o),
+            float(h),
+            float(lo),
+            float(c),
+            float(self._v[j, i]),
+            self.exchange,
+            self.labels[i],
+        )
+
+    def _close(self, j: int, cols: np.ndarray) -> list[Tick]:
+        out = [bar for i in cols if (bar := self._bar(j, int(i))) is not None]
+        self._bucket[j, cols] = _NONE  # sonraki güncelleme yeni bar açar
+        self._next[j] = _NONE
+        return out
+
+    def _roll(self, j: int, ts: int) -> list[Tick]:
+        """``ts`` en az bir kovanın sınırını geçti: bitenleri kapatır, yenilerini açar."""
+        b = (ts - self._origin[j]) // self._freq
+        cur = self._bucket[j]
+        new = b != cur
+        done = self._close(j, np.flatnonzero(new & (cur != _NONE)))
+        cur[new] = b[new]
+        self._o[j, new] = self._h[j, new] = self._l[j, new] = self._c[j, new] = np.nan
+        self._v[j, new] = 0.0
+        self._open_nan[j] = True
+        self._next[j] = int((self._origin[j] + (b + 1) * self._freq).min())
+        return done
+
+    # ---------- update ----------
+    def update(
+        self,
+        symbol: str,
+        ts: pd.Timestamp | int,
+        o: float,
+        h: float,
+        low: float,
+        c: float,
+        v: float = 0.0,
+    ) -> list[Tick]:
+        """Bir tick/bar ekler; bu güncellemeyle tamamlanan barları döner."""
+        if isinstance(ts, pd.Timestamp):
+            if not self.symbols:
+                self.tz = ts.tz
+            ts = ts.as_unit("ns").value
+        done = self._update_ns(symbol, int(ts), o, h, low, c, v)
+        self._emit(done, self.bus)
+        return done
+
+    def _update_ns(
+        self, symbol: str, ts: int, o: float, h: float, low: float, c: float, v: float
+    ) -> list[Tick]:
+        j = self._row(symbol, ts)
+        if ts < self._last[j]:
+            self.late += 1
+            return []
+        self._last[j] = ts
+        done = self._roll(j, ts) if ts >= self._next[j] else []
+
+        # first/max/min/last/sum; NaN atlanır (pandas gruplama ile aynı)
+        if self._open_nan[j]:
+            oj = self._o[j]
+            oj[np.isnan(oj)] = o
+            self._open_nan[j] = o != o
+        hj, lj = self._h[j], self._l[j]
+        np.fmax(hj, h, out=hj)
+        np.fmin(lj, low, out=lj)
+        if c == c:
+            self._c[j] = c
+        if v == v:
+            self._v[j] += v
+        return done
+
+    def advance(self, ts: pd.Timestamp | int) -> list[Tick]:
+        """Saat ``ts``'e geldi: bitişi ``ts``'i geçmiş tüm açık barları kapatır."""
+        if isinstance(ts, pd.Timestamp):
+            ts = ts.as_unit("ns").value
+        ts = int(ts)
+        done: list[Tick] = []
+        for j in range(len(self._names)):
+            self._last[j] = max(self._last[j], ts)  # ts öncesi artık geç veri
+            if ts < self._next[j]:
+                continue
+            cur = self._bucket[j]
+            due = (cur != _NONE) & (self._origin[j] + (cur + 1) * self._freq <= ts)
+            # _close, _next'i sıfırlar: sonraki güncelleme _roll ile kapanan dilimleri yeniden
+            # açar (hâlâ açık kaba dilimlerin kovası değişmediği için dokunulmaz)
+            done += self._close(j, np.flatnonzero(due))
+        self._emit(done, self.bus)
+        return done
+
+    def flush(self) -> list[Tick]:
+        """Tüm açık (yarım) barları kapatır; veri sonunda ``resample_ohlc`` ile eşitler."""
+        done: list[Tick] = []
+        for j in range(len(self._names)):
+            done += self._close(j, np.flatnonzero(self._bucket[j] != _NONE))
+        self._emit(done, self.bus)
+        return done
+
+    # ---------- bus ----------
+    @staticmethod
+    def _emit(bars: list[Tick], bus: EventBus | None) -> None:
+        if bus is not None and bars:
+            bus.publish_many(bars)
+
+    def attach(self, bus: EventBus) -> BarAggregator:
+        self.bus = bus
+        bus.subscribe(Tick, self.on_tick)
+        bus.subscribe(TickBatch, self.on_tick_batch)
+        return self
+
+    def on_tick(self, tick: Tick, bus: EventBus) -> None:
+        if tick.timeframe != self.source:
+            return
+        if not self.symbols:
+            self.tz, self.exchange = tick.ts.tz, tick.exchange
+        done = self._update_ns(
+            tick.symbol, tick.ts.as_unit("ns").value, tick.o, tick.h, tick.low, tick.c, tick.v
+        )
+        self._emit(done, bus)
+
+    def on_tick_batch(self, batch: TickBatch, bus: EventBus) -> None:
+        if self.source is not None:
+            return
+        if not self.symbols:
+            self.tz, self.exchange = batch.tz, batch.exchange
+        ts, sym, o, h, low, c, v = batch.columns()
+        names = batch.symbols
+        done: list[Tick] = []
+        for i in range(len(ts)):
+            done += self._update_ns(names[sym[i]], ts[i], o[i], h[i], low[i], c[i], v[i])
+        self._emit(done, bus)
+
+
+def aggregate_frame(
+    df: pd.DataFrame, timeframes: Sequence[str], symbol: str = "X"
+) -> dict[str, pd.DataFrame]:
+    """Bir OHLCV DataFrame'ini aggregator'dan geçirir; zaman dilimi başına
+    ``resample_ohlc`` biçiminde (küçük harfli kolonlar) sonuç döner."""
+    agg = BarAggregator(timeframes)
+    batch = TickBatch.from_frame(df, symbol)
+    agg.tz = batch.tz
+    ts, _, o, h, low, c, v = batch.columns()
+    bars: list[Tick] = []
+    for i in range(len(ts)):
+        bars += agg._update_ns(symbol, ts[i], o[i], h[i], low[i], c[i], v[i])
+    bars += agg.flush()
+    out = {}
+    for label in agg.labels:
+        rows = [b for b in bars if b.timeframe == label]
+        idx = pd.DatetimeIndex([b.ts for b in rows]).as_unit(df.index.unit)
+        data = {
+            "open": [b.o for b in rows],
+            "high": [b.h for b in rows],
+            "low": [b.low for b in rows],
+            "close": [b.c for b in rows],
+            "volume": [b.v for b in rows],
+        }
+        out[label] = pd.DataFrame(data, index=idx).sort_index()
+    return out
+
+
+__all__ = ["BarAggregator", "aggregate_frame"]
@@ -1,11 +1,31 @@
+"""İki katmanlı cache: süreç içi LRU (bayt bütçesi + TTL) ve disk katmanı.
+
+Disk düzeni ``<root>/<namespace>/<key>.<ext>``: JSON değerler ``.json``, ``np.ndarray``
+``.npy``, DataFrame/Series ``.npz`` (pickle'sız kolonlar). Disk katmanı isteğe bağlı bir
+boyut sınırına sahiptir; aşılınca en uzun süredir erişilmeyen dosyalar silinir (erişim
+zamanı her okumada ``os.utime`` ile açıkça yazılır, ``noatime`` bağlamalarında da çalışır).
+TTL yazma zamanından (dosya mtime) itibaren iki katmanda da geçerlidir.
+"""
+
+import contextlib
 import json
 import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+from .store import frame_from_arrays, frame_to_arrays
+
 DEFAULT_CACHE_ROOT = Path(os.getenv("ALGO5_CACHE_ROOT", ".cache/features"))
 DEFAULT_CACHE_ROOT.mkdir(parents=True, exist_ok=True)
 
+SUFFIXES = (".json", ".npy", ".npz")
+
 
 def set_cache_root(path: str | os.PathLike[str]):
     global DEFAULT_CACHE_ROOT
@@ -18,24 +38,225 @@ def _ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
 
+def _nbytes(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    return len(json.dumps(value))
+
+
+@dataclass
+class CacheStats:
+    mem_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    mem_evictions: int = 0
+    disk_evictions: int = 0
+    expired: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.mem_hits + self.disk_hits
+
+    def as_dict(self) -> dict[str, int]:
+        return {**asdict(self), "hits": self.hits}
+
+
 class SmartCache:
-    def __init__(self, root: Path | None = None):
+    """``get``/``set`` önce bellekteki LRU'ya, sonra diske bakar.
+
+    Bellekten dönen nesne cache ile paylaşılır; yerinde değiştirilmemelidir.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        mem_max_bytes: int = 256 * 1024 * 1024,
+        disk_max_bytes: int | None = None,
+        ttl: float | None = None,
+    ):
         self.root = Path(root) if root else DEFAULT_CACHE_ROOT
         _ensure_dir(self.root)
+        self.mem_max_bytes = int(mem_max_bytes)
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        # (namespace, key) -> (değer, bayt, yazma zamanı)
+        self._mem: OrderedDict[tuple[str, str], tuple[Any, int, float]] = OrderedDict()
+        self._mem_bytes = 0
+        self._disk_bytes: int | None = None  # ilk ihtiyaçta taranır
 
     def _ns_dir(self, namespace: str) -> Path:
         d = self.root / namespace
         _ensure_dir(d)
         return d
 
-    def _key_path(self, namespace: str, key: str) -> Path:
-        return self._ns_dir(namespace) / f"{key}.json"
+    def _key_path(self, namespace: str, key: str, suffix: str = ".json") -> Path:
+        return self._ns_dir(namespace) / f"{key}{suffix}"
+
+    def _find(self, namespace: str, key: str) -> Path | None:
+        for suffix in SUFFIXES:
+            p = self.root / namespace / f"{key}{suffix}"
+            if p.exists():
+                return p
+        return None
+
+    # ---------- memory tier ----------
+    def _mem_put(self, mk: tuple[str, str], value: Any, written: float) -> None:
+        self._mem_drop(mk)
+        size = _nbytes(value)
+        if size > self.mem_max_bytes:
+            return
+        self._mem[mk] = (value, size, written)
+        self._mem_bytes += size
+        while self._mem_bytes > self.mem_max_bytes:
+            _, (_, s, _) = self._mem.popitem(last=False)
+            self._mem_bytes -= s
+            self.stats.mem_evictions += 1
+
+    def _mem_drop(self, mk: tuple[str, str]) -> None:
+        old = self._mem.pop(mk, None)
+        if old is not None:
+            self._mem_bytes -= old[1]
 
+    def _expired(self, written: float) -> bool:
+        return self.ttl is not None and time.time() - written > self.ttl
+
+    # ---------- disk tier ----------
+    def _write(self, namespace: str, key: str, value: Any) -> Path:
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            suffix = ".npy"
+        elif isinstance(value, pd.DataFrame | pd.Series):
+            suffix = ".npz"
+        else:
+            suffix = ".json"
+        # kodlama dosya açılmadan: desteklenmeyen değer geride .tmp bırakmaz
+        if suffix == ".npz":
+            payload: Any = frame_to_arrays(value)
+        elif suffix == ".json":
+            payload = json.dumps(value).encode("utf-8")
+        p = self._key_path(namespace, key, suffix)
+        tmp = p.with_name(p.name + ".tmp")
+        with tmp.open("wb") as f:
+            if suffix == ".npy":
+                np.save(f, value)
+            elif suffix == ".npz":
+                np.savez(f, **payload)
+            else:
+                f.write(payload)
+        old = self._find(namespace, key)
+        if old is not None and old != p:
+            self._unlink(old)
+        elif old is not None and self._disk_bytes is not None:
+            self._disk_bytes -= old.stat().st_size
+        os.replace(tmp, p)
+        if self._disk_bytes is not None:
+            self._disk_bytes += p.stat().st_size
+        return p
+
+    @staticmethod
+    def _read(p: Path) -> Any:
+        if p.suffix == ".npy":
+            return np.load(p, allow_pickle=False)
+        if p.suffix == ".npz":
+            with np.load(p, allow_pickle=False) as z:
+                return frame_from_arrays(z)
+        return json.loads(p.read_text(encoding="utf-8"))
+
+    def _unlink(self, p: Path) -> None:
+        try:
+            size = p.stat().st_size
+            p.unlink()
+        except FileNotFoundError:
+            return
+        if self._disk_bytes is not None:
+            self._disk_bytes -= size
+
+    def _files(self) -> list[tuple[Path, os.stat_result]]:
+        out = []
+        for p in self.root.glob("*/*"):
+            if p.suffix in SUFFIXES:
+                with contextlib.suppress(FileNotFoundError):  # eşzamanlı silinmiş olabilir
+                    out.append((p, p.stat()))
+        return out
+
+    def disk_usage(self) -> int:
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(st.st_size for _, st in self._files())
+        return self._disk_bytes
+
+    def _enforce_disk_cap(self, keep: Path) -> None:
+        if self.disk_max_bytes is None or self.disk_usage() <= self.disk_max_bytes:
+            return
+        files = sorted(self._files(), key=lambda f: f[1].st_atime)  # en eski erişim önce
+        self._disk_bytes = sum(st.st_size for _, st in files)
+        for p, _ in files:
+            if self._disk_bytes <= self.disk_max_bytes:
+                break
+            if p == keep:
+                continue
+            self._unlink(p)
+            self._mem_drop((p.parent.name, p.stem))
+            self.stats.disk_evictions += 1
+
+    # ---------- public ----------
     def set(self, namespace: str, key: str, value: Any):
-        p = self._key_path(namespace, key)
-        p.write_text(json.dumps(value), encoding="utf-8")
+        p = self._write(namespace, key, value)
+        self._mem_put((namespace, key), value, p.stat().st_mtime)
+        self._enforce_disk_cap(keep=p)
         return p
 
     def get(self, namespace: str, key: str) -> Any | None:
-        p = self._key_path(namespace, key)
-        return json.loads(p.read_text(encoding="utf-8")) if p.exists() else None
+        mk = (namespace, key)
+        hit = self._mem.get(mk)
+        if hit is not None:
+            if not self._expired(hit[2]):
+                self._mem.move_to_end(mk)
+                self.stats.mem_hits += 1
+                return hit[0]
+            self._mem_drop(mk)
+
+        p = self._find(namespace, key)
+        if p is None:
+            self.stats.misses += 1
+            return None
+        st = p.stat()
+        if self._expired(st.st_mtime):
+            self.delete(namespace, key)
+            self.stats.expired += 1
+            self.stats.misses += 1
+            return None
+        value = self._read(p)
+        os.utime(p, (time.time(), st.st_mtime))  # LRU için erişim zamanı; mtime = yazma
+        self._mem_put(mk, value, st.st_mtime)
+        self.stats.disk_hits += 1
+        return value
+
+    def exists(self, namespace: str, key: str) -> bool:
+        """İstatistikleri etkilemeden anahtar var mı (TTL'e bakılmaz)."""
+        return (namespace, key) in self._mem or self._find(namespace, key) is not None
+
+    def delete(self, namespace: str, key: str) -> bool:
+        self._mem_drop((namespace, key))
+        p = self._find(namespace, key)
+        if p is None:
+            return False
+        self._unlink(p)
+        return True
+
+    def keys(self, namespace: str) -> list[str]:
+        d = self.root / namespace
+        if not d.exists():
+            return []
+        return sorted(p.stem for p in d.iterdir() if p.suffix in SUFFIXES)
+
+    def clear_memory(self) -> None:
+        self._mem.clear()
+        self._mem_bytes = 0
+
+
+__all__ = ["CacheStats", "SmartCache", "set_cache_root"]
@@ -14,4 +14,5 @@ def list_items(namespace: str) -> list[str]:
     root = _cache.DEFAULT_CACHE_ROOT / namespace
     if not root.exists():
         return []
-    return sorted([p.stem for p in root.iterdir() if p.suffix in {".json", ".parquet", ".csv"}])
+    suffixes = {*_cache.SUFFIXES, ".parquet", ".csv"}
+    return sorted([p.stem for p in root.iterdir() if p.suffix in suffixes])
@@ -0,0 +1,316 @@
+"""İçerik adresli memoization: aynı veri + aynı fonksiyon sürümü + aynı parametre -> cache.
+
+Anahtar = sha256(girdi parmak izleri, normalize parametreler); DataFrame/Series için
+``df_checksum`` (+ kolon adları/dtype'ları), Index/dizi için içerik özeti, çağrılabilir
+argümanlar için kimlik + kaynak + varsayılanlar + closure değerleri kullanılır. Parmak izi
+çıkarılamayan (``repr``'ına güvenilemeyen) tiplerde çağrı cache'siz yapılır.
+
+Sonuçlar ``SmartCache``'e yazılır: DataFrame/Series/ndarray yaprakları ayrı binary girdiler
+(``<key>.<i>``), iskelet JSON en son ``<key>`` olarak yazılır (iskeleti olan sonuç tamdır).
+
+Namespace ``memo.<modül>.<fonksiyon>``, anahtar ``<sürüm>-<özet>``: fonksiyon sürümü
+değişince eski sürümün girdileri o süreçteki ilk çağrıda silinir. Aynı anahtarı hesaplayan
+süreçler ``<key>.lock`` (O_EXCL) üzerinden tek üreticiyi bekler.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import enum
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import re
+import time
+import warnings
+from collections.abc import Callable
+from pathlib import PurePath
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ..integrity import df_checksum
+from .cache import SmartCache
+
+_LEAF = (pd.DataFrame, pd.Series, np.ndarray)
+
+
+def _safe(s: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", s)
+
+
+def code_version(fn: Callable[..., Any]) -> str:
+    """Fonksiyon kaynağının (yoksa bytecode'unun) kısa özeti."""
+    fn = inspect.unwrap(fn)
+    try:
+        src = inspect.getsource(fn).encode("utf-8")
+    except (OSError, TypeError):
+        code = getattr(fn, "__code__", None)
+        src = code.co_code if code is not None else repr(fn).encode("utf-8")
+    return hashlib.sha256(src).hexdigest()[:12]
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _fn_fingerprint(fn: Any, stack: tuple[int, ...]) -> Any:
+    """Kod + varsayılanlar + closure hücreleri; ``partial``/bound method durumu dahil."""
+    if isinstance(fn, functools.partial):
+        return {
+            "partial": _fp(fn.func, stack),
+            "args": _fp(fn.args, stack),
+            "kw": _fp(fn.keywords, stack),
+        }
+    name = f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
+    out: dict[str, Any] = {"fn": name, "code": code_version(fn)}
+    if inspect.ismethod(fn):
+        out["self"] = _fp(fn.__self__, stack)
+        fn = fn.__func__
+    raw = inspect.unwrap(fn)
+    if id(raw) in stack:  # özyinelemeli closure: kimlik yeterli
+        return out
+    stack = (*stack, id(raw))
+    if getattr(raw, "__defaults__", None):
+        out["defaults"] = _fp(raw.__defaults__, stack)
+    if getattr(raw, "__kwdefaults__", None):
+        out["kwdefaults"] = _fp(raw.__kwdefaults__, stack)
+    cells = getattr(raw, "__closure__", None) or ()
+    if cells:
+        vals = []
+        for cell in cells:
+            try:
+                vals.append(_fp(cell.cell_contents, stack))
+            except ValueError:  # henüz atanmamış hücre
+                vals.append({"cell": "empty"})
+        out["closure"] = vals
+    return out
+
+
+def _fp(obj: Any, stack: tuple[int, ...]) -> Any:  # noqa: C901
+    if isinstance(obj, pd.DataFrame | pd.Series):
+        frame = obj.to_frame() if isinstance(obj, pd.Series) else obj
+        meta = [str(c) for c in frame.columns] + [str(t) for t in frame.dtypes]
+        return {"df": df_checksum(frame), "meta": meta, "series": isinstance(obj, pd.Series)}
+    if isinstance(obj, pd.Index):
+        h = pd.util.hash_pandas_object(obj).to_numpy()
+        return {"index": _sha(h.tobytes()), "dtype": str(obj.dtype), "names": _fp(obj.names, stack)}
+    if isinstance(obj, np.ndarray):
+        data = pd.util.hash_array(obj.ravel()) if obj.dtype == object else obj
+        h = _sha(np.ascontiguousarray(data).tobytes())
+        return {"nd": h, "dtype": str(obj.dtype), "shape": list(obj.shape)}
+    if isinstance(obj, dict):
+        return {"dict": sorted([repr(k), _fp(v, stack)] for k, v in obj.items())}
+    if isinstance(obj, list | tuple):
+        return {type(obj).__name__: [_fp(v, stack) for v in obj]}
+    if isinstance(obj, set | frozenset):
+        return {"set": sorted(json.dumps(_fp(v, stack), sort_keys=True) for v in obj)}
+    if isinstance(obj, np.generic):
+        return _fp(obj.item(), stack)
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return {"float": repr(obj)}
+    if obj is None or isinstance(obj, bool | int | float | str):
+        return obj
+    if isinstance(obj, bytes):
+        return {"bytes": _sha(obj)}
+    if isinstance(obj, enum.Enum):
+        return {"enum": f"{type(obj).__module__}.{type(obj).__qualname__}.{obj.name}"}
+    if isinstance(obj, pd.Timedelta | dt.timedelta):
+        return {"td": pd.Timedelta(obj).value}
+    if isinstance(obj, dt.datetime | dt.date | dt.time):
+        return {type(obj).__name__: obj.isoformat(), "tz": str(getattr(obj, "tzinfo", None))}
+    if isinstance(obj, PurePath):
+        return {"path": str(obj)}
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        fields = {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        return {"dc": f"{type(obj).__module__}.{type(obj).__qualname__}", "f": _fp(fields, stack)}
+    if callable(obj):
+        return _fn_fingerprint(obj, stack)
+    # repr durumu gizleyebilir (kısaltılmış pandas/numpy çıktısı): güvenli anahtar yok
+    raise TypeError(f"cannot fingerprint {type(obj).__module__}.{type(obj).__qualname__}")
+
+
+def fingerprint(obj: Any) -> Any:
+    """Değeri JSON'a dökülebilir, kararlı bir parmak izine çevirir.
+
+    Bilinmeyen tipler için ``TypeError`` (``Memo`` bu durumda cache'lemeden çalıştırır).
+    """
+    return _fp(obj, ())
+
+
+# ---------- sonuç iskeleti ----------
+def _pack(value: Any, leaves: list[Any]) -> Any:
+    if isinstance(value, _LEAF) and not (isinstance(value, np.ndarray) and value.dtype == object):
+        leaves.append(value)
+        return {"__leaf__": len(leaves) - 1}
+    if isinstance(value, dict):
+        return {"__dict__": [[_pack(k, leaves), _pack(v, leaves)] for k, v in value.items()]}
+    if isinstance(value, list | tuple):
+        return {f"__{type(value).__name__}__": [_pack(v, leaves) for v in value]}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return {"__ts__": value.isoformat()}
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    raise TypeError(f"unsupported result type: {type(value).__name__}")
+
+
+def _unpack(node: Any, leaves: list[Any]) -> Any:
+    if not isinstance(node, dict):
+        return node
+    if "__leaf__" in node:
+        return leaves[node["__leaf__"]]
+    if "__dict__" in node:
+        return {_unpack(k, leaves): _unpack(v, leaves) for k, v in node["__dict__"]}
+    if "__list__" in node:
+        return [_unpack(v, leaves) for v in node["__list__"]]
+    if "__tuple__" in node:
+        return tuple(_unpack(v, leaves) for v in node["__tuple__"])
+    return pd.Timestamp(node["__ts__"])
+
+
+_MISS = object()
+
+
+class Memo:
+    """``SmartCache`` üzerinde memoization servisi; ``memo(fn, version=...)`` dekoratördür."""
+
+    def __init__(
+        self,
+        cache: SmartCache | None = None,
+        *,
+        lock_timeout: float = 600.0,
+        stale_lock_after: float = 3600.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self._cache = cache
+        self.lock_timeout = lock_timeout
+        self.stale_lock_after = stale_lock_after
+        self.poll_interval = poll_interval
+        self._swept: set[tuple[str, str]] = set()
+
+    @property
+    def cache(self) -> SmartCache:
+        if self._cache is None:  # varsayılan kök çağrı anında çözülür (set_cache_root)
+            self._cache = SmartCache()
+        return self._cache
+
+    def __call__(
+        self,
+        fn: Callable[..., Any] | None = None,
+        *,
+        version: str | int | None = None,
+        namespace: str | None = None,
+    ) -> Any:
+        if fn is None:
+            return functools.partial(self, version=version, namespace=namespace)
+
+        sig = inspect.signature(fn)
+        ns = _safe(namespace or f"memo.{fn.__module__}.{fn.__qualname__}")
+        tag = _safe(str(version)) if version is not None else code_version(fn)
+
+        def cache_key(*args: Any, **kwargs: Any) -> str:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            payload = json.dumps(fingerprint(dict(bound.arguments)), sort_keys=True)
+            return f"{tag}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self._sweep(ns, tag)
+            try:
+                key = cache_key(*args, **kwargs)
+            except TypeError as exc:
+                warnings.warn(f"memo: {ns} called uncached ({exc})", stacklevel=2)
+                return fn(*args, **kwargs)
+            hit = self._load(ns, key)
+            if hit is not _MISS:
+                return hit
+            return self._single_flight(ns, key, lambda: fn(*args, **kwargs))
+
+        wrapper.cache_key = cache_key  # type: ignore[attr-defined]
+        wrapper.namespace = ns  # type: ignore[attr-defined]
+        wrapper.version = tag  # type: ignore[attr-defined]
+        wrapper.uncached = fn  # type: ignore[attr-defined]
+        return wrapper
+
+    # ---------- storage ----------
+    def _sweep(self, ns: str, tag: str) -> None:
+        """Başka sürümlere ait girdileri siler (süreç başına namespace/sürüm için bir kez)."""
+        if (ns, tag) in self._swept:
+            return
+        for key in self.cache.keys(ns):
+            if not key.startswith(f"{tag}-"):
+                self.cache.delete(ns, key)
+        self._swept.add((ns, tag))
+
+    def _load(self, ns: str, key: str) -> Any:
+        if not self.cache.exists(ns, key):
+            return _MISS
+        doc = self.cache.get(ns, key)
+        if not isinstance(doc, dict) or "memo" not in doc:
+            return _MISS  # TTL ile düşmüş / yabancı girdi
+        leaves = []
+        for i in range(doc["leaves"]):
+            leaf = self.cache.get(ns, f"{key}.{i}")
+            if leaf is None:
+                return _MISS  # yaprak disk sınırıyla atılmış: yeniden hesapla
+            leaves.append(leaf)
+        return _unpack(doc["memo"], leaves)
+
+    def _store(self, ns: str, key: str, value: Any) -> None:
+        leaves: list[Any] = []
+        try:
+            skeleton = _pack(value, leaves)
+            for i, leaf in enumerate(leaves):
+                self.cache.set(ns, f"{key}.{i}", leaf)
+        except TypeError as exc:  # iskelet yazılmadığı için yarım sonuç okunmaz
+            warnings.warn(f"memo: {ns} result not cached ({exc})", stacklevel=3)
+            return
+        self.cache.set(ns, key, {"memo": skeleton, "leaves": len(leaves)})  # en son: tamlık
+
+    # ---------- single-flight ----------
+    def _single_flight(self, ns: str, key: str, compute: Callable[[], Any]) -> Any:
+        lock = self.cache.root / ns / f"{key}.lock"
+        lock.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                hit = self._load(ns, key)
+                if hit is not _MISS:
+                    return hit
+                try:
+                    age = time.time() - lock.stat().st_mtime
+                except FileNotFoundError:
+                    continue  # üretici az önce bitirdi
+                if age > self.stale_lock_after:
+                    lock.unlink(missing_ok=True)  # ölmüş üretici
+                    continue
+                if time.monotonic() > deadline:
+                    return compute()  # beklemekten vazgeç; cache'e yazma
+                time.sleep(self.poll_interval)
+        try:
+            os.write(fd, str(os.getpid()).encode("ascii"))
+            hit = self._load(ns, key)  # kilit alınırken başkası bitirmiş olabilir
+            if hit is not _MISS:
+                return hit
+            value = compute()
+            self._store(ns, key, value)
+            return value
+        finally:
+            os.close(fd)
+            lock.unlink(missing_ok=True)
+
+
+memoize = Memo()
+
+__all__ = ["Memo", "code_version", "fingerprint", "memoize"]
@@ -1,14 +1,19 @@
 ﻿# mypy: disable-error-code=unreachable
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
+import contextlib
 import hashlib
 import json
+import os
 import pickle
 import re
+import shutil
 
+import numpy as np
 import pandas as pd
 
 # ---- module-level cache root (tests bunu kullanıyor) ----
@@ -33,6 +38,67 @@ def _safe_symbol(s: str) -> str:
     return re.sub(r"[^A-Za-z0-9_.-]+", "_", s)
 
 
+def _utc_index(idx: pd.Index) -> pd.DatetimeIndex:
+    di = pd.DatetimeIndex(idx)
+    return di.tz_localize("UTC") if di.tz is None else di.tz_convert("UTC")
+
+
+def _ns(idx: pd.DatetimeIndex) -> np.ndarray:
+    """UTC DatetimeIndex -> int64 epoch nanosaniye."""
+    return idx.as_unit("ns").asi8
+
+
+def _col_array(s: pd.Series) -> np.ndarray:
+    """Kolonu pickle'sız saklanabilir bir diziye çevirir.
+
+    Sayısal/bool aynen; eksik değerli bool/sayı karışımları float (NaN), diğerleri str ("" eksik).
+    """
+    if s.dtype.kind in "biuf":
+        return s.to_numpy()
+    try:
+        return pd.to_numeric(s).to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        return s.fillna("").astype(str).to_numpy(dtype=str)
+
+
+def _segment_checksum(ts: np.ndarray, cols: dict[str, np.ndarray]) -> str:
+    h = hashlib.sha256(ts.tobytes())
+    for name in sorted(cols):
+        h.update(name.encode("utf-8"))
+        h.update(str(cols[name].dtype).encode("ascii"))
+        h.update(np.ascontiguousarray(cols[name]).tobytes())
+    return h.hexdigest()
+
+
+def _legacy_present(a: np.ndarray) -> np.ndarray:
+    """Maskesiz (eski) segmentlerde birleşim boşluğu tahmini: NaN ya da ""."""
+    if a.dtype.kind == "f":
+        return ~np.isnan(a)
+    if a.dtype.kind == "U":
+        return a != ""
+    return np.ones(len(a), dtype=bool)
+
+
+def _segment_arrays(
+    ts: np.ndarray, cols: dict[str, np.ndarray], present: dict[str, np.ndarray]
+) -> dict[str, np.ndarray]:
+    """npz girdisi: ``__ts__``, ``c:<kolon>``; boşluğu olan kolonlar için ``m:<kolon>``.
+
+    ``__present__`` işareti segmentin maske kullandığını belirtir (``m:`` yoksa hepsi dolu).
+    """
+    out = {"__ts__": ts, "__present__": np.array(True)}
+    out.update({f"c:{c}": a for c, a in cols.items()})
+    out.update({f"m:{c}": m for c, m in present.items() if not m.all()})
+    return out
+
+
+def _atomic_npz(path: Path, arrays: dict[str, np.ndarray]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+
+
 @dataclass
 class FeatureStore:
     root: Path | None = None
@@ -49,21 +115,31 @@ class FeatureStore:
         self._tables_dir = self.root / "tables"  # OHLCV (CSV)
         self._tables_dir.mkdir(parents=True, exist_ok=True)
 
-        self._catalog_path = self.root / "catalog.pkl"
+        self._features_dir = self.root / "features"  # features (kolonlu, aylık segment)
+        self._manifests: dict[str, dict[str, dict[str, Any]]] = {}
+
+        self._catalog_path = self.root / "catalog.pkl"  # eski snapshot (salt okunur)
+        self._journal_path = self.root / "catalog.jsonl"  # append-only
         self._catalog: dict[str, str] = {}
         self._load_catalog()
 
     # ---------- internal ----------
     def _load_catalog(self) -> None:
+        self._catalog = {}
         if self._catalog_path.exists():
             with self._catalog_path.open("rb") as f:
                 self._catalog = pickle.load(f)
-        else:
-            self._catalog = {}
+        if self._journal_path.exists():
+            with self._journal_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        rec = json.loads(line)
+                        self._catalog[rec["key"]] = rec["checksum"]
 
-    def _save_catalog(self) -> None:
-        with self._catalog_path.open("wb") as f:
-            pickle.dump(self._catalog, f)
+    def _save_catalog(self, key: str) -> None:
+        # tüm katalog yerine tek satır: yazma O(1)
+        with self._journal_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"key": key, "checksum": self._catalog[key]}) + "\n")
 
     def _key(self, symbol: str, ts: pd.Timestamp) -> str:
         tsu = _ensure_utc(ts)
@@ -94,41 +170,436 @@ class FeatureStore:
                 sort_keys=True,
             )
         self._catalog[key] = checksum
-        self._save_catalog()
+        self._save_catalog(key)
         return checksum
 
     def read(self, symbol: str, ts: pd.Timestamp) -> dict[str, Any]:
         path = self._path_for(symbol, ts)
         if not path.exists():
-            raise FileNotFoundError(path.as_posix())
+            row = self._read_segment_row(symbol, _ensure_utc(ts))
+            if row is None:
+                raise FileNotFoundError(path.as_posix())
+            return row
         with path.open("r", encoding="utf-8") as f:
             doc = json.load(f)
         return dict(doc.get("features", {}))
 
+    # ---------- features (kolonlu segmentler) ----------
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self._features_dir / _safe_symbol(symbol)
+
+    def _manifest(self, symbol: str) -> dict[str, dict[str, Any]]:
+        """Bölüm (YYYY-MM) -> son kayıt (``manifest.jsonl`` append-only; son satır geçerli)."""
+        man = self._manifests.get(symbol)
+        if man is None:
+            man = {}
+            path = self._symbol_dir(symbol) / "manifest.jsonl"
+            if path.exists():
+                with path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            rec = json.loads(line)
+                            man[rec["part"]] = rec
+            self._manifests[symbol] = man
+        return man
+
+    def _load_segment(
+        self, symbol: str, rec: dict[str, Any], columns: list[str] | None = None
+    ) -> tuple[np.ndarray, dict[str, np.ndarray], dict[str, np.ndarray]]:
+        """(ts, kolonlar, doluluk maskeleri); yalnız istenen kolonlar okunur."""
+        path = self._symbol_dir(symbol) / rec["file"]
+        names = rec["columns"] if columns is None else [c for c in columns if c in rec["columns"]]
+        with np.load(path, allow_pickle=False) as z:
+            ts, cols = z["__ts__"], {c: z[f"c:{c}"] for c in names}
+            if "__present__" not in z.files:
+                return ts, cols, {c: _legacy_present(a) for c, a in cols.items()}
+            full = np.ones(len(ts), dtype=bool)
+            present = {c: z[f"m:{c}"] if f"m:{c}" in z.files else full for c in names}
+        return ts, cols, present
+
+    def upsert_many(self, symbol: str, df: pd.DataFrame) -> str:
+        """Zaman indeksli feature tablosunu aylık kolonlu segmentlere yazar.
+
+        Aynı ts'li satırlar değiştirilir (satır bazlı upsert). İçeriği değişmeyen segment
+        yeniden yazılmaz; girdinin checksum'ı döner (aynı girdi -> aynı checksum).
+        """
+        frame = df.copy()
+        frame.index = _utc_index(df.index)
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        ts = _ns(frame.index)
+        new_cols = {str(c): _col_array(frame[c]) for c in frame.columns}
+        checksum = _segment_checksum(ts, new_cols)
+        if not len(frame):
+            return checksum
+
+        sym_dir = self._symbol_dir(symbol)
+        sym_dir.mkdir(parents=True, exist_ok=True)
+        man = self._manifest(symbol)
+        months = frame.index.tz_localize(None).to_numpy().astype("datetime64[M]")
+        bounds = np.flatnonzero(months[1:] != months[:-1]) + 1
+        records: list[dict[str, Any]] = []
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(ts)], strict=True):
+            part = str(months[lo])
+            part_ts = ts[lo:hi]
+            part_cols = {c: a[lo:hi] for c, a in new_cols.items()}
+            present = {c: np.ones(hi - lo, dtype=bool) for c in part_cols}
+            prev = man.get(part)
+            if prev is not None:
+                part_ts, part_cols, present = self._merge_segment(symbol, prev, part_ts, part_cols)
+            arrays = _segment_arrays(part_ts, part_cols, present)
+            # boşluksuz segmentte maske yok: checksum maskesiz sürümle aynı kalır
+            masks = {k: a for k, a in arrays.items() if k.startswith("m:")}
+            seg_sum = _segment_checksum(part_ts, {**part_cols, **masks})
+            if prev is not None and prev["checksum"] == seg_sum:
+                continue  # idempotent
+            fname = f"{part}.npz"
+            _atomic_npz(sym_dir / fname, arrays)
+            rec = {
+                "part": part,
+                "file": fname,
+                "start": int(part_ts[0]),
+                "end": int(part_ts[-1]),
+                "rows": int(len(part_ts)),
+                "columns": list(part_cols),
+                "checksum": seg_sum,
+            }
+            man[part] = rec
+            records.append(rec)
+
+        if records:
+            with (sym_dir / "manifest.jsonl").open("a", encoding="utf-8") as f:
+                f.writelines(json.dumps(r) + "\n" for r in records)
+        return checksum
+
+    def _merge_segment(
+        self,
+        symbol: str,
+        prev: dict[str, Any],
+        ts: np.ndarray,
+        cols: dict[str, np.ndarray],
+    ) -> tuple[np.ndarray, dict[str, np.ndarray], dict[str, np.ndarray]]:
+        old_ts, old_cols, old_present = self._load_segment(symbol, prev)
+        keep = ~np.isin(old_ts, ts)
+        old = pd.DataFrame({c: a[keep] for c, a in old_cols.items()}, index=old_ts[keep])
+        new = pd.DataFrame(cols, index=ts)
+        merged = pd.concat([old, new])
+        # doluluk: satırı yazan upsert'te kolon var mıydı (değerden tahmin edilmez)
+        old_p = pd.DataFrame({c: m[keep] for c, m in old_present.items()}, index=old_ts[keep])
+        new_p = pd.DataFrame(True, index=ts, columns=list(cols))
+        filled = pd.concat([old_p, new_p]).reindex(columns=merged.columns).eq(True)
+        order = np.argsort(merged.index.to_numpy(dtype=np.int64), kind="stable")
+        merged, filled = merged.iloc[order], filled.iloc[order]
+        return (
+            merged.index.to_numpy(dtype=np.int64),
+            {str(c): _col_array(merged[c]) for c in merged.columns},
+            {str(c): filled[c].to_numpy(dtype=bool) for c in merged.columns},
+        )
+
+    def _read_segment_row(self, symbol: str, ts: pd.Timestamp) -> dict[str, Any] | None:
+        rec = self._manifest(symbol).get(ts.strftime("%Y-%m"))
+        if rec is None:
+            return None
+        seg_ts, cols, present = self._load_segment(symbol, rec)
+        t = ts.as_unit("ns").value
+        i = int(np.searchsorted(seg_ts, t))
+        if i >= len(seg_ts) or seg_ts[i] != t:
+            return None
+        return {c: a[i].item() for c, a in cols.items() if present[c][i]}  # boşluklar atlanır
+
+    def iter_range(
+        self,
+        symbol: str,
+        start: pd.Timestamp | str | None = None,
+        end: pd.Timestamp | str | None = None,
+        columns: list[str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """[start, end] aralığını segment (ay) başına bir DataFrame olarak verir."""
+        lo = _ensure_utc(pd.Timestamp(start)).as_unit("ns").value if start is not None else None
+        hi = _ensure_utc(pd.Timestamp(end)).as_unit("ns").value if end is not None else None
+        for part in sorted(self._manifest(symbol)):
+            rec = self._manifests[symbol][part]
+            if (lo is not None and rec["end"] < lo) or (hi is not None and rec["start"] > hi):
+                continue
+            ts, cols, _ = self._load_segment(symbol, rec, columns)
+            i = 0 if lo is None else int(np.searchsorted(ts, lo, side="left"))
+            j = len(ts) if hi is None else int(np.searchsorted(ts, hi, side="right"))
+            idx = pd.DatetimeIndex(ts[i:j].astype("datetime64[ns]")).tz_localize("UTC")
+            out = pd.DataFrame({c: a[i:j] for c, a in cols.items()}, index=idx.rename("ts"))
+            yield out if columns is None else out.reindex(columns=columns)
+
+    def read_range(
+        self,
+        symbol: str,
+        start: pd.Timestamp | str | None = None,
+        end: pd.Timestamp | str | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """[start, end] aralığındaki feature'lar; yalnız kesişen segmentler/kolonlar okunur."""
+        frames = list(self.iter_range(symbol, start, end, columns))
+        if frames:
+            return pd.concat(frames)
+        idx = pd.DatetimeIndex([], dtype="datetime64[ns, UTC]", name="ts")
+        return pd.DataFrame(columns=columns or [], index=idx)
+
     # ---------- tabular (DataFrame) ----------
+    # Varsayılan format "npy": kolon başına bir .npy + schema.json; okurken yalnız istenen
+    # kolonlar mmap'lenir ve sıralı int64 (ns) indeks üzerinde ikili arama ile dilimlenir.
+    # "csv" ithal/ihraç için korunur.
     def _table_dir(self, key: str) -> Path:
         return self._tables_dir / _safe_symbol(key)
 
     def _table_csv(self, key: str) -> Path:
         return self._table_dir(key) / "data.csv"
 
-    def save(self, key: str, df: pd.DataFrame, overwrite: bool = False) -> Path:
+    def _table_schema(self, key: str) -> Path:
+        return self._table_dir(key) / "schema.json"
+
+    def save(
+        self, key: str, df: pd.DataFrame, overwrite: bool = False, format: str = "npy"
+    ) -> Path:
+        if format not in ("npy", "csv"):
+            raise ValueError(f"unknown table format: {format!r}")
         td = self._table_dir(key)
-        td.mkdir(parents=True, exist_ok=True)
-        path = self._table_csv(key)
-        if path.exists() and not overwrite:
+        path = self._table_schema(key) if format == "npy" else self._table_csv(key)
+        if not overwrite and (self._table_schema(key).exists() or self._table_csv(key).exists()):
             raise FileExistsError(path.as_posix())
 
-        # CSV: bağımlılıksız; index’i yazarız, okurken parse ederiz
-        df.to_csv(path, index=True)
+        tmp = td.with_name(td.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        try:
+            if format == "csv":
+                # CSV: bağımlılıksız; index’i yazarız, okurken parse ederiz
+                df.to_csv(tmp / "data.csv", index=True)
+            else:
+                _write_npy_table(tmp, df)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        # eski formatın dosyaları kalmasın: dizin bütün olarak değiştirilir
+        old = td.with_name(td.name + ".old")
+        shutil.rmtree(old, ignore_errors=True)
+        if td.exists():
+            os.replace(td, old)
+        os.replace(tmp, td)
+        shutil.rmtree(old, ignore_errors=True)
         return path
 
-    def load(self, key: str) -> pd.DataFrame:
+    def load(
+        self,
+        key: str,
+        columns: list[str] | None = None,
+        start: pd.Timestamp | str | None = None,
+        end: pd.Timestamp | str | None = None,
+    ) -> pd.DataFrame:
+        schema = self._table_schema(key)
+        if schema.exists():
+            return _read_npy_table(schema.parent, columns, start, end)
         path = self._table_csv(key)
         if not path.exists():
             raise FileNotFoundError(path.as_posix())
         out = pd.read_csv(path, index_col=0, parse_dates=True)
+        if columns is not None:
+            out = out[columns]
+        if start is not None or end is not None:
+            out = out.loc[start:end]
+        return out
+
+
+# ---------- binary tablo formatı ----------
+_SCHEMA_VERSION = 1
+
+
+def _encode(values: Any) -> tuple[np.ndarray, dict[str, Any]]:
+    """Seri/indeks değerleri -> (.npy'ye yazılacak dizi, şema girdisi)."""
+    arr = pd.Series(values)
+    dtype = arr.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype) or dtype.kind == "M":
+        di = pd.DatetimeIndex(arr)
+        tz = None if di.tz is None else str(di.tz)
+        unit = di.unit
+        raw = (di.tz_convert("UTC") if tz else di).as_unit("ns").asi8
+        freq = values.freqstr if isinstance(values, pd.DatetimeIndex) else None
+        return raw, {"kind": "datetime", "tz": tz, "unit": unit, "freq": freq}
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) and dtype.kind in "biuf":
+        # nullable (boolean/Int64/Float64): değerler + ayrı NA maskesi
+        fill = False if dtype.kind == "b" else 0
+        raw = arr.to_numpy(dtype=dtype.numpy_dtype, na_value=fill)
+        return raw, {"kind": "masked", "dtype": str(dtype)}
+    if dtype.kind in "biuf":
+        raw, meta = arr.to_numpy(), {"kind": "numeric", "dtype": str(dtype)}
+    else:
+        raw, meta = arr.astype(str).to_numpy(dtype=str), {"kind": "str", "dtype": str(dtype)}
+    if raw.dtype == object:  # pickle gerektirir: mmap'lenemez
+        raise TypeError(f"unsupported column dtype for npy storage: {dtype}")
+    return raw, meta
+
+
+def _na_mask(values: Any, meta: dict[str, Any]) -> np.ndarray | None:
+    """str/nullable kolonlarda eksik değer maskesi (eksik yoksa None)."""
+    if meta["kind"] not in ("str", "masked"):
+        return None
+    na = pd.isna(pd.Series(values)).to_numpy()
+    return na if na.any() else None
+
+
+def _save_values(d: Path, stem: str, values: Any) -> dict[str, Any]:
+    """Değerleri ``<stem>.npy``'ye (eksikler için ``<stem>.na.npy``) yazar."""
+    arr, meta = _encode(values)
+    np.save(d / f"{stem}.npy", arr)
+    meta["file"] = f"{stem}.npy"
+    na = _na_mask(values, meta)
+    if na is not None:
+        np.save(d / f"{stem}.na.npy", na)
+        meta["na"] = f"{stem}.na.npy"
+    return meta
+
+
+def _decode(arr: np.ndarray, meta: dict[str, Any], na: np.ndarray | None = None) -> Any:
+    if meta["kind"] == "datetime":
+        di = pd.DatetimeIndex(np.asarray(arr, dtype=np.int64).astype("datetime64[ns]"))
+        if meta.get("tz"):
+            di = di.tz_localize("UTC").tz_convert(meta["tz"])
+        di = di.as_unit(meta.get("unit") or "ns")
+        if meta.get("freq") and len(di):
+            with contextlib.suppress(ValueError):  # dilim freq ile uyumsuzsa freq'siz
+                di = pd.DatetimeIndex(di, freq=meta["freq"])
+        return di
+    if meta["kind"] == "numeric":
+        return np.array(arr)  # mmap'ten kopya: dosya açık kalmaz
+    if meta["kind"] == "masked":
+        out = pd.array(np.array(arr), dtype=meta["dtype"])
+        if na is not None:
+            out[np.asarray(na)] = pd.NA
         return out
+    vals = np.array(arr).astype(object)
+    if na is not None:
+        vals[na] = None
+    return vals if meta["dtype"] == "object" else pd.array(vals, dtype=meta["dtype"])
+
+
+def _pack_values(arrays: dict[str, np.ndarray], stem: str, values: Any) -> dict[str, Any]:
+    """``_save_values``'un tek dosya (npz) karşılığı: dizileri ``arrays``'e ekler."""
+    arr, meta = _encode(values)
+    arrays[stem] = arr
+    na = _na_mask(values, meta)
+    if na is not None:
+        arrays[f"{stem}.na"] = na
+        meta["na"] = f"{stem}.na"
+    return meta
+
+
+def frame_to_arrays(obj: pd.DataFrame | pd.Series) -> dict[str, np.ndarray]:
+    """DataFrame/Series -> pickle'sız ``np.savez`` girdisi (şema ``__schema__`` içinde)."""
+    is_series = isinstance(obj, pd.Series)
+    df = obj.to_frame() if is_series else obj
+    if isinstance(df.index, pd.MultiIndex) or isinstance(df.columns, pd.MultiIndex):
+        raise TypeError("MultiIndex is not supported by the frame codec")
+    names = [df.index.name, *df.columns, obj.name if is_series else None]
+    bad = [n for n in names if n is not None and not isinstance(n, str | int | float)]
+    if bad:  # JSON şemasında aynı değerle geri gelmez
+        raise TypeError(f"unsupported index/column names for the frame codec: {bad!r}")
+    arrays: dict[str, np.ndarray] = {}
+    schema = {
+        "series": is_series,
+        "name": obj.name if is_series else None,
+        "index": {"name": df.index.name, **_pack_values(arrays, "index", df.index)},
+        "columns": [
+            {"name": name, **_pack_values(arrays, f"c{i}", df.iloc[:, i])}
+            for i, name in enumerate(df.columns)
+        ],
+    }
+    arrays["__schema__"] = np.array(json.dumps(schema))
+    return arrays
+
+
+def frame_from_arrays(z: Any) -> pd.DataFrame | pd.Series:
+    """``frame_to_arrays`` ile yazılmış npz'yi geri okur."""
+    schema = json.loads(str(z["__schema__"]))
+
+    def values(meta: dict[str, Any]) -> Any:
+        return _decode(z[meta["file"]], meta, z[meta["na"]] if "na" in meta else None)
+
+    idx_meta = {**schema["index"], "file": "index"}
+    index = pd.Index(values(idx_meta), name=idx_meta["name"])
+    # konumsal kurulum: tekrar eden kolon adları birbirini ezmez
+    data = {i: values({**c, "file": f"c{i}"}) for i, c in enumerate(schema["columns"])}
+    df = pd.DataFrame(data, index=index, columns=range(len(data)))
+    df.columns = pd.Index([c["name"] for c in schema["columns"]])
+    return df.iloc[:, 0].rename(schema["name"]) if schema["series"] else df
+
+
+def _write_npy_table(d: Path, df: pd.DataFrame) -> None:
+    idx_meta = _save_values(d, "index", df.index)
+    cols = [
+        {"name": name, **_save_values(d, f"c{i}", df.iloc[:, i])}
+        for i, name in enumerate(df.columns)
+    ]
+    schema = {
+        "version": _SCHEMA_VERSION,
+        "rows": int(len(df)),
+        "index": {"name": df.index.name, **idx_meta},
+        "sorted": bool(df.index.is_monotonic_increasing),
+        "columns": cols,
+    }
+    (d / "schema.json").write_text(json.dumps(schema), encoding="utf-8")
+
+
+def _bound_ns(ts: pd.Timestamp | str, tz: str | None) -> int:
+    t = pd.Timestamp(ts)
+    if tz is not None:
+        t = t.tz_localize(tz) if t.tzinfo is None else t
+        t = t.tz_convert("UTC")
+    elif t.tzinfo is not None:
+        t = t.tz_convert("UTC").tz_localize(None)
+    return int(t.as_unit("ns").value)
+
+
+def _read_npy_table(
+    d: Path,
+    columns: list[str] | None,
+    start: pd.Timestamp | str | None,
+    end: pd.Timestamp | str | None,
+) -> pd.DataFrame:
+    schema = json.loads((d / "schema.json").read_text(encoding="utf-8"))
+    idx_meta = schema["index"]
+    idx_mm = np.load(d / idx_meta["file"], mmap_mode="r")
+    lo, hi = 0, int(schema["rows"])
+    rows: slice | np.ndarray = slice(lo, hi)
+    if start is not None or end is not None:
+        if idx_meta["kind"] != "datetime":
+            raise TypeError("start/end requires a datetime index")
+        tz = idx_meta.get("tz")
+        s_ns = None if start is None else _bound_ns(start, tz)
+        e_ns = None if end is None else _bound_ns(end, tz)
+        if schema["sorted"]:  # ikili arama: yalnız dilimin sayfaları okunur
+            if s_ns is not None:
+                lo = int(np.searchsorted(idx_mm, s_ns, side="left"))
+            if e_ns is not None:
+                hi = int(np.searchsorted(idx_mm, e_ns, side="right"))
+            rows = slice(lo, max(lo, hi))
+        else:
+            mask = np.ones(hi, dtype=bool)
+            if s_ns is not None:
+                mask &= idx_mm >= s_ns
+            if e_ns is not None:
+                mask &= idx_mm <= e_ns
+            rows = np.flatnonzero(mask)
+
+    by_name = {c["name"]: c for c in schema["columns"]}
+    wanted = [c["name"] for c in schema["columns"]] if columns is None else list(columns)
+    missing = [c for c in wanted if c not in by_name]
+    if missing:
+        raise KeyError(f"columns not in table: {missing}")
+
+    def column(meta: dict[str, Any], mm: np.ndarray | None = None) -> Any:
+        mm = np.load(d / meta["file"], mmap_mode="r") if mm is None else mm
+        na = np.load(d / meta["na"], mmap_mode="r")[rows] if "na" in meta else None
+        return _decode(mm[rows], meta, na)
+
+    data = {name: column(by_name[name]) for name in wanted}
+    index = pd.Index(column(idx_meta, idx_mm), name=idx_meta["name"])
+    return pd.DataFrame(data, index=index, columns=wanted)
 
 
 __all__ = ["FeatureStore", "set_cache_root"]
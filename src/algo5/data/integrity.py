@@ -1,14 +1,118 @@
+import base64
 import hashlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
+DEFAULT_BLOCK_ROWS = 65_536
+
 
 def df_checksum(df: pd.DataFrame) -> str:
     h = pd.util.hash_pandas_object(df, index=True).values
     return hashlib.md5(h).hexdigest()  # type: ignore[arg-type]
 
 
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    # satır hash'leri birbirinden bağımsız: blok blok hesaplamak tüm çerçeveyle aynı
+    return pd.util.hash_pandas_object(df, index=True).to_numpy(dtype=np.uint64)
+
+
+def _digest(b: bytes) -> str:
+    return hashlib.md5(b).hexdigest()
+
+
+def _schema(df: pd.DataFrame) -> str:
+    cols = [(str(c), str(t)) for c, t in df.dtypes.items()]
+    return _digest(repr((cols, str(df.index.dtype))).encode("utf-8"))
+
+
+@dataclass
+class ChunkedFingerprint:
+    """Sabit satır blokları üzerinde iki seviyeli hash ağacı (yapraklar + kök).
+
+    Her blok yaprağı o bloğun satır hash'lerinin (``hash_pandas_object``) MD5'idir; kök,
+    şema + satır sayısı + yapraklardan türetilir. Son (eksik) bloğun satır hash'leri
+    ``tail``'de tutulur; ``append`` yalnız yeni satırları hash'ler.
+    """
+
+    block_rows: int
+    n_rows: int
+    schema: str
+    leaves: list[str]
+    tail: np.ndarray = field(default_factory=lambda: np.empty(0, np.uint64), repr=False)
+
+    @property
+    def root(self) -> str:
+        return _digest(f"{self.schema}:{self.n_rows}:{''.join(self.leaves)}".encode("ascii"))
+
+    @property
+    def n_blocks(self) -> int:
+        return len(self.leaves)
+
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, block_rows: int = DEFAULT_BLOCK_ROWS
+    ) -> "ChunkedFingerprint":
+        empty = cls(int(block_rows), 0, _schema(df), [])
+        return empty._extend(_row_hashes(df)) if len(df) else empty
+
+    def append(self, rows: pd.DataFrame) -> "ChunkedFingerprint":
+        """Sona eklenen satırlarla yeni parmak izi (eski bloklar yeniden hash'lenmez)."""
+        if not len(rows):
+            return self
+        if self.n_rows and _schema(rows) != self.schema:
+            raise ValueError("appended rows have a different schema")
+        base = self if self.n_rows else ChunkedFingerprint(self.block_rows, 0, _schema(rows), [])
+        return base._extend(_row_hashes(rows))
+
+    def _extend(self, new: np.ndarray) -> "ChunkedFingerprint":
+        b = self.block_rows
+        h = np.concatenate([self.tail, new]) if self.tail.size else new
+        leaves = self.leaves[:-1] if self.tail.size else list(self.leaves)
+        n_full = len(h) // b
+        leaves += [_digest(h[i * b : (i + 1) * b].tobytes()) for i in range(n_full)]
+        tail = h[n_full * b :].copy()
+        if tail.size:
+            leaves.append(_digest(tail.tobytes()))
+        return ChunkedFingerprint(b, self.n_rows + len(new), self.schema, leaves, tail)
+
+    def diff(self, other: "ChunkedFingerprint") -> list[tuple[int, int]]:
+        """Farklı satır aralıkları ``[(start, stop), ...]`` (blok çözünürlüğünde)."""
+        n = max(self.n_rows, other.n_rows)
+        if self.schema != other.schema or self.block_rows != other.block_rows:
+            return [(0, n)] if n else []
+        b = self.block_rows
+        out: list[tuple[int, int]] = []
+        for i in range(max(self.n_blocks, other.n_blocks)):
+            a = self.leaves[i] if i < self.n_blocks else None
+            c = other.leaves[i] if i < other.n_blocks else None
+            if a == c:
+                continue
+            lo, hi = i * b, min((i + 1) * b, n)
+            if out and out[-1][1] == lo:
+                out[-1] = (out[-1][0], hi)
+            else:
+                out.append((lo, hi))
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "block_rows": self.block_rows,
+            "n_rows": self.n_rows,
+            "schema": self.schema,
+            "leaves": list(self.leaves),
+            "tail": base64.b64encode(self.tail.tobytes()).decode("ascii"),
+            "root": self.root,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "ChunkedFingerprint":
+        tail = np.frombuffer(base64.b64decode(d.get("tail", "")), dtype=np.uint64).copy()
+        return cls(int(d["block_rows"]), int(d["n_rows"]), d["schema"], list(d["leaves"]), tail)
+
+
 @dataclass
 class Reproducibility:
     global_seed: int = 42
@@ -0,0 +1,332 @@
+"""Tek geçişli, parça parça (chunk) OHLCV kalite taraması.
+
+``OhlcvScanner`` her parçada tüm kontrolleri aynı NumPy dizileri üzerinde birlikte yapar;
+parçalar arası durum (son ts, son close, bayat seri, getiri momentleri) taşınır. Böylece
+memory-map'lenmiş diziler ya da akan parçalar (CSV ``chunksize``, FeatureStore segmentleri)
+sınırlı bellekle taranır; olay örnekleri kategori başına ``max_events`` ile sınırlıdır.
+
+Kontroller:
+
+- hata: tekrar eden ts, monoton olmayan ts, OHLC tutarsızlığı (high < max(o, c, l),
+  low > min(o, c, h)), sıfır/negatif fiyat
+- uyarı: beklenen frekansa göre eksik bar, NaN satır, getiri z-skoru aykırıları,
+  ``stale_bars`` ve üzeri aynı close (bayat fiyat)
+
+Aykırılar nedensel (expanding) z-skoruyla bulunur: bar t'nin getirisi kendinden önceki
+tüm getirilerin ortalama/std'sine göre ölçülür; sonuç parça boyutundan bağımsızdır.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+ERRORS = ("duplicates", "non_monotonic", "ohlc_inconsistent", "nonpositive_price")
+WARNINGS = ("missing_bars", "nan_rows", "outliers", "stale_runs")
+
+
+@dataclass
+class QualityReport:
+    rows: int = 0
+    freq: pd.Timedelta | None = None
+    counts: dict[str, int] = field(default_factory=lambda: dict.fromkeys(ERRORS + WARNINGS, 0))
+    events: dict[str, list[dict[str, Any]]] = field(
+        default_factory=lambda: {k: [] for k in ERRORS + WARNINGS}
+    )
+
+    @property
+    def ok(self) -> bool:
+        return not any(self.counts[k] for k in ERRORS)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "ok": self.ok,
+            "rows": self.rows,
+            "freq": None if self.freq is None else str(self.freq),
+            "errors": {k: self.counts[k] for k in ERRORS},
+            "warnings": {k: self.counts[k] for k in WARNINGS},
+            "events": {k: list(v) for k, v in self.events.items() if v},
+        }
+
+
+def _ts(ns: int | np.integer) -> pd.Timestamp:
+    return pd.Timestamp(int(ns), tz="UTC")
+
+
+class OhlcvScanner:
+    """``update(...)`` ile parça parça beslenir, ``finish()`` raporu döner.
+
+    ``freq`` verilmezse beklenen frekans, satır sırasıyla ilk ``freq_samples`` pozitif ts
+    aralığının medyanıdır; o sayıya ulaşılana kadar (en fazla ``finish()``'e dek) aralıklar
+    tamponlanır ve eksik bar kontrolü ertelenir. Böylece çıkarılan frekans ve rapor parça
+    boyutundan bağımsızdır; ``freq`` verilirse tampon kullanılmaz.
+    """
+
+    def __init__(
+        self,
+        freq: str | pd.Timedelta | None = None,
+        *,
+        z_threshold: float = 6.0,
+        min_periods: int = 30,
+        stale_bars: int = 5,
+        max_events: int = 100,
+        freq_samples: int = 100,
+    ) -> None:
+        self.freq_ns = None if freq is None else int(pd.Timedelta(freq).value)
+        self.freq_samples = int(freq_samples)
+        self.z_threshold = float(z_threshold)
+        self.min_periods = int(min_periods)
+        self.stale_bars = int(stale_bars)
+        self.max_events = int(max_events)
+        self.report = QualityReport()
+        if self.freq_ns is not None:
+            self.report.freq = pd.Timedelta(self.freq_ns, unit="ns")
+        # frekans çıkarımı için tamponlanan (satır, ts, aralık) parçaları
+        self._pending: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._pending_n = 0
+        self._last_ts: int | None = None
+        self._last_close = np.nan
+        # getiri momentleri (K kaydırmalı: sayısal kararlılık)
+        self._k: float | None = None
+        self._n = 0
+        self._s = 0.0
+        self._q = 0.0
+        # açık (aynı close) seri: başlangıç satırı/ts, uzunluk, değer
+        self._run_start = 0
+        self._run_ts: int | None = None
+        self._run_len = 0
+        self._run_close = np.nan
+        self._finished = False
+
+    # ---------- helpers ----------
+    def _event(self, kind: str, count: int, rows: np.ndarray, make: Any) -> None:
+        if not count:
+            return
+        self.report.counts[kind] += int(count)
+        room = self.max_events - len(self.report.events[kind])
+        for i in rows[: max(0, room)]:
+            self.report.events[kind].append(make(int(i)))
+
+    # ---------- input ----------
+    def update_frame(self, df: pd.DataFrame) -> None:
+        cols = {str(c).lower(): c for c in df.columns}
+        missing = [c for c in ("open", "high", "low", "close") if c not in cols]
+        if missing:
+            raise KeyError(f"OHLC columns missing: {missing}")
+        ts = None
+        if isinstance(df.index, pd.DatetimeIndex):
+            idx = df.index if df.index.tz is None else df.index.tz_convert("UTC")
+            ts = idx.as_unit("ns").asi8
+        self.update(
+            ts, *(df[cols[c]].to_numpy(dtype=np.float64) for c in ("open", "high", "low", "close"))
+        )
+
+    def update(
+        self,
+        ts: np.ndarray | None,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+    ) -> None:
+        """Bir parça ekler (ts: int64 epoch ns ya da None; fiyatlar float dizileri)."""
+        o, h, lo, c = (np.asarray(a, dtype=np.float64) for a in (open_, high, low, close))
+        m = len(c)
+        if not m:
+            return
+        base = self.report.rows
+        if ts is not None:
+            self._check_time(np.asarray(ts, dtype=np.int64), base)
+        self._check_prices(o, h, lo, c, base, ts)
+        self._check_returns(c, base, ts)
+        self._check_stale(c, base, ts)
+        self.report.rows += m
+
+    def _check_time(self, ts: np.ndarray, base: int) -> None:
+        prev = ts[0] if self._last_ts is None else self._last_ts
+        dt = np.diff(ts, prepend=prev)
+        if self._last_ts is None:
+            dt = dt[1:]
+            off = 1
+        else:
+            off = 0
+        self._last_ts = int(ts[-1])
+
+        dup = np.flatnonzero(dt == 0) + off
+        self._event("duplicates", dup.size, dup, lambda i: {"row": base + i, "ts": _ts(ts[i])})
+        back = np.flatnonzero(dt < 0) + off
+        self._event("non_monotonic", back.size, back, lambda i: {"row": base + i, "ts": _ts(ts[i])})
+
+        pos = np.flatnonzero(dt > 0)
+        gaps = (base + pos + off, ts[pos + off], dt[pos])
+        if self.freq_ns is not None:
+            self._check_gaps(*gaps)
+            return
+        # frekans henüz yok: ilk freq_samples pozitif aralık satır sırasıyla toplanır
+        self._pending.append(gaps)
+        self._pending_n += pos.size
+        if self._pending_n >= self.freq_samples:
+            self._fix_freq()
+
+    def _fix_freq(self) -> None:
+        rows, ts, dt = (np.concatenate(parts) for parts in zip(*self._pending, strict=True))
+        self._pending = []
+        if not dt.size:
+            return
+        self.freq_ns = int(np.median(dt[: self.freq_samples]))
+        self.report.freq = pd.Timedelta(self.freq_ns, unit="ns")
+        self._check_gaps(rows, ts, dt)
+
+    def _check_gaps(self, rows: np.ndarray, ts: np.ndarray, dt: np.ndarray) -> None:
+        big = np.flatnonzero(dt > self.freq_ns)
+        # frekansın katı olmayan aralık da en az bir eksik bar sayılır
+        missing = np.maximum(dt[big] // self.freq_ns - 1, 1)
+        self.report.counts["missing_bars"] += int(missing.sum())
+        room = self.max_events - len(self.report.events["missing_bars"])
+        for j, i in enumerate(big[: max(0, room)]):
+            self.report.events["missing_bars"].append(
+                {
+                    "row": int(rows[i]),
+                    "after": _ts(ts[i] - dt[i]),
+                    "ts": _ts(ts[i]),
+                    "missing": int(missing[j]),
+                }
+            )
+
+    def _check_prices(self, o, h, lo, c, base: int, ts: np.ndarray | None) -> None:
+        def at(i: int) -> dict[str, Any]:
+            return {"row": base + i} if ts is None else {"row": base + i, "ts": _ts(ts[i])}
+
+        nan = np.isnan(o) | np.isnan(h) | np.isnan(lo) | np.isnan(c)
+        rows = np.flatnonzero(nan)
+        self._event("nan_rows", rows.size, rows, at)
+
+        with np.errstate(invalid="ignore"):
+            bad = (h < np.maximum(np.maximum(o, c), lo)) | (lo > np.minimum(np.minimum(o, c), h))
+            rows = np.flatnonzero(bad & ~nan)
+            self._event("ohlc_inconsistent", rows.size, rows, at)
+            nonpos = (o <= 0) | (h <= 0) | (lo <= 0) | (c <= 0)
+        rows = np.flatnonzero(nonpos)
+        self._event("nonpositive_price", rows.size, rows, at)
+
+    def _check_returns(self, c: np.ndarray, base: int, ts: np.ndarray | None) -> None:
+        prev = np.concatenate([[self._last_close], c[:-1]])
+        self._last_close = c[-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = c / prev - 1.0
+        valid = np.isfinite(r) & (prev > 0) & (c > 0)
+        rv = r[valid]
+        if not rv.size:
+            return
+        if self._k is None:
+            self._k = float(rv[0])
+        x = rv - self._k
+        # bar t için yalnız kendinden önceki getiriler (expanding, nedensel)
+        n = self._n + np.arange(rv.size)
+        s = self._s + np.concatenate([[0.0], np.cumsum(x)[:-1]])
+        q = self._q + np.concatenate([[0.0], np.cumsum(x * x)[:-1]])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = s / n
+            var = (q - s * mean) / (n - 1)
+            z = (x - mean) / np.sqrt(var)
+        hit = (n >= self.min_periods) & (var > 0) & (np.abs(z) > self.z_threshold)
+        self._n += rv.size
+        self._s += float(x.sum())
+        self._q += float((x * x).sum())
+
+        rows = np.flatnonzero(valid)[hit]
+        zs, rs = z[hit], rv[hit]
+
+        def make(j: int) -> dict[str, Any]:
+            i = int(rows[j])
+            ev = {"row": base + i, "ret": float(rs[j]), "z": float(zs[j])}
+            if ts is not None:
+                ev["ts"] = _ts(ts[i])
+            return ev
+
+        self._event("outliers", rows.size, np.arange(rows.size), make)
+
+    def _check_stale(self, c: np.ndarray, base: int, ts: np.ndarray | None) -> None:
+        m = len(c)
+        same = np.empty(m, dtype=bool)
+        same[0] = self._run_len > 0 and c[0] == self._run_close
+        same[1:] = c[1:] == c[:-1]
+        starts = np.flatnonzero(~same)  # yeni serinin başladığı satırlar
+        if not starts.size:  # tüm parça açık serinin devamı
+            self._run_len += m
+            return
+        if self._run_len:  # taşınan seri bu parçada kapanıyor
+            self._close_run(self._run_start, self._run_ts, self._run_len + int(starts[0]))
+        lengths = np.diff(np.r_[starts, m])
+        for j in np.flatnonzero(lengths[:-1] >= self.stale_bars):
+            i = int(starts[j])
+            self._close_run(base + i, None if ts is None else int(ts[i]), int(lengths[j]))
+        i = int(starts[-1])  # son seri açık kalır
+        self._run_start, self._run_len, self._run_close = base + i, int(lengths[-1]), c[-1]
+        self._run_ts = None if ts is None else int(ts[i])
+
+    def _close_run(self, row: int, ts_ns: int | None, length: int) -> None:
+        if length < self.stale_bars:
+            return
+        self.report.counts["stale_runs"] += 1
+        if len(self.report.events["stale_runs"]) < self.max_events:
+            ev: dict[str, Any] = {"row": row, "bars": length}
+            if ts_ns is not None:
+                ev["ts"] = _ts(ts_ns)
+            self.report.events["stale_runs"].append(ev)
+
+    def finish(self) -> QualityReport:
+        if not self._finished:
+            if self._pending:  # freq_samples'a ulaşılmadı: eldeki aralıklarla çıkar
+                self._fix_freq()
+            self._close_run(self._run_start, self._run_ts, self._run_len)
+            self._finished = True
+        return self.report
+
+
+def scan_ohlcv(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    *,
+    chunk_rows: int = 1_000_000,
+    **kwargs: Any,
+) -> QualityReport:
+    """DataFrame'i ``chunk_rows``'luk parçalarla ya da bir parça iteratörünü tarar."""
+    scanner = OhlcvScanner(**kwargs)
+    chunks = (
+        (data.iloc[i : i + chunk_rows] for i in range(0, len(data), chunk_rows))
+        if isinstance(data, pd.DataFrame)
+        else data
+    )
+    for chunk in chunks:
+        scanner.update_frame(chunk)
+    return scanner.finish()
+
+
+@dataclass
+class OhlcvCheck:
+    """``DataQualityMonitor`` kontrolü: ``scan_ohlcv`` raporunu dict olarak döner."""
+
+    freq: str | None = None
+    z_threshold: float = 6.0
+    stale_bars: int = 5
+    chunk_rows: int = 1_000_000
+
+    def run(self, df: pd.DataFrame) -> dict[str, Any]:
+        cols = {str(c).lower() for c in df.columns}
+        if not {"open", "high", "low", "close"} <= cols:
+            return {"ok": True, "skipped": "no OHLC columns"}
+        rep = scan_ohlcv(
+            df,
+            chunk_rows=self.chunk_rows,
+            freq=self.freq,
+            z_threshold=self.z_threshold,
+            stale_bars=self.stale_bars,
+        )
+        return rep.to_dict()
+
+
+__all__ = ["OhlcvCheck", "OhlcvScanner", "QualityReport", "scan_ohlcv"]
@@ -2,8 +2,9 @@ from dataclasses import dataclass
 
 import pandas as pd
 
-from ..integrity import df_checksum
+from ..integrity import DEFAULT_BLOCK_ROWS, ChunkedFingerprint
 from ..validate import validate_ohlcv
+from .checks import OhlcvCheck
 
 
 @dataclass
@@ -14,8 +15,34 @@ class SchemaCheck:
 
 
 class DataQualityMonitor:
-    def __init__(self):
-        self.checks = (SchemaCheck(),)
+    """Kontrolleri çalıştırır ve çerçevenin blok parmak izini tutar.
+
+    ``append_only=True`` (yalnız sona eklenen akışlar) iken önceki çalıştırmanın satırları
+    değişmemiş kabul edilir: sınır bloğu yeniden hash'lenerek doğrulanır ve yalnız yeni
+    satırlar hash'lenir. Daha önceki satırlardaki düzenlemeler bu modda görülmez;
+    varsayılan (False) her çalıştırmada tüm blokları hash'ler.
+    """
+
+    def __init__(self, block_rows: int = DEFAULT_BLOCK_ROWS, append_only: bool = False):
+        self.checks = (SchemaCheck(), OhlcvCheck())
+        self.block_rows = block_rows
+        self.append_only = append_only
+        self.fingerprint: ChunkedFingerprint | None = None
+
+    def _is_append(self, prev: ChunkedFingerprint, df: pd.DataFrame) -> bool:
+        if prev.block_rows != self.block_rows or len(df) < prev.n_rows or not prev.n_rows:
+            return False
+        # son tam blok + eksik kuyruk yeniden hash'lenir (lo bir blok sınırı)
+        b = prev.block_rows
+        lo = max(0, prev.n_rows - prev.tail.size - b)
+        probe = ChunkedFingerprint.from_frame(df.iloc[lo : prev.n_rows], b)
+        return probe.schema == prev.schema and probe.leaves == prev.leaves[lo // b :]
+
+    def _fingerprint(self, df: pd.DataFrame) -> ChunkedFingerprint:
+        prev = self.fingerprint
+        if self.append_only and prev is not None and self._is_append(prev, df):
+            return prev.append(df.iloc[prev.n_rows :])
+        return ChunkedFingerprint.from_frame(df, self.block_rows)
 
     def run(self, df: pd.DataFrame) -> dict:
         out = {}
@@ -25,5 +52,11 @@ class DataQualityMonitor:
             ok = ok and r.get("ok", True)
             out[chk.__class__.__name__] = r
         out["ok"] = ok
-        out["checksum"] = df_checksum(df)
+        prev = self.fingerprint
+        fp = self._fingerprint(df)
+        self.fingerprint = fp
+        out["checksum"] = fp.root
+        if prev is None:
+            prev = ChunkedFingerprint(self.block_rows, 0, fp.schema, [])
+        out["changed_rows"] = fp.diff(prev)
         return out
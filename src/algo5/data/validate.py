@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 import pandas as pd
@@ -22,3 +23,55 @@ def validate_ohlcv(
             raise ValueError(f"Missing required columns: {missing}")
     report["nan_counts"] = {c: int(df[c].isna().sum()) for c in df.columns if c in df}
     return df, report
+
+
+class OhlcvStreamValidator:
+    """``validate_ohlcv``'nin parça (chunk) iteratörü için sürümü.
+
+    Rapor, parçaların birleşimi ``validate_ohlcv``'ye verilseydi dönecek raporla aynıdır
+    (``nan_counts`` parçalar boyunca toplanır, ``rows`` eklenir). ``close`` -> ``Close``
+    yeniden adlandırması parça üzerinde yerinde yapılır; eksik kolon ilk görüldüğü parçada
+    ``raise_errors`` ise ``ValueError`` olur.
+    """
+
+    def __init__(self, schema: OhlcvSchema | None = None, *, raise_errors: bool = True) -> None:
+        self.schema = schema or OhlcvSchema()
+        self.raise_errors = raise_errors
+        self.report: dict[str, Any] = {"ok": True, "missing": [], "renamed": {}}
+        self.rows = 0
+        self._seen = False
+        self._nan: dict[str, int] = {}
+
+    def _missing(self, columns: Any) -> None:
+        seen = set(self.report["missing"])
+        new = [c for c in self.schema.required if c not in columns and c not in seen]
+        if not new:
+            return
+        self.report["ok"] = False
+        self.report["missing"] = [c for c in self.schema.required if c in seen or c in new]
+        if self.raise_errors:
+            raise ValueError(f"Missing required columns: {self.report['missing']}")
+
+    def update(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        self._seen = True
+        cols_lower = {c.lower(): c for c in chunk.columns}
+        if "close" in cols_lower and "Close" not in chunk.columns:
+            chunk.rename(columns={cols_lower["close"]: "Close"}, inplace=True)
+            self.report["renamed"]["close"] = "Close"
+        self._missing(chunk.columns)
+        for c, n in chunk.isna().sum().items():
+            self._nan[c] = self._nan.get(c, 0) + int(n)
+        self.rows += len(chunk)
+        return chunk
+
+    def finish(self) -> dict[str, Any]:
+        if not self._seen:  # hiç parça yok: kolonsuz boş çerçeve gibi
+            self._missing(())
+        self.report["nan_counts"] = dict(self._nan)
+        self.report["rows"] = self.rows
+        return self.report
+
+    def stream(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            yield self.update(chunk)
+        self.finish()
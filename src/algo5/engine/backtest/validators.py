@@ -1,8 +1,11 @@
 ﻿from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from typing import Any
 
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 REQUIRED_COLS_BASE = ("Open", "High", "Low", "Close")
 
@@ -36,14 +39,124 @@ def validate_ohlcv(df: pd.DataFrame, *, spec: OHLCVSpec | None = None) -> None:
         raise ValueError("Low cannot be greater than High")
 
 
-def normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
+def normalize_ohlcv(df: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
+    """OHLCV kolonlarını sayıya, naive indeksi UTC'ye çevirir.
+
+    Zaten sayısal olan kolonlara dokunulmaz. ``inplace=True`` girdiyi kopyalamadan değiştirir
+    (çerçeve çağırana ait değilse kullanmayın).
+    """
+    out = df if inplace else df.copy()
     for col in ["Open", "High", "Low", "Close", "Volume"]:
-        if col in out.columns:
+        if col in out.columns and not is_numeric_dtype(out[col].dtype):
             out[col] = pd.to_numeric(out[col], errors="coerce")
     if isinstance(out.index, pd.DatetimeIndex) and out.index.tz is None:
         out.index = out.index.tz_localize("UTC")
     return out
 
 
-__all__ = ["OHLCVSpec", "validate_ohlcv", "normalize_ohlcv"]
+class OHLCVStreamValidator:
+    """Parça (chunk) iteratörü üzerinde ``validate_ohlcv`` (+ isteğe bağlı normalize).
+
+    Parçalar birleştirilip ``validate_ohlcv``'ye verilseydi alınacak kabul/ret kararının
+    aynısı verilir; ret, hatanın görüldüğü parçada ``ValueError`` ile olur, "boş" kararı
+    ``finish()``'te. Parçalar arası durum: ilk parçanın tz'si, ilk/son ts, satır sayısı,
+    geriye giden ts sayısı (bilgi amaçlı) ve gerekli kolonlardaki NaN sayıları.
+
+    ``normalize=True`` iken parçalar yerinde normalize edilir (CSV okuyucu/FeatureStore
+    parçaları gibi akışa ait parçalar için güvenli); paylaşılan çerçevelerde ``copy=True``.
+    """
+
+    def __init__(
+        self, spec: OHLCVSpec | None = None, *, normalize: bool = True, copy: bool = False
+    ) -> None:
+        self.spec = spec or OHLCVSpec()
+        self.normalize = normalize
+        self.copy = copy
+        self.required = list(REQUIRED_COLS_BASE) + (["Volume"] if self.spec.require_volume else [])
+        self.rows = 0
+        self.chunks = 0
+        self.tz: Any = None
+        self.first_ts: pd.Timestamp | None = None
+        self.last_ts: pd.Timestamp | None = None
+        self.non_monotonic = 0
+        self.nan_counts = dict.fromkeys(self.required, 0)
+
+    def update(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Parçayı doğrular (ve normalize eder); geçerli parçayı döner."""
+        if self.normalize:
+            chunk = normalize_ohlcv(chunk, inplace=not self.copy)
+        self.chunks += 1
+        if not isinstance(chunk.index, pd.DatetimeIndex):
+            raise ValueError("index must be a DatetimeIndex")
+        if len(chunk.index) == 0:
+            return chunk
+        nan = self._check(chunk)
+        self._advance(chunk, nan)
+        return chunk
+
+    def _check(self, chunk: pd.DataFrame) -> pd.Series:
+        tz = chunk.index.tz
+        if self.rows and str(tz) != str(self.tz):
+            # birleştirilmiş çerçevenin indeksi object olurdu
+            raise ValueError(f"index must be a DatetimeIndex (timezone changed: {self.tz} -> {tz})")
+        if tz is None and self.spec.require_tz:
+            raise ValueError("index must be timezone-aware (UTC recommended)")
+        if not _has_required_columns(chunk, self.spec.require_volume):
+            raise ValueError("missing required OHLC(V) columns")
+        nan = chunk[self.required].isna().sum()
+        if not self.spec.allow_na and nan.any():
+            raise ValueError("NaNs not allowed in required columns")
+        if (chunk["Low"] > chunk["High"]).any():
+            raise ValueError("Low cannot be greater than High")
+        return nan
+
+    def _advance(self, chunk: pd.DataFrame, nan: pd.Series) -> None:
+        for col, n in nan.items():
+            self.nan_counts[col] += int(n)
+        ts = chunk.index.asi8
+        back = int((ts[1:] < ts[:-1]).sum())
+        if self.last_ts is not None and chunk.index[0] < self.last_ts:
+            back += 1
+        self.non_monotonic += back
+        if not self.rows:
+            self.tz, self.first_ts = chunk.index.tz, chunk.index[0]
+        self.last_ts = chunk.index[-1]
+        self.rows += len(chunk.index)
+
+    def finish(self) -> dict[str, Any]:
+        if not self.rows:
+            raise ValueError("dataframe is empty")
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "tz": None if self.tz is None else str(self.tz),
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "non_monotonic": self.non_monotonic,
+            "nan_counts": dict(self.nan_counts),
+        }
+
+    def stream(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Geçerli parçaları sırayla verir; iteratör bitince ``finish()`` çağrılır."""
+        for chunk in chunks:
+            yield self.update(chunk)
+        self.finish()
+
+
+def validate_ohlcv_stream(
+    chunks: Iterable[pd.DataFrame], *, spec: OHLCVSpec | None = None
+) -> dict[str, Any]:
+    """Parçaları tutmadan doğrular (normalize etmeden, ``validate_ohlcv`` gibi)."""
+    v = OHLCVStreamValidator(spec, normalize=False)
+    for chunk in chunks:
+        v.update(chunk)
+    return v.finish()
+
+
+__all__ = [
+    "OHLCVSpec",
+    "OHLCVStreamValidator",
+    "validate_ohlcv",
+    "validate_ohlcv_stream",
+    "normalize_ohlcv",
+]
@@ -0,0 +1,195 @@
+"""Fiyat indeksli bekleyen emir defteri.
+
+Her bar'da sadece tetik/limit fiyatı [low, high] aralığına düşebilecek emirler
+matcher'a gönderilir:
+
+- MARKET: her zaman aday (open'dan dolar)
+- LIMIT: L ∈ [low, high]  -> limit merdiveninde aralık sorgusu
+- STOP / STOP_LIMIT BUY: S <= high   -> stop merdiveninde prefix
+- STOP / STOP_LIMIT SELL: S >= low   -> stop merdiveninde suffix
+- diğerleri (trailing, eksik fiyatlı emirler): her bar ziyaret edilir
+
+Trailing stop referansları (peak/trough) defterin ``trailing`` durumunda tutulur ve
+emir dolunca/iptal edilince silinir.
+
+Adaylar gönderim sırasına göre eşleştirilir; böylece fill listesi düz liste
+taramasıyla birebir aynıdır.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+
+from .matcher import match_order_on_bar
+from .models import Fill, Order, OrderType, Side
+from .trailing_oco import TrailingState
+
+
+class _Ladder:
+    """(fiyat, seq) çiftlerini fiyata göre sıralı tutan paralel listeler."""
+
+    __slots__ = ("prices", "seqs")
+
+    def __init__(self) -> None:
+        self.prices: list[float] = []
+        self.seqs: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.seqs)
+
+    def add(self, price: float, seq: int) -> None:
+        i = bisect_right(self.prices, price)
+        self.prices.insert(i, price)
+        self.seqs.insert(i, seq)
+
+    def remove(self, price: float, seq: int) -> None:
+        i = bisect_left(self.prices, price)
+        j = self.seqs.index(seq, i)
+        del self.prices[j]
+        del self.seqs[j]
+
+    def between(self, lo: float, hi: float) -> list[int]:
+        return self.seqs[bisect_left(self.prices, lo) : bisect_right(self.prices, hi)]
+
+    def at_most(self, hi: float) -> list[int]:
+        return self.seqs[: bisect_right(self.prices, hi)]
+
+    def at_least(self, lo: float) -> list[int]:
+        return self.seqs[bisect_left(self.prices, lo) :]
+
+
+def _is_price(x: float | None) -> bool:
+    return x is not None and x == x  # NaN değil
+
+
+class OrderBook:
+    """Bekleyen emirler: tip/yön bazlı fiyat merdivenleri + ``oco_id`` indeksi."""
+
+    def __init__(self) -> None:
+        self._orders: dict[int, Order] = {}  # seq -> order (ekleme sırası korunur)
+        self._seq_by_id: dict[str, int] = {}
+        self._key: dict[int, tuple[str, float]] = {}  # seq -> (bucket, fiyat)
+        self._market: dict[int, None] = {}
+        self._other: dict[int, None] = {}
+        self._limit = _Ladder()
+        self._stop = {Side.BUY: _Ladder(), Side.SELL: _Ladder()}
+        self._oco: dict[str, set[int]] = {}
+        self._next_seq = 0
+        self.trailing = TrailingState()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __iter__(self) -> Iterator[Order]:
+        return iter(list(self._orders.values()))
+
+    def __contains__(self, order_id: object) -> bool:
+        return order_id in self._seq_by_id
+
+    def orders(self) -> list[Order]:
+        """Bekleyen emirler (gönderim sırasıyla)."""
+        return list(self._orders.values())
+
+    # ---------- mutation ----------
+    def add(self, order: Order) -> None:
+        seq = self._next_seq
+        self._next_seq += 1
+        self._orders[seq] = order
+        self._seq_by_id[order.id] = seq
+
+        t = order.type
+        if t is OrderType.MARKET:
+            self._market[seq] = None
+            self._key[seq] = ("market", 0.0)
+        elif t is OrderType.LIMIT and _is_price(order.limit_price):
+            px = float(order.limit_price)  # type: ignore[arg-type]
+            self._limit.add(px, seq)
+            self._key[seq] = ("limit", px)
+        elif t in (OrderType.STOP, OrderType.STOP_LIMIT) and _is_price(order.stop_price):
+            # limit_price'sız STOP_LIMIT hiç dolmaz; yine de stop'a göre indekslenir
+            px = float(order.stop_price)  # type: ignore[arg-type]
+            self._stop[order.side].add(px, seq)
+            self._key[seq] = ("stop", px)
+        else:
+            self._other[seq] = None
+            self._key[seq] = ("other", 0.0)
+
+        if order.oco_id:
+            self._oco.setdefault(order.oco_id, set()).add(seq)
+
+    def _remove_seq(self, seq: int) -> Order:
+        order = self._orders.pop(seq)
+        if self._seq_by_id.get(order.id) == seq:
+            del self._seq_by_id[order.id]
+        bucket, px = self._key.pop(seq)
+        if bucket == "market":
+            del self._market[seq]
+        elif bucket == "limit":
+            self._limit.remove(px, seq)
+        elif bucket == "stop":
+            self._stop[order.side].remove(px, seq)
+        else:
+            del self._other[seq]
+            self.trailing.discard(order.id)
+        if order.oco_id:
+            group = self._oco.get(order.oco_id)
+            if group is not None:
+                group.discard(seq)
+                if not group:
+                    del self._oco[order.oco_id]
+        return order
+
+    def cancel(self, order_id: str) -> Order | None:
+        seq = self._seq_by_id.get(order_id)
+        return None if seq is None else self._remove_seq(seq)
+
+    def cancel_oco(self, oco_id: str | None) -> list[Order]:
+        """Aynı ``oco_id``'li tüm bekleyen emirleri iptal eder (O(grup))."""
+        if not oco_id:
+            return []
+        return [self._remove_seq(seq) for seq in sorted(self._oco.get(oco_id, ()))]
+
+    # ---------- matching ----------
+    def candidates(self, h: float, low: float) -> list[int]:
+        """Bu bar'da dolabilecek emirlerin seq'leri (gönderim sırasıyla)."""
+        seqs = [*self._market, *self._other]
+        seqs += self._limit.between(low, h)
+        seqs += self._stop[Side.BUY].at_most(h)
+        seqs += self._stop[Side.SELL].at_least(low)
+        seqs.sort()
+        return seqs
+
+    def match(
+        self,
+        o: float,
+        h: float,
+        low: float,
+        c: float,
+        *,
+        fees_bps: float = 0.0,
+        slippage_bps: float = 0.0,
+    ) -> list[Fill]:
+        """Bar'ı aday emirlere uygular; dolan emirler defterden çıkarılır.
+
+        OCO kardeş iptali burada yapılmaz (fill'ler uygulanırken çağıran yapar).
+        """
+        fills: list[Fill] = []
+        for seq in self.candidates(h, low):
+            fill = match_order_on_bar(
+                self._orders[seq],
+                o=o,
+                h=h,
+                low=low,
+                c=c,
+                fees_bps=fees_bps,
+                slippage_bps=slippage_bps,
+                trail=self.trailing,
+            )
+            if fill is not None:
+                fills.append(fill)
+                self._remove_seq(seq)
+        return fills
+
+
+__all__ = ["OrderBook"]
@@ -1,16 +1,9 @@
 ﻿from __future__ import annotations
 
 import uuid
-from typing import Any
 from .models import Order, OrderType, Side
 
 
-def _attach(obj: Any, **fields: Any) -> None:
-    """Mypy'yi rahatsız etmeden dinamik attribute ekle/override et."""
-    for k, v in fields.items():
-        setattr(obj, k, v)
-
-
 def build_bracket(
     side: Side,
     qty: float,
@@ -27,8 +20,8 @@ def build_bracket(
 
     - Entry: LIMIT (oco_id verilmez)
     - Exits (TP/SL): aynı oco_id ile OCO kardeş yapılır
-    - Trailing istenirse SL için type alanı 'TRAILING_STOP' stringine ayarlanır ve
-      trail_amount / trail_pct alanları dinamik olarak eklenir (matcher wrapper bunu okur)
+    - Trailing istenirse SL ``OrderType.TRAILING_STOP`` olur ve trail_amount /
+      trail_pct alanları doldurulur (durumu ``OrderBook`` tutar)
     """
     orders: list[Order] = []
 
@@ -53,27 +46,24 @@ def build_bracket(
             type=OrderType.LIMIT,
             limit_price=float(take_profit),
             symbol=symbol,
+            oco_id=oco,
+            parent_id=entry_o.id,
         )
-        _attach(tp, oco_id=oco, parent_id=getattr(entry_o, "id", None))
         orders.append(tp)
 
     if stop_loss is not None:
+        trailing = trail_amount is not None or trail_pct is not None
         sl = Order(
             side=exit_side,
             qty=qty,
-            type=OrderType.STOP,
+            type=OrderType.TRAILING_STOP if trailing else OrderType.STOP,
             stop_price=float(stop_loss),
             symbol=symbol,
+            oco_id=oco,
+            parent_id=entry_o.id,
+            trail_amount=None if trail_amount is None else float(trail_amount),
+            trail_pct=None if trail_pct is None else float(trail_pct),
         )
-        # Trailing semantiği
-        if trail_amount is not None or trail_pct is not None:
-            _attach(sl, type="TRAILING_STOP")
-            if trail_amount is not None:
-                _attach(sl, trail_amount=float(trail_amount))
-            if trail_pct is not None:
-                _attach(sl, trail_pct=float(trail_pct))
-
-        _attach(sl, oco_id=oco, parent_id=getattr(entry_o, "id", None))
         orders.append(sl)
 
     return orders
@@ -1,12 +1,17 @@
 ﻿# mypy: ignore-errors
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 
-from .metrics import compute_metrics
+from algo5.metrics.metrics import compute_metrics
 
 
 @dataclass
@@ -30,7 +35,7 @@ def backtest_vectorized(df: pd.DataFrame, signal: pd.Series, costs: TradeCosts):
     cost_series = apply_costs(pos, costs.commission, costs.slippage_bps)
     strat_ret = raw - cost_series
     equity = (1 + strat_ret).cumprod()
-    stats = compute_metrics(equity, strat_ret)
+    stats = compute_metrics(equity)
     return equity, strat_ret, stats
 
 
@@ -48,6 +53,105 @@ def time_series_splits(n: int, n_splits: int, min_train: int = 60):
     return splits
 
 
+# ---------- shared-memory frame (process executor) ----------
+@dataclass(frozen=True)
+class _SharedFrame:
+    """Paylaşılan bellekteki DataFrame'in tarifi (pickle'ı küçük; veri kopyalanmaz)."""
+
+    shm_name: str
+    n: int
+    columns: list[tuple[Any, str, int]]  # (kolon adı, dtype, byte offset)
+    index: tuple[str, int] | None  # (dtype, offset); None -> RangeIndex
+    index_meta: dict[str, Any]  # tz / name
+
+
+def _publish_frame(df: pd.DataFrame) -> tuple[shared_memory.SharedMemory, _SharedFrame]:
+    arrays = [(c, np.ascontiguousarray(df[c].to_numpy())) for c in df.columns]
+    for c, a in arrays:
+        if a.dtype.hasobject:
+            raise TypeError(f"column {c!r} is not numeric; cannot share {a.dtype}")
+
+    idx = df.index
+    meta: dict[str, Any] = {"name": idx.name}
+    if isinstance(idx, pd.RangeIndex) and idx.start == 0 and idx.step == 1:
+        idx_arr = None
+    elif isinstance(idx, pd.DatetimeIndex):
+        idx_arr = idx.asi8
+        meta.update(kind="datetime", tz=idx.tz, unit=idx.unit)
+    else:
+        idx_arr = np.asarray(idx)
+        if idx_arr.dtype.hasobject:
+            raise TypeError("index is not numeric/datetime; cannot share")
+
+    blocks = [a for _, a in arrays] + ([] if idx_arr is None else [idx_arr])
+    size = max(1, sum(a.nbytes for a in blocks))
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    off, cols = 0, []
+    for c, a in arrays:
+        np.ndarray(a.shape, a.dtype, buffer=shm.buf, offset=off)[:] = a
+        cols.append((c, a.dtype.str, off))
+        off += a.nbytes
+    idx_spec = None
+    if idx_arr is not None:
+        np.ndarray(idx_arr.shape, idx_arr.dtype, buffer=shm.buf, offset=off)[:] = idx_arr
+        idx_spec = (idx_arr.dtype.str, off)
+    return shm, _SharedFrame(shm.name, len(df), cols, idx_spec, meta)
+
+
+def _attach_frame(spec: _SharedFrame, rows: slice) -> pd.DataFrame:
+    """Paylaşılan frame'in ``rows`` aralığını kopyalayarak DataFrame kurar."""
+    shm = shared_memory.SharedMemory(name=spec.shm_name)
+    try:
+
+        def col(dtype: str, off: int) -> np.ndarray:
+            return np.ndarray((spec.n,), np.dtype(dtype), buffer=shm.buf, offset=off)[rows].copy()
+
+        data = {c: col(dt, off) for c, dt, off in spec.columns}
+        meta = spec.index_meta
+        if spec.index is None:
+            index: pd.Index = pd.RangeIndex(rows.start, rows.stop, name=meta["name"])
+        elif meta.get("kind") == "datetime":
+            vals = col(*spec.index).view(f"M8[{meta['unit']}]")
+            index = pd.DatetimeIndex(vals, name=meta["name"])
+            if meta["tz"] is not None:
+                index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        else:
+            index = pd.Index(col(*spec.index), name=meta["name"])
+    finally:
+        shm.close()
+    return pd.DataFrame(data, index=index)
+
+
+def _run_fold(
+    df: pd.DataFrame | _SharedFrame,
+    tr: slice,
+    te: slice,
+    train_fn: Callable[[pd.DataFrame], dict],
+    infer_fn: Callable[[pd.DataFrame, dict], pd.Series],
+    costs: TradeCosts,
+):
+    """Tek fold: eğit, çıkarım yap, test dilimini backtest et (fold yoksa None)."""
+    t0 = time.perf_counter()
+    if isinstance(df, _SharedFrame):
+        lo = min(tr.start, te.start)
+        window = _attach_frame(df, slice(lo, max(tr.stop, te.stop)))
+        tr, te = slice(tr.start - lo, tr.stop - lo), slice(te.start - lo, te.stop - lo)
+        df = window
+    train_df = df.iloc[tr]
+    test_df = df.iloc[te]
+    if train_df.empty or test_df.empty:
+        return None
+    t1 = time.perf_counter()
+    state = train_fn(train_df)
+    t2 = time.perf_counter()
+    sig = infer_fn(test_df, state).reindex(test_df.index).fillna(0.0)
+    t3 = time.perf_counter()
+    eq, r, s = backtest_vectorized(test_df, sig, costs)
+    t4 = time.perf_counter()
+    timing = {"load": t1 - t0, "train": t2 - t1, "infer": t3 - t2, "backtest": t4 - t3}
+    return eq.to_numpy(dtype=float), r.to_numpy(dtype=float), s, timing
+
+
 def run_walkforward(
     df: pd.DataFrame,
     train_fn: Callable[[pd.DataFrame], dict],
@@ -55,30 +159,57 @@ def run_walkforward(
     costs: TradeCosts,
     n_splits: int = 5,
     min_train: int = 252,
+    *,
+    executor: Literal["serial", "process"] = "serial",
+    max_workers: int | None = None,
 ):
+    """Walk-forward: her fold'da eğit -> test diliminde çıkarım -> backtest.
+
+    ``executor="process"``: fold'lar process pool'da paralel koşar; OHLCV frame
+    ``multiprocessing.shared_memory``'ye bir kez yazılır, worker'lar sadece kendi
+    fold aralıklarını okur (``train_fn``/``infer_fn`` pickle edilebilir olmalı).
+    Sonuçlar fold sırasıyla, pozisyonel dilimlerle birleştirilir; ``fold_times``
+    fold başına load/train/infer/backtest sürelerini (saniye) içerir.
+    """
+    if executor not in ("serial", "process"):
+        raise ValueError(f"unknown executor: {executor!r}")
     n = len(df)
     if n < min_train + n_splits:
         raise ValueError("Not enough data for walk-forward")
     folds = time_series_splits(n, n_splits, min_train)
-    all_equity = pd.Series(index=df.index, dtype=float)
-    all_ret = pd.Series(index=df.index, dtype=float)
-    fold_stats = []
-    for tr, te in folds:
-        train_df = df.iloc[tr]
-        test_df = df.iloc[te]
-        if train_df.empty or test_df.empty:
+
+    if executor == "serial":
+        results = [_run_fold(df, tr, te, train_fn, infer_fn, costs) for tr, te in folds]
+    else:
+        shm, spec = _publish_frame(df)
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(_run_fold, spec, tr, te, train_fn, infer_fn, costs)
+                    for tr, te in folds
+                ]
+                results = [f.result() for f in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    all_equity = np.full(n, np.nan)
+    all_ret = np.full(n, np.nan)
+    fold_stats, fold_times = [], []
+    for (_, te), res in zip(folds, results, strict=True):
+        if res is None:
             continue
-        state = train_fn(train_df)
-        sig = infer_fn(test_df, state).reindex(test_df.index).fillna(0.0)
-        eq, r, s = backtest_vectorized(test_df, sig, costs)
-        all_equity.loc[test_df.index] = eq
-        all_ret.loc[test_df.index] = r
+        eq, r, s, timing = res
+        all_equity[te] = eq
+        all_ret[te] = r
         fold_stats.append(s)
-    overall_equity = all_equity.ffill().fillna(1.0)
-    overall_stats = compute_metrics(overall_equity, all_ret.fillna(0.0))
+        fold_times.append(timing)
+    overall_equity = pd.Series(all_equity, index=df.index).ffill().fillna(1.0)
+    ret = pd.Series(all_ret, index=df.index).fillna(0.0)
     return {
         "equity": overall_equity,
-        "ret": all_ret.fillna(0.0),
+        "ret": ret,
         "fold_stats": fold_stats,
-        "overall": overall_stats,
+        "fold_times": fold_times,
+        "overall": compute_metrics(overall_equity),
     }
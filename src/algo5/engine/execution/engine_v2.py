@@ -6,7 +6,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
-from algo5.metrics.metrics import compute_metrics, compute_nav
+from algo5.metrics.metrics import METRIC_KEYS, compute_metrics, compute_metrics_batch, compute_nav
 
 StrategyFn = Callable[[dict[str, pd.DataFrame], dict], dict[str, pd.Series]]
 
@@ -72,3 +72,77 @@ def run_vector_backtest(
         "portfolio_equity": portfolio_equity,
         "portfolio_returns": portfolio_rets,
     }
+
+
+# ---------------------------------------------------------------------------
+# Panel (parametre x zaman x sembol) backtest
+# ---------------------------------------------------------------------------
+def close_panel(prices: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Sembollerin close kolonlarını birleşik (union) indekste (zaman x sembol) toplar."""
+    cols: dict[str, pd.Series] = {}
+    for sym, df in prices.items():
+        if "close" not in df.columns:
+            raise ValueError(f"{sym}: 'close' kolonu yok")
+        cols[sym] = df["close"].astype(float)
+    if not cols:
+        return pd.DataFrame(dtype=float)
+    return pd.concat(cols, axis=1, join="outer").sort_index()
+
+
+def _panel_returns(close: np.ndarray) -> np.ndarray:
+    """(T, S) close -> (T, S) getiri; boşluklar son geçerli fiyattan köprülenir, NaN -> 0."""
+    ff = pd.DataFrame(close).ffill().to_numpy()
+    rets = np.zeros_like(ff)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets[1:] = ff[1:] / ff[:-1] - 1.0
+    rets[~np.isfinite(rets)] = 0.0
+    return rets
+
+
+def run_panel_backtest(
+    close: pd.DataFrame,
+    exposures: np.ndarray,
+    initial_capital: float = 100_000.0,
+    *,
+    params: list[dict] | None = None,
+    chunk: int = 64,
+) -> dict[str, Any]:
+    """Çok parametreli, çok sembollü vektörize backtest.
+
+    - ``close``: (T x S) close paneli (bkz. ``close_panel``; union indeks, NaN = işlem yok)
+    - ``exposures``: (P x T x S) exposure tensörü; [0, 1]'e kırpılır, NaN -> 0
+    - Getiri ``run_vector_backtest`` ile aynıdır: ``mean_s(exposure * r)`` (eşit ağırlık)
+
+    Parametreler ``chunk``'lık bloklar halinde işlenir (bellek sınırı); her blokta
+    portföy getirisi tek ``einsum`` ile hesaplanır. Dönen sözlükte ``portfolio_returns``
+    ve ``portfolio_equity`` (P x T) dizileri ile parametre başına ``metrics`` tablosu bulunur.
+    """
+    c = close.to_numpy(dtype=float)
+    e = np.asarray(exposures, dtype=float)
+    if e.ndim == 2:
+        e = e[None]
+    t, s = c.shape
+    if e.shape[1:] != (t, s):
+        raise ValueError(f"exposures shape {e.shape} does not match close panel {(t, s)}")
+    if params is not None and len(params) != e.shape[0]:
+        raise ValueError("params length must match exposures.shape[0]")
+
+    rets = _panel_returns(c)
+    port = np.zeros((e.shape[0], t))
+    if s:
+        step = max(1, int(chunk))
+        for i in range(0, e.shape[0], step):
+            block = np.clip(np.nan_to_num(e[i : i + step], nan=0.0), 0.0, 1.0)
+            port[i : i + step] = np.einsum("pts,ts->pt", block, rets) / s
+
+    equity = np.cumprod(1.0 + port, axis=1) * float(initial_capital)
+    metrics = pd.DataFrame(compute_metrics_batch(equity), columns=list(METRIC_KEYS))
+    metrics.index.name = "param"
+    return {
+        "index": close.index,
+        "symbols": list(close.columns),
+        "params": params,
+        "portfolio_returns": port,
+        "portfolio_equity": equity,
+        "metrics": metrics,
+    }
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..book import OrderBook
+from ..models import Fill, Order
+
+
+@dataclass
+class MultiSymbolPaperGateway:
+    """Çok sembollü paper gateway: sembol başına emir defteri, tek nakit hesabı.
+
+    - Emirler ``Order.symbol``'e göre kendi defterine yönlendirilir; bir bar sadece
+      o sembolün emirleriyle eşleştirilir.
+    - Pozisyonlar sembol koduna göre indeksli ``positions`` dizisinde tutulur;
+      tüm defterin mark-to-market'i tek bir nokta çarpımıdır.
+    - ``on_bars`` bir zaman damgasındaki kesitin tamamını (sembol kodu ile indeksli
+      o/h/low/c dizileri) tek çağrıda işler; sadece bekleyen emri olan semboller
+      ziyaret edilir, NaN bar (işlem yok) atlanır.
+    """
+
+    symbols: Sequence[str]
+    initial_capital: float = 100_000.0
+    fees_bps: float = 1.0
+    slippage_bps: float = 1.0
+
+    cash: float = field(init=False)
+    positions: np.ndarray = field(init=False)
+    books: list[OrderBook] = field(init=False)
+    trades: list[tuple[str, Fill]] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.symbols = tuple(self.symbols)
+        self.cash = float(self.initial_capital)
+        self.positions = np.zeros(len(self.symbols))
+        self.books = [OrderBook() for _ in self.symbols]
+        self._code = {s: i for i, s in enumerate(self.symbols)}
+        if len(self._code) != len(self.symbols):
+            raise ValueError("symbols must be unique")
+        self._where: dict[str, int] = {}  # order_id -> sembol kodu
+        self._active: set[int] = set()  # bekleyen emri olan semboller
+
+    def code(self, symbol: str) -> int:
+        try:
+            return self._code[symbol]
+        except KeyError:
+            raise KeyError(f"unknown symbol: {symbol!r}") from None
+
+    def orders(self, symbol: str | None = None) -> list[Order]:
+        """Bekleyen emirler (sembol verilmezse tüm defterler, sembol sırasıyla)."""
+        if symbol is not None:
+            return self.books[self.code(symbol)].orders()
+        return [od for book in self.books for od in book.orders()]
+
+    # API
+    def submit(self, order: Order) -> None:
+        k = self.code(order.symbol)
+        self.books[k].add(order)
+        self._where[order.id] = k
+        self._active.add(k)
+
+    def cancel(self, order_id: str) -> bool:
+        k = self._where.pop(order_id, None)
+        if k is None:
+            return False
+        ok = self.books[k].cancel(order_id) is not None
+        self._retire(k)
+        return ok
+
+    def on_bars(
+        self, o: np.ndarray, h: np.ndarray, low: np.ndarray, c: np.ndarray
+    ) -> list[tuple[str, Fill]]:
+        """Bir kesiti uygular; ``(symbol, fill)`` listesi döner (sembol koduna göre sıralı)."""
+        n = len(self.symbols)
+        if not (len(o) == len(h) == len(low) == len(c) == n):
+            raise ValueError(f"bar arrays must have length {n}")
+
+        out: list[tuple[str, Fill]] = []
+        for k in sorted(self._active):
+            ok, hk, lk, ck = float(o[k]), float(h[k]), float(low[k]), float(c[k])
+            if ok != ok or hk != hk or lk != lk:
+                continue
+            book = self.books[k]
+            fills = book.match(
+                ok, hk, lk, ck, fees_bps=self.fees_bps, slippage_bps=self.slippage_bps
+            )
+            sym = self.symbols[k]
+            for f in fills:
+                self._apply_fill(k, f)
+                out.append((sym, f))
+            self._retire(k)
+        return out
+
+    def _apply_fill(self, k: int, f: Fill) -> None:
+        """Nakit ve sembol pozisyonunu güncelle, işlemi kaydet, OCO kardeşleri iptal et."""
+        self.cash -= f.qty * f.price + (f.commission or 0.0)
+        self.positions[k] += f.qty
+        self.trades.append((self.symbols[k], f))
+        self._where.pop(f.order_id, None)
+        if f.cancel_oco_id:
+            for od in self.books[k].cancel_oco(f.cancel_oco_id):
+                self._where.pop(od.id, None)
+
+    def _retire(self, k: int) -> None:
+        if not len(self.books[k]):
+            self._active.discard(k)
+
+    # mark-to-market
+    def market_values(self, prices: np.ndarray) -> np.ndarray:
+        return self.positions * np.asarray(prices, dtype=np.float64)
+
+    def equity(self, prices: np.ndarray) -> float:
+        return self.cash + float(self.positions @ np.asarray(prices, dtype=np.float64))
+
+    def position(self, symbol: str) -> float:
+        return float(self.positions[self.code(symbol)])
+
+    def state(self, prices: np.ndarray) -> dict[str, float]:
+        return {
+            "cash": self.cash,
+            "gross": float(np.abs(self.market_values(prices)).sum()),
+            "equity": self.equity(prices),
+        }
+
+
+__all__ = ["MultiSymbolPaperGateway"]
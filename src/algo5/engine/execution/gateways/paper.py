@@ -1,9 +1,12 @@
-﻿from __future__ import annotations
+from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from ..matcher import match_order_on_bar
-from ..models import Fill, Order
+import numpy as np
+
+from ..book import OrderBook
+from ..models import Fill, Order, OrderType
+from ..vector_matcher import OrderTable, match_orders_on_bars
 
 
 @dataclass
@@ -14,15 +17,23 @@ class PaperGateway:
 
     cash: float = field(init=False)
     position: float = field(init=False, default=0.0)
-    orders: list[Order] = field(init=False, default_factory=list)
+    book: OrderBook = field(init=False, default_factory=OrderBook)
     trades: list[Fill] = field(init=False, default_factory=list)
 
     def __post_init__(self) -> None:
         self.cash = float(self.initial_capital)
 
+    @property
+    def orders(self) -> list[Order]:
+        """Bekleyen emirler (gönderim sırasıyla)."""
+        return self.book.orders()
+
     # API
     def submit(self, order: Order) -> None:
-        self.orders.append(order)
+        self.book.add(order)
+
+    def cancel(self, order_id: str) -> bool:
+        return self.book.cancel(order_id) is not None
 
     def on_bar(
         self,
@@ -32,37 +43,19 @@ class PaperGateway:
         c: float | None = None,
         **kwargs,
     ) -> list[Fill]:
-        # Back-compat: allow callers to pass low=... instead of low=...
+        # Back-compat: allow callers to pass l=... instead of low=...
         if low is None and "l" in kwargs:
             low = kwargs["l"]
 
         if low is None:
-            raise TypeError(
-                "on_bar(): required arg 'low' not provided (use 'low=...' or 'low=...')."
-            )
+            raise TypeError("on_bar(): required arg 'low' not provided (use 'low=...' or 'l=...').")
         if c is None:
             raise TypeError("on_bar(): required arg 'c' not provided (use 'c=...').")
 
-        fills: list[Fill] = []
-        remaining: list[Order] = []
-
-        for order in self.orders:
-            fill = match_order_on_bar(
-                order,
-                o=o,
-                h=h,
-                low=low,
-                c=c,
-                fees_bps=self.fees_bps,
-                slippage_bps=self.slippage_bps,
-            )
-            if fill is not None:
-                fills.append(fill)
-            else:
-                remaining.append(order)
-
-        # Filled olmayanlar kuyrukta kalsÃ„Â±n
-        self.orders = remaining
+        # Sadece tetik fiyatı bu barın aralığına düşen emirler eşleştirilir
+        fills = self.book.match(
+            o, h, low, c, fees_bps=self.fees_bps, slippage_bps=self.slippage_bps
+        )
 
         # Filleri hesap/pozisyona uygula
         for f in fills:
@@ -70,12 +63,79 @@ class PaperGateway:
 
         return fills
 
+    def replay(
+        self, o: np.ndarray, h: np.ndarray, low: np.ndarray, c: np.ndarray
+    ) -> list[tuple[int, Fill]]:
+        """Bekleyen emirleri bar dizileri üzerinde oynatır; ``(bar, fill)`` listesi döner.
+
+        Sonuç ``on_bar``'ı her bar için çağırmakla aynıdır. Defterdeki tüm emirlerin
+        tipi ``OrderType`` ise vektörize kernel kullanılır (bar atlama); aksi halde bar
+        bar döngüye düşülür.
+        """
+        pending = self.book.orders()
+        if not all(isinstance(od.type, OrderType) for od in pending):
+            return [
+                (i, f)
+                for i in range(len(o))
+                for f in self.on_bar(float(o[i]), float(h[i]), low=float(low[i]), c=float(c[i]))
+            ]
+
+        # Gateway IOC/FOK'u GTC gibi kuyrukta tutar -> kernel'de de tek bar sınırı yok
+        res = match_orders_on_bars(
+            o,
+            h,
+            low,
+            c,
+            OrderTable.from_orders(pending, anchors=self.book.trailing.snapshot()),
+            fees_bps=self.fees_bps,
+            slippage_bps=self.slippage_bps,
+            ioc_single_bar=False,
+        )
+        # OCO: grubun ilk fill barından sonraki fill'ler kardeş iptaliyle geçersiz olur
+        first_bar: dict[str, int] = {}
+        for k in np.flatnonzero(res.filled):
+            oco = pending[k].oco_id
+            if oco:
+                first_bar[oco] = min(first_bar.get(oco, int(res.fill_bar[k])), int(res.fill_bar[k]))
+
+        hits: list[tuple[int, int]] = []
+        for k in np.flatnonzero(res.filled):
+            bar, oco = int(res.fill_bar[k]), pending[k].oco_id
+            if not oco or first_bar[oco] == bar:
+                hits.append((bar, int(k)))
+        hits.sort()
+
+        out: list[tuple[int, Fill]] = []
+        for _, k in hits:
+            self.book.cancel(pending[k].id)
+        for bar, k in hits:
+            od = pending[k]
+            fill = Fill(
+                order_id=od.id,
+                qty=float(res.qty[k]),
+                price=float(res.price[k]),
+                commission=float(res.commission[k]),
+                slippage_bps=self.slippage_bps if od.type is OrderType.MARKET else 0.0,
+                cancel_oco_id=od.oco_id,
+            )
+            self._apply_fill(fill)
+            out.append((bar, fill))
+
+        # Dolmayan trailing emirlerin peak/trough'u bar döngüsündeki gibi ilerlesin
+        h_arr, low_arr = np.asarray(h, dtype=np.float64), np.asarray(low, dtype=np.float64)
+        for od in self.book.orders():
+            if od.type is OrderType.TRAILING_STOP:
+                self.book.trailing.extend(od, h_arr, low_arr)
+        return out
+
     def _apply_fill(self, f: Fill) -> None:
-        """Fill'i uygula: nakit ve pozisyonu gÃƒÂ¼ncelle, iÃ…Å¸lemi kaydet."""
+        """Fill'i uygula: nakit ve pozisyonu güncelle, işlemi kaydet, OCO kardeşleri iptal et."""
         commission = getattr(f, "commission", 0.0) or 0.0
         self.cash -= f.qty * f.price + commission
         self.position += f.qty
         self.trades.append(f)
+        if f.cancel_oco_id:
+            self.book.cancel_oco(f.cancel_oco_id)
 
     def equity(self, last_price: float) -> float:
         return self.cash + self.position * last_price
@@ -87,25 +147,3 @@ class PaperGateway:
             "pos": self.position,
             "equity": self.equity(last_price),
         }
-
-
-# === OCO sibling-cancel after fill (algo5) ===
-def _algo5_cancel_oco_in_queue(self, cancel_oco_id) -> None:
-    if not cancel_oco_id:
-        return
-    qs = getattr(self, "orders", None)
-    if qs is None:
-        return
-    # kalan bekleyen emirlerden aynı oco_id'li kardeşleri sil
-    self.orders = [o for o in qs if getattr(o, "oco_id", None) != cancel_oco_id]
-
-
-if "PaperGateway" in globals() and hasattr(PaperGateway, "_apply_fill"):
-    _algo5_orig_apply_fill = PaperGateway._apply_fill
-
-    def _algo5_wrapped_apply_fill(self, fill):
-        _algo5_orig_apply_fill(self, fill)
-        cancel_oco_id = getattr(fill, "cancel_oco_id", None)
-        _algo5_cancel_oco_in_queue(self, cancel_oco_id)
-
-    PaperGateway._apply_fill = _algo5_wrapped_apply_fill  # type: ignore[method-assign]
@@ -0,0 +1,139 @@
+"""Artımlı (streaming) backtest: yeni barlar eklenirken geçmiş yeniden hesaplanmaz.
+
+``backtest_vectorized`` ile aynı semantik (pozisyon = bir önceki barın sinyali,
+maliyet = |Δpozisyon| * (komisyon + slippage)) sembol başına vektör state ile taşınır:
+son close, son sinyal/pozisyon, NAV, koşan tepe, max drawdown ve getiri için Welford
+akümülatörleri (blok bazlı Chan birleştirmesi). ``append`` maliyeti O(yeni bar).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .engine import TradeCosts
+
+_ANN = np.sqrt(252)
+
+
+class IncrementalBacktest:
+    """Tek seri (``n_symbols=None``) ya da (zaman x sembol) panel için artımlı backtest.
+
+    ``append(close, signal)`` yeni barların equity'sini döner; ``metrics()``
+    ``compute_metrics(equity)``'nin tüm geçmiş üzerinde vereceği değerleri O(1)'de üretir.
+    Pandas girdisi (Series / DataFrame) verilirse çıktı aynı indeksle döner.
+    """
+
+    def __init__(self, costs: TradeCosts | None = None, n_symbols: int | None = None) -> None:
+        self.costs = costs or TradeCosts()
+        self._scalar = n_symbols is None
+        s = 1 if n_symbols is None else int(n_symbols)
+        self.n_bars = 0
+        self.last_close = np.full(s, np.nan)
+        self.last_signal = np.zeros(s)  # bir sonraki barın pozisyonu
+        self.position = np.zeros(s)
+        self.equity = np.ones(s)
+        self.peak = np.ones(s)
+        self.max_dd = np.zeros(s)
+        self.first_equity = np.ones(s)
+        # equity getirileri (compute_metrics: pct_change().dropna()) için Welford
+        self._n = 0
+        self._mean = np.zeros(s)
+        self._m2 = np.zeros(s)
+
+    @property
+    def n_symbols(self) -> int:
+        return int(self.equity.shape[0])
+
+    def append(self, close: Any, signal: Any) -> Any:
+        """Yeni barları işler; yeni barların equity'sini (girdi şeklinde) döner."""
+        index = columns = None
+        if isinstance(close, pd.DataFrame | pd.Series):
+            index = close.index
+            columns = close.columns if isinstance(close, pd.DataFrame) else None
+            signal = pd.DataFrame(signal) if columns is not None else pd.Series(signal)
+            signal = signal.reindex(index).to_numpy(dtype=float)
+            close = close.to_numpy(dtype=float)
+
+        c = np.asarray(close, dtype=np.float64).reshape(len(close), -1)
+        sig = np.asarray(signal, dtype=np.float64).reshape(len(c), -1)
+        if c.shape[1] != self.n_symbols or sig.shape != c.shape:
+            raise ValueError(
+                f"expected (k, {self.n_symbols}) close/signal, got {c.shape}/{sig.shape}"
+            )
+        eq = self._step(c, sig)
+
+        if self._scalar:
+            out = eq[:, 0]
+            return out if index is None else pd.Series(out, index=index)
+        return eq if index is None else pd.DataFrame(eq, index=index, columns=columns)
+
+    def _step(self, c: np.ndarray, sig: np.ndarray) -> np.ndarray:
+        k = c.shape[0]
+        if k == 0:
+            return np.empty((0, self.n_symbols))
+
+        prev_c = np.vstack([self.last_close[None], c[:-1]])
+        ret = np.nan_to_num(c / prev_c - 1.0, nan=0.0, posinf=0.0, neginf=0.0)
+        pos = np.vstack([self.last_signal[None], sig[:-1]])
+        pos = np.nan_to_num(pos, nan=0.0)
+        prev_pos = np.vstack([self.position[None], pos[:-1]])
+        trades = np.abs(pos - prev_pos)
+        strat = pos * ret - trades * (self.costs.commission + self.costs.slippage_bps / 10000.0)
+
+        eq = self.equity * np.cumprod(1.0 + strat, axis=0)
+        prev_eq = np.vstack([self.equity[None], eq[:-1]])
+        if self.n_bars == 0:
+            self.first_equity = eq[0].copy()
+            rets = eq[1:] / prev_eq[1:] - 1.0
+        else:
+            rets = eq / prev_eq - 1.0
+        self._merge(rets)
+
+        run_peak = np.maximum.accumulate(np.vstack([self.peak[None], eq]), axis=0)[1:]
+        self.max_dd = np.minimum(self.max_dd, ((eq - run_peak) / run_peak).min(axis=0))
+        self.peak = run_peak[-1]
+
+        self.n_bars += k
+        self.last_close = c[-1].copy()
+        self.last_signal = sig[-1].copy()
+        self.position = pos[-1].copy()
+        self.equity = eq[-1].copy()
+        return eq
+
+    def _merge(self, rets: np.ndarray) -> None:
+        """Blok ortalama/M2'yi mevcut akümülatörlerle birleştirir (Chan et al.)."""
+        nb = rets.shape[0]
+        if nb == 0:
+            return
+        mb = rets.mean(axis=0)
+        m2b = ((rets - mb) ** 2).sum(axis=0)
+        na = self._n
+        n = na + nb
+        delta = mb - self._mean
+        self._mean = self._mean + delta * (nb / n)
+        self._m2 = self._m2 + m2b + delta**2 * (na * nb / n)
+        self._n = n
+
+    def metrics(self) -> dict[str, Any]:
+        """``compute_metrics`` ile aynı anahtarlar (panelde sembol başına dizi)."""
+        s = self.n_symbols
+        n = self._n
+        std = np.sqrt(self._m2 / (n - 1)) if n >= 2 else np.full(s, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(std > 0, self._mean / std * _ANN, 0.0)
+        vol = std * _ANN if n else np.zeros(s)
+        if self.n_bars:
+            total = self.equity / self.first_equity - 1.0
+            mdd = self.max_dd
+        else:
+            total, mdd = np.zeros(s), np.zeros(s)
+        out = {"sharpe": sharpe, "max_drawdown": mdd, "total_return": total, "vol": vol}
+        if self._scalar:
+            return {key: float(v[0]) for key, v in out.items()}
+        return out
+
+
+__all__ = ["IncrementalBacktest"]
@@ -1,8 +1,9 @@
 ﻿from __future__ import annotations
-from .trailing_oco import wrap_matcher as _algo5_wrap  # noqa: E402
 
 from algo5.engine.execution.models import TIF, Fill, Order, OrderType, Side
 
+from .trailing_oco import TrailingState
+
 
 def _commission(price: float, qty: float, fees_bps: float) -> float:
     # \"\"\"Basit komisyon hesaplamasÄ± (bps).\"\"\"
@@ -18,6 +19,7 @@ def match_order_on_bar(  # noqa: C901
     *,
     fees_bps: float = 0.0,
     slippage_bps: float = 0.0,
+    trail: TrailingState | None = None,
     **kwargs,
 ) -> Fill | None:
     # \"\"\"Tek bar Ã¼zerinde order eÅŸleÅŸtirme.
@@ -50,6 +52,7 @@ def match_order_on_bar(  # noqa: C901
             price=px,
             commission=_commission(px, order.qty, fees_bps),
             slippage_bps=slippage_bps,
+            cancel_oco_id=order.oco_id,
         )
 
     # LIMIT
@@ -63,6 +66,7 @@ def match_order_on_bar(  # noqa: C901
                 qty=q,
                 price=px,
                 commission=_commission(px, order.qty, fees_bps),
+                cancel_oco_id=order.oco_id,
             )
         # IOC/FOK ise bar sonunda yoksa dÃ¼ÅŸer
         if order.tif in (TIF.IOC, TIF.FOK):
@@ -81,6 +85,7 @@ def match_order_on_bar(  # noqa: C901
                 qty=q,
                 price=px,
                 commission=_commission(px, order.qty, fees_bps),
+                cancel_oco_id=order.oco_id,
             )
         if order.tif in (TIF.IOC, TIF.FOK):
             return None
@@ -107,13 +112,21 @@ def match_order_on_bar(  # noqa: C901
                 qty=q,
                 price=px,
                 commission=_commission(px, order.qty, fees_bps),
+                cancel_oco_id=order.oco_id,
             )
         return None
 
-    return None
-
+    # TRAILING STOP: referans (peak/trough) çağıranın TrailingState'inde tutulur
+    if order.type == OrderType.TRAILING_STOP and trail is not None:
+        px = trail.step(order, o, h, low)
+        if px is not None:
+            return Fill(
+                order_id=order.id,
+                qty=q,
+                price=px,
+                commission=_commission(px, order.qty, fees_bps),
+                cancel_oco_id=order.oco_id,
+            )
+        return None
 
-# -- Trailing/OCO wrapper activation --
-if "_ALGO5_TRAIL_OCO_PATCHED" not in globals():
-    match_order_on_bar = _algo5_wrap(match_order_on_bar)
-    _ALGO5_TRAIL_OCO_PATCHED = True
+    return None
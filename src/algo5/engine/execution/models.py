@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import itertools
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from uuid import uuid4
@@ -15,6 +17,10 @@ class OrderType(Enum):
     LIMIT = auto()
     STOP = auto()
     STOP_LIMIT = auto()
+    TRAILING_STOP = auto()
+
+    def __str__(self) -> str:
+        return self.name
 
 
 class TIF(Enum):
@@ -23,7 +29,40 @@ class TIF(Enum):
     FOK = auto()
 
 
-@dataclass
+# ---- order id allocation ----
+class MonotonicIds:
+    """Artan sayaç tabanlı id üreticisi ("o1", "o2", ...); uuid4'e göre çok ucuz."""
+
+    __slots__ = ("prefix", "_next")
+
+    def __init__(self, prefix: str = "", start: int = 1) -> None:
+        self.prefix = prefix
+        self._next = itertools.count(start).__next__
+
+    def __call__(self) -> str:
+        return f"{self.prefix}{self._next()}"
+
+
+def _uuid_hex() -> str:
+    return uuid4().hex
+
+
+_order_id_factory: Callable[[], str] = _uuid_hex
+
+
+def set_order_id_factory(factory: Callable[[], str] | None) -> Callable[[], str]:
+    """``Order.id`` üreticisini değiştirir (None -> uuid4); öncekini döner."""
+    global _order_id_factory
+    prev = _order_id_factory
+    _order_id_factory = factory or _uuid_hex
+    return prev
+
+
+def _new_order_id() -> str:
+    return _order_id_factory()
+
+
+@dataclass(slots=True)
 class Order:
     side: Side
     qty: float
@@ -32,13 +71,19 @@ class Order:
     limit_price: float | None = None
     stop_price: float | None = None
     tif: TIF = TIF.GTC
-    id: str = field(default_factory=lambda: uuid4().hex)
+    id: str = field(default_factory=_new_order_id)
+    # bracket / OCO / trailing alanları (build_bracket doldurur)
+    oco_id: str | None = None
+    parent_id: str | None = None
+    trail_amount: float | None = None
+    trail_pct: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Fill:
     order_id: str
     qty: float
     price: float
     commission: float = 0.0
     slippage_bps: float = 0.0
+    cancel_oco_id: str | None = None  # dolarsa aynı oco_id'li kardeş emirler iptal edilir
@@ -1,107 +1,115 @@
-﻿from __future__ import annotations
-from contextlib import suppress
-
-"""Lightweight trailing-stop + OCO wrapper for ``match_order_on_bar``.
-Keeps per-order peak/trough in a module-level dict, decorates the base
-matcher to inject trailing behaviour, and cancels OCO siblings after a fill.
-The wrapper is lenient: it passes through *args/**kwargs to the original
-matcher and only uses kwargs ``o``, ``h``, ``low`` (or ``l``) and ``c`` if present.
+"""Trailing-stop durumu ve vektörize trailing değerlendiricisi.
+
+Semantik (bar başına):
+
+- SELL trailing (long çıkışı): ``peak = max(peak, high)``, seviye
+  ``peak * (1 - trail_pct)`` ya da ``peak - trail_amount``; ``open <= seviye`` veya
+  ``low <= seviye`` ise ``min(open, seviye)`` fiyatından dolar.
+- BUY trailing (short çıkışı): simetrik olarak ``trough``/``low``/``high`` ile.
+
+Referans (peak/trough) emir bazında ``TrailingState`` içinde tutulur; durumun sahibi
+``OrderBook``'tur ve emir dolunca/iptal edilince silinir.
 """
 
-_TRAIL_STATE: dict[str, dict[str, float]] = {}  # order_id -> {peak|trough}
+from __future__ import annotations
+
+import numpy as np
+
+from .models import Order, Side
+
+
+def _level(anchor: float, is_sell: bool, amount: float | None, pct: float | None) -> float | None:
+    if pct:
+        return anchor * (1.0 - pct) if is_sell else anchor * (1.0 + pct)
+    if amount:
+        return anchor - amount if is_sell else anchor + amount
+    return None
+
+
+class TrailingState:
+    """Emir id'si -> peak (SELL) / trough (BUY) referansı."""
+
+    __slots__ = ("_anchor",)
 
+    def __init__(self) -> None:
+        self._anchor: dict[str, float] = {}
 
-def _oid(order) -> str:
-    return str(getattr(order, "id", repr(order)))
+    def __len__(self) -> int:
+        return len(self._anchor)
 
+    def __contains__(self, order_id: object) -> bool:
+        return order_id in self._anchor
 
-def _side(order) -> str:
-    return str(getattr(order, "side", "SELL")).upper()
+    def anchor(self, order_id: str) -> float | None:
+        return self._anchor.get(order_id)
 
+    def snapshot(self) -> dict[str, float]:
+        return dict(self._anchor)
 
-def _update_anchor(order, high: float, low: float) -> None:
-    st = _TRAIL_STATE.setdefault(_oid(order), {})
-    s = _side(order)
-    if "SELL" in s or "LONG" in s:  # long exit
-        st["peak"] = max(high, st.get("peak", high))
-    else:  # short exit
-        st["trough"] = min(low, st.get("trough", low) if "trough" in st else low)
+    def discard(self, order_id: str) -> None:
+        self._anchor.pop(order_id, None)
 
+    def extend(self, order: Order, h: np.ndarray, low: np.ndarray) -> None:
+        """Tetiklenmeyen bir emrin referansını bar dizisiyle ilerletir (replay sonrası)."""
+        if not len(h):
+            return
+        prev = self._anchor.get(order.id)
+        if order.side == Side.SELL:
+            x = float(np.max(h))
+            self._anchor[order.id] = x if prev is None or x > prev else prev
+        else:
+            x = float(np.min(low))
+            self._anchor[order.id] = x if prev is None or x < prev else prev
 
-def _calc_level(order):
-    st = _TRAIL_STATE.get(_oid(order), {})
-    pct = getattr(order, "trail_pct", None)
-    amt = getattr(order, "trail_amount", None)
-    s = _side(order)
+    def step(self, order: Order, o: float, h: float, low: float) -> float | None:
+        """Referansı bu barla günceller; tetiklenirse fill fiyatını döner."""
+        is_sell = order.side == Side.SELL
+        prev = self._anchor.get(order.id)
+        if is_sell:
+            anchor = h if prev is None or h > prev else prev
+        else:
+            anchor = low if prev is None or low < prev else prev
+        self._anchor[order.id] = anchor
 
-    if "SELL" in s or "LONG" in s:
-        peak = st.get("peak")
-        if peak is None:
+        lvl = _level(anchor, is_sell, order.trail_amount, order.trail_pct)
+        if lvl is None:
             return None
-        if pct:
-            return float(peak) * (1.0 - float(pct))
-        if amt:
-            return float(peak) - float(amt)
+        if is_sell:
+            return min(o, lvl) if (o <= lvl or low <= lvl) else None
+        return max(o, lvl) if (o >= lvl or h >= lvl) else None
+
+
+def trailing_trigger(
+    o: np.ndarray,
+    h: np.ndarray,
+    low: np.ndarray,
+    side: Side,
+    *,
+    trail_amount: float | None = None,
+    trail_pct: float | None = None,
+    anchor: float | None = None,
+) -> tuple[int, float]:
+    """Trailing stop'u bar dizisi üzerinde tek geçişte değerlendirir.
+
+    Koşan peak/trough ``maximum/minimum.accumulate`` ile hesaplanır; ilk tetik barı ve
+    fill fiyatı döner (tetik yoksa ``(-1, nan)``). ``anchor`` daha önceki barlardan
+    taşınan referanstır. ``TrailingState.step``'in bar bar uygulanmasıyla aynı sonucu verir.
+    """
+    is_sell = side == Side.SELL
+    if not len(o) or not (trail_pct or trail_amount):
+        return -1, float("nan")
+    o, h, low = (np.asarray(x, dtype=np.float64) for x in (o, h, low))
+    if is_sell:
+        run = np.maximum.accumulate(h if anchor is None else np.maximum(h, anchor))
     else:
-        trough = st.get("trough")
-        if trough is None:
-            return None
-        if pct:
-            return float(trough) * (1.0 + float(pct))
-        if amt:
-            return float(trough) + float(amt)
-    return None
+        run = np.minimum.accumulate(low if anchor is None else np.minimum(low, anchor))
+    lvl = _level(run, is_sell, trail_amount, trail_pct)  # type: ignore[arg-type]
+    hit = ((o <= lvl) | (low <= lvl)) if is_sell else ((o >= lvl) | (h >= lvl))
+    i = int(hit.argmax())
+    if not hit[i]:
+        return -1, float("nan")
+    px = min(o[i], lvl[i]) if is_sell else max(o[i], lvl[i])  # type: ignore[index]
+    return i, float(px)
 
 
-def _try_fill_trailing(order, o: float, high: float, low: float):
-    lvl = _calc_level(order)
-    if lvl is None:
-        return False, None
-    s = _side(order)
-    if "SELL" in s or "LONG" in s:
-        if (o <= lvl) or (low <= lvl):
-            return True, float(min(o, lvl))
-    else:
-        if (o >= lvl) or (high >= lvl):
-            return True, float(max(o, lvl))
-    return False, None
-
-
-def wrap_matcher(orig_match):
-    """Return a wrapper around ``orig_match`` (match_order_on_bar)."""
-
-    def _wrapped(order, *args, **kwargs):
-        # kwargs’tan OHLC çek (bazı çağrılarda low 'l' olarak gelebilir)
-        o = kwargs.get("o")
-        h = kwargs.get("h")
-        low = kwargs.get("low", kwargs.get("l"))
-        c = kwargs.get("c")
-
-        # önce orijinal eşleştiriciyi çağır
-        res = orig_match(order, *args, **kwargs)
-
-        # trailing stop sadece OHLC mevcutsa kontrol edilir
-        if (
-            o is not None
-            and h is not None
-            and low is not None
-            and c is not None
-            and str(getattr(order, "type", "")).upper() == "TRAILING_STOP"
-        ):
-            _update_anchor(order, float(h), float(low))
-            filled, px = _try_fill_trailing(order, float(o), float(h), float(low))
-            if filled:
-                with suppress(Exception):
-                    res.filled = True
-                    res.price = px
-                    if getattr(order, "oco_id", None):
-                        res.cancel_oco_id = order.oco_id
-                return res
-
-        # OCO: vanilla fill olduysa kardeşi iptal ettir
-        if getattr(res, "filled", False) and getattr(order, "oco_id", None):
-            with suppress(Exception):
-                res.cancel_oco_id = order.oco_id
-        return res
-
-    return _wrapped
+__all__ = ["TrailingState", "trailing_trigger"]
@@ -0,0 +1,205 @@
+"""Vektörize emir eşleştirme: bir emir tablosunu OHLC dizileri üzerinde tek seferde çözer.
+
+``match_order_on_bar`` ile aynı MARKET/LIMIT/STOP/STOP_LIMIT/TRAILING_STOP semantiği
+(stop'larda gap koruması dahil) kullanılır; her emir için ilk fill barı, fiyatı ve
+komisyonu döner.
+Arama, tüm aktif emirler için aynı anda ve giderek büyüyen pencerelerle yapılır
+(galloping); böylece maliyet "fill'e kadar olan mesafe" ile orantılıdır.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .models import TIF, Order, OrderType, Side
+from .trailing_oco import trailing_trigger
+
+_UNKNOWN = -1
+_MAX_CELLS = 1 << 22  # bir arama turunda en fazla (emir x bar) hücre
+
+
+@dataclass(frozen=True)
+class OrderTable:
+    """Emirlerin kolon bazlı gösterimi (``OrderType``/``TIF`` değerleri int kodlu)."""
+
+    type: np.ndarray  # int16: OrderType.value, bilinmeyen -> -1
+    side: np.ndarray  # float64: +1 BUY / -1 SELL
+    qty: np.ndarray  # float64 (mutlak)
+    limit: np.ndarray  # float64, yoksa NaN
+    stop: np.ndarray  # float64, yoksa NaN
+    tif: np.ndarray  # int16: TIF.value
+    submit_bar: np.ndarray  # int64: emrin ilk değerlendirileceği bar
+    trail_amount: np.ndarray  # float64, yoksa NaN
+    trail_pct: np.ndarray  # float64, yoksa NaN
+    anchor: np.ndarray  # float64: trailing peak/trough (önceki barlardan), yoksa NaN
+
+    def __len__(self) -> int:
+        return int(self.type.shape[0])
+
+    @classmethod
+    def from_orders(
+        cls,
+        orders: Sequence[Order],
+        submit_bar: int | Sequence[int] = 0,
+        anchors: Mapping[str, float] | None = None,
+    ) -> OrderTable:
+        """``anchors``: trailing emirler için id -> taşınan peak/trough."""
+        n = len(orders)
+        anchors = anchors or {}
+
+        def price(x: float | None) -> float:
+            return np.nan if x is None else float(x)
+
+        return cls(
+            type=np.array(
+                [o.type.value if isinstance(o.type, OrderType) else _UNKNOWN for o in orders],
+                dtype=np.int16,
+            ),
+            side=np.array([1.0 if o.side == Side.BUY else -1.0 for o in orders]),
+            qty=np.array([float(o.qty) for o in orders]),
+            limit=np.array([price(o.limit_price) for o in orders]),
+            stop=np.array([price(o.stop_price) for o in orders]),
+            tif=np.array([o.tif.value for o in orders], dtype=np.int16),
+            submit_bar=np.broadcast_to(np.asarray(submit_bar, dtype=np.int64), (n,)).copy(),
+            trail_amount=np.array([price(o.trail_amount) for o in orders]),
+            trail_pct=np.array([price(o.trail_pct) for o in orders]),
+            anchor=np.array([price(anchors.get(o.id)) for o in orders]),
+        )
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    fill_bar: np.ndarray  # int64, dolmadıysa -1
+    price: np.ndarray  # float64, dolmadıysa NaN
+    qty: np.ndarray  # float64 yönlü (BUY +, SELL -), dolmadıysa 0
+    commission: np.ndarray  # float64
+
+    @property
+    def filled(self) -> np.ndarray:
+        return self.fill_bar >= 0
+
+
+def _first_hit(
+    cond: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    rows: np.ndarray,
+    start: np.ndarray,
+    stop: np.ndarray,
+    n_bars: int,
+) -> np.ndarray:
+    """Her satır için [start, stop) aralığında ``cond``'un ilk True olduğu bar (yoksa -1)."""
+    out = np.full(rows.shape[0], -1, dtype=np.int64)
+    pos = start.astype(np.int64).copy()
+    active = np.flatnonzero(pos < stop)
+    width = 16
+    while active.size:
+        width = max(1, min(width, _MAX_CELLS // active.size))
+        idx = pos[active, None] + np.arange(width)
+        inside = idx < stop[active, None]
+        hit = cond(rows[active], np.minimum(idx, n_bars - 1)) & inside
+        any_hit = hit.any(axis=1)
+        first = hit.argmax(axis=1)
+        done = active[any_hit]
+        out[done] = idx[any_hit, first[any_hit]]
+        pos[active] += width
+        active = active[~any_hit]
+        active = active[pos[active] < stop[active]]
+        width *= 2
+    return out
+
+
+def match_orders_on_bars(  # noqa: C901
+    o: np.ndarray,
+    h: np.ndarray,
+    low: np.ndarray,
+    c: np.ndarray,
+    orders: OrderTable,
+    *,
+    fees_bps: float = 0.0,
+    slippage_bps: float = 0.0,
+    ioc_single_bar: bool = True,
+) -> MatchResult:
+    """Emir tablosunu OHLC dizileri üzerinde eşleştirir.
+
+    - Emir ``submit_bar`` barından itibaren değerlendirilir; MARKET o barın open'ından dolar.
+    - ``ioc_single_bar=True`` ise IOC/FOK emirler sadece gönderildiği barda denenir
+      (``PaperGateway`` bunları GTC gibi kuyrukta tuttuğu için replay'de False verilir).
+    - ``c`` semantiğe etki etmez; imza ``match_order_on_bar`` ile simetrik tutulur.
+    """
+    o, h, low = (np.asarray(x, dtype=np.float64) for x in (o, h, low))
+    n_bars, n = o.shape[0], len(orders)
+    fill_bar = np.full(n, -1, dtype=np.int64)
+    price = np.full(n, np.nan)
+    if n == 0 or n_bars == 0:
+        return MatchResult(fill_bar, price, np.zeros(n), np.zeros(n))
+
+    t, side, qty = orders.type, orders.side, orders.qty
+    lim, stp, sub = orders.limit, orders.stop, orders.submit_bar
+    single = np.isin(orders.tif, (TIF.IOC.value, TIF.FOK.value)) if ioc_single_bar else False
+    end = np.where(single, np.minimum(sub + 1, n_bars), n_bars).astype(np.int64)
+    live = (sub >= 0) & (sub < n_bars)
+
+    # MARKET -> gönderim barının open'ı (+ slippage)
+    mk = np.flatnonzero(live & (t == OrderType.MARKET.value))
+    fill_bar[mk] = sub[mk]
+    price[mk] = o[sub[mk]] * (1 + (slippage_bps / 1e4) * side[mk])
+
+    def trig(rows: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        s = stp[rows, None]
+        return np.where(side[rows, None] > 0, h[idx] >= s, low[idx] <= s)
+
+    def crossed(rows: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        lv = lim[rows, None]
+        return (low[idx] <= lv) & (lv <= h[idx])
+
+    def trig_and_crossed(rows: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        return trig(rows, idx) & crossed(rows, idx)
+
+    groups: list[tuple[OrderType, Callable[[np.ndarray, np.ndarray], np.ndarray]]] = [
+        (OrderType.LIMIT, crossed),
+        (OrderType.STOP, trig),
+        (OrderType.STOP_LIMIT, trig_and_crossed),
+    ]
+    for otype, cond in groups:
+        rows = np.flatnonzero(live & (t == otype.value))
+        if not rows.size:
+            continue
+        bars = _first_hit(cond, rows, sub[rows], end[rows], n_bars)
+        ok = bars >= 0
+        rows, bars = rows[ok], bars[ok]
+        fill_bar[rows] = bars
+        if otype is OrderType.STOP:
+            # Gap koruması: BUY max(o, S), SELL min(o, S)
+            price[rows] = np.where(
+                side[rows] > 0, np.maximum(o[bars], stp[rows]), np.minimum(o[bars], stp[rows])
+            )
+        else:
+            price[rows] = lim[rows]
+
+    # TRAILING_STOP: koşan peak/trough emre özgü -> emir başına tek geçiş
+    def opt(x: float) -> float | None:
+        return None if x != x else float(x)
+
+    for k in np.flatnonzero(live & (t == OrderType.TRAILING_STOP.value)):
+        s, e = sub[k], end[k]
+        i, px = trailing_trigger(
+            o[s:e],
+            h[s:e],
+            low[s:e],
+            Side.BUY if side[k] > 0 else Side.SELL,
+            trail_amount=opt(orders.trail_amount[k]),
+            trail_pct=opt(orders.trail_pct[k]),
+            anchor=opt(orders.anchor[k]),
+        )
+        if i >= 0:
+            fill_bar[k], price[k] = s + i, px
+
+    filled = fill_bar >= 0
+    signed = np.where(filled, side * qty, 0.0)
+    commission = np.where(filled, np.abs(price * qty) * (fees_bps / 1e4), 0.0)
+    return MatchResult(fill_bar, price, signed, commission)
+
+
+__all__ = ["OrderTable", "MatchResult", "match_orders_on_bars"]
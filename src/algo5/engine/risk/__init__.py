@@ -1,5 +1,5 @@
-﻿from .chain import RiskChain
+﻿from .chain import CompiledRiskChain, RiskChain
 from .rules import Rule, VolTargetRule
 from .sizer import Sizer
 
-__all__ = ["RiskChain", "Rule", "VolTargetRule", "Sizer"]
+__all__ = ["RiskChain", "CompiledRiskChain", "Rule", "VolTargetRule", "Sizer"]
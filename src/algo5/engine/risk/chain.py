@@ -1,8 +1,28 @@
-﻿from __future__ import annotations
+from __future__ import annotations
+
+import inspect
+from typing import Any
+
+import numpy as np
 import pandas as pd
-from .rules import Rule
+
+from .rules import (
+    CoolDownRule,
+    DrawdownGuardRule,
+    FloorCapRule,
+    MaxPositionRule,
+    Rule,
+    VolTargetRule,
+)
 from .sizer import Sizer
 
+# apply_matrix'i olan yerleşik kurallar (alt sınıflar Series yoluna düşer)
+_MATRIX_RULES = (VolTargetRule, MaxPositionRule, FloorCapRule, CoolDownRule, DrawdownGuardRule)
+
+
+def _takes_context(rule: Any) -> bool:
+    return len(inspect.signature(rule.apply).parameters) >= 3
+
 
 class RiskChain:
     def __init__(self, sizer: Sizer, rules: list[Rule] | None = None):
@@ -12,8 +32,91 @@ class RiskChain:
     def add(self, rule: Rule) -> None:
         self.rules.append(rule)
 
-    def run(self, returns: pd.Series, signal: pd.Series) -> pd.Series:
+    def run(self, returns: pd.Series, signal: pd.Series, context: dict | None = None) -> pd.Series:
         w = self.sizer.size(returns, signal)
         for r in self.rules:
-            w = r.apply(returns, w)
+            if context is not None and _takes_context(r):
+                w = r.apply(returns, w, context)
+            else:
+                w = r.apply(returns, w)
         return w.clip(0.0, 1.0)
+
+    def compile(self) -> CompiledRiskChain:
+        return CompiledRiskChain(self)
+
+    def run_matrix(
+        self, returns: Any, signal: Any, context: dict | None = None
+    ) -> np.ndarray | pd.DataFrame:
+        """(zaman x sembol) matris üzerinde ``run``; bkz. ``CompiledRiskChain``."""
+        return self.compile().run(returns, signal, context)
+
+
+class CompiledRiskChain:
+    """``RiskChain``'i (T, S) ağırlık matrisi üzerinde önceden ayrılmış tamponlarla koşturur.
+
+    Yerleşik sizer ve kurallar NumPy ile yerinde uygulanır; özel kurallar (ve alt
+    sınıflar) sütun başına eski Series yoluna düşer. Sonuç her sütun için
+    ``RiskChain.run`` ile aynıdır. Tamponlar şekil başına saklanır ve çağrılar arasında
+    yeniden kullanılır (dönen dizi bir sonraki çağrıda üzerine yazılır; ``out`` verilebilir).
+    """
+
+    def __init__(self, chain: RiskChain) -> None:
+        self.chain = chain
+        self._fast_sizer = type(chain.sizer).size is Sizer.size
+        self._steps = [(type(r) in _MATRIX_RULES, r) for r in chain.rules]
+        self._buffers: dict[tuple[int, ...], tuple[np.ndarray, np.ndarray]] = {}
+
+    def _buffer(self, shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+        buf = self._buffers.get(shape)
+        if buf is None:
+            buf = self._buffers[shape] = (np.empty(shape), np.empty(shape))
+        return buf
+
+    def run(
+        self,
+        returns: Any,
+        signal: Any,
+        context: dict | None = None,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray | pd.DataFrame:
+        frame = returns if isinstance(returns, pd.DataFrame) else None
+        if frame is not None and isinstance(signal, pd.DataFrame):
+            signal = signal.reindex(index=frame.index, columns=frame.columns)
+        rets = np.asarray(returns, dtype=np.float64)
+        if rets.ndim != 2:
+            raise ValueError(f"returns must be 2-D (time, symbol), got shape {rets.shape}")
+        w_buf, scratch = self._buffer(rets.shape)
+        w = w_buf if out is None else out
+        np.copyto(w, np.asarray(signal, dtype=np.float64))
+
+        if self._fast_sizer:
+            np.clip(w, 0.0, 1.0, out=w)
+        else:
+            self._series_step(lambda r, x: self.chain.sizer.size(r, x), rets, w)
+
+        for fast, rule in self._steps:
+            if fast:
+                if isinstance(rule, VolTargetRule):
+                    res = rule.apply_matrix(rets, w, context, scratch=scratch)
+                else:
+                    res = rule.apply_matrix(rets, w, context)
+                if res is not w:
+                    np.copyto(w, res)
+            elif context is not None and _takes_context(rule):
+                self._series_step(lambda r, x, rule=rule: rule.apply(r, x, context), rets, w)
+            else:
+                self._series_step(rule.apply, rets, w)
+
+        np.clip(w, 0.0, 1.0, out=w)
+        if frame is not None:
+            return pd.DataFrame(w, index=frame.index, columns=frame.columns, copy=True)
+        return w
+
+    @staticmethod
+    def _series_step(fn: Any, rets: np.ndarray, w: np.ndarray) -> None:
+        for j in range(w.shape[1]):
+            col = fn(pd.Series(rets[:, j]), pd.Series(w[:, j]))
+            w[:, j] = np.asarray(col, dtype=np.float64)
+
+
+__all__ = ["RiskChain", "CompiledRiskChain"]
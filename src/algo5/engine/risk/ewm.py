@@ -0,0 +1,81 @@
+"""Pandas ``ewm(span, adjust=False).std(bias=False)`` ile birebir EWMA varyans.
+
+Pandas'ın ``ewmcov`` özyinelemesi (adjust=False, tek seri) aynı işlem sırasıyla
+vektörlere uygulanır; böylece hem (zaman x sembol) matris hem de tick başına O(1)
+streaming güncelleme aynı sayıları üretir. Girdide NaN olmadığı varsayılır
+(risk katmanı getirileri ``fillna(0)`` ile verir).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class EwmVar:
+    """Sembol vektörü için EWMA ortalama/varyans state'i (bias düzeltmeli)."""
+
+    __slots__ = ("alpha", "n", "mean", "cov", "sum_wt2", "_tmp")
+
+    def __init__(self, span: float, n: int = 1) -> None:
+        if span < 1:
+            raise ValueError("span must be >= 1")
+        self.alpha = 2.0 / (float(span) + 1.0)
+        self.n = 0  # gözlem sayısı
+        self.mean = np.zeros(n)
+        self.cov = np.zeros(n)
+        self.sum_wt2 = 1.0
+        self._tmp = np.empty(n)
+
+    def update(self, x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Bir gözlem ekler; düzeltilmiş varyansı döner (ilk gözlemde NaN)."""
+        out = np.empty_like(self.mean) if out is None else out
+        if self.n == 0:
+            self.mean[:] = x
+            self.n = 1
+            out.fill(np.nan)
+            return out
+
+        a = self.alpha
+        old_wt = 1.0 - a  # adjust=False: old_wt her adımda 1'e normalize edilir
+        self.sum_wt2 = self.sum_wt2 * (old_wt * old_wt) + a * a
+        old_mean, tmp = self.mean.copy(), self._tmp
+        # mean != x ise güncelle (pandas: sabit seride sayısal hata önlemi)
+        np.copyto(self.mean, (old_wt * old_mean + a * x) / (old_wt + a), where=old_mean != x)
+        np.subtract(old_mean, self.mean, out=tmp)
+        tmp *= tmp
+        tmp += self.cov
+        tmp *= old_wt
+        d = x - self.mean
+        d *= d
+        d *= a
+        tmp += d
+        np.divide(tmp, old_wt + a, out=self.cov)
+        self.n += 1
+
+        den = 1.0 - self.sum_wt2  # sum_wt = 1 (adjust=False)
+        if den > 0:
+            np.multiply(self.cov, 1.0 / den, out=out)
+        else:
+            out.fill(np.nan)
+        return out
+
+
+def ewm_var(x: np.ndarray, span: float, out: np.ndarray | None = None) -> np.ndarray:
+    """(T,) ya da (T, S) dizi için EWMA varyans (``ewm(...).var(bias=False)``)."""
+    arr = np.asarray(x, dtype=np.float64)
+    flat = arr.reshape(arr.shape[0], -1)
+    res = np.empty_like(flat) if out is None else out.reshape(flat.shape)
+    state = EwmVar(span, flat.shape[1])
+    for t in range(flat.shape[0]):
+        state.update(flat[t], out=res[t])
+    return res.reshape(arr.shape)
+
+
+def ewm_std(x: np.ndarray, span: float, out: np.ndarray | None = None) -> np.ndarray:
+    """``pd.DataFrame(x).ewm(span=span, adjust=False).std(bias=False)`` eşdeğeri."""
+    res = ewm_var(x, span, out=out)
+    np.maximum(res, 0.0, out=res, where=~np.isnan(res))
+    return np.sqrt(res, out=res)
+
+
+__all__ = ["EwmVar", "ewm_var", "ewm_std"]
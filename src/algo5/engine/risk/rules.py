@@ -2,8 +2,11 @@
 import math
 from dataclasses import dataclass
 from typing import Any
+import numpy as np
 import pandas as pd
 
+from .ewm import ewm_std
+
 
 class Rule:
     def apply(self, returns: pd.Series, weights: pd.Series):  # pure function
@@ -24,6 +27,25 @@ class VolTargetRule(Rule):
         scale = scale.clip(upper=1.0).fillna(1.0)
         return (weights.astype(float) * scale).clip(0.0, 1.0)
 
+    def apply_matrix(
+        self,
+        returns: np.ndarray,
+        weights: np.ndarray,
+        context: dict | None = None,
+        *,
+        scratch: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """(T, S) matris versiyonu; ``weights`` yerinde güncellenir (``scratch``: ara tampon)."""
+        rets = np.nan_to_num(returns, nan=0.0) if np.isnan(returns).any() else returns
+        scale = ewm_std(rets, max(2, int(self.lookback)), out=scratch)
+        scale *= float(self.ann) ** 0.5
+        with np.errstate(divide="ignore"):
+            np.divide(float(self.target_pct) / 100.0, scale, out=scale)
+        np.minimum(scale, 1.0, out=scale, where=~np.isnan(scale))
+        scale[np.isnan(scale) | np.isinf(scale)] = 1.0  # ann_vol 0/NaN -> 1
+        weights *= scale
+        return np.clip(weights, 0.0, 1.0, out=weights)
+
 
 # --- RiskChain v1 rules -------------------------------------------------
 
@@ -38,6 +60,12 @@ class MaxPositionRule:
         out = weights.clip(upper=float(self.max_w))
         return out.fillna(0.0)
 
+    def apply_matrix(
+        self, returns: np.ndarray, weights: np.ndarray, context: dict | None = None
+    ) -> np.ndarray:
+        np.minimum(weights, float(self.max_w), out=weights, where=~np.isnan(weights))
+        return np.nan_to_num(weights, copy=False, nan=0.0)
+
 
 @dataclass(frozen=True)
 class CoolDownRule:
@@ -55,6 +83,15 @@ class CoolDownRule:
             return weights
         return (weights * float(self.reduction)).fillna(0.0)
 
+    def apply_matrix(
+        self, returns: np.ndarray, weights: np.ndarray, context: dict | None = None
+    ) -> np.ndarray:
+        ctx: dict[str, Any] = context or {}
+        if not (ctx.get("recent_loss", False) or ctx.get("cooldown_active", False)):
+            return weights
+        weights *= float(self.reduction)
+        return np.nan_to_num(weights, copy=False, nan=0.0)
+
 
 @dataclass(frozen=True)
 class FloorCapRule:
@@ -67,6 +104,12 @@ class FloorCapRule:
         out = weights.clip(lower=float(self.floor), upper=float(self.cap))
         return out.fillna(0.0)
 
+    def apply_matrix(
+        self, returns: np.ndarray, weights: np.ndarray, context: dict | None = None
+    ) -> np.ndarray:
+        np.clip(weights, float(self.floor), float(self.cap), out=weights)
+        return np.nan_to_num(weights, copy=False, nan=0.0)
+
 
 @dataclass(frozen=True)
 class DrawdownGuardRule:
@@ -93,3 +136,27 @@ class DrawdownGuardRule:
         # eşiği aşınca orantısal ölçek: dd/max_dd
         scale = max(0.0, 1.0 - (dd_now / float(self.max_dd)))
         return (weights * scale).fillna(0.0)
+
+    def apply_matrix(
+        self, returns: np.ndarray, weights: np.ndarray, context: dict | None = None
+    ) -> np.ndarray:
+        """``equity_curve`` 1-D ise tüm matrise tek ölçek, (T, S) ise sembol başına ölçek."""
+        if not isinstance(context, dict):
+            return weights
+        eq = context.get("equity_curve")
+        if eq is None or len(eq) == 0:
+            return weights
+
+        e = np.asarray(eq, dtype=float)[-self.dd_window :]
+        peak = np.fmax.accumulate(e, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd_now = np.atleast_1d((peak[-1] - e[-1]) / peak[-1])
+        hit = np.isfinite(dd_now) & (dd_now > float(self.max_dd))
+        if not hit.any():
+            return weights
+        scale = np.maximum(0.0, 1.0 - dd_now / float(self.max_dd))
+        if e.ndim == 1:
+            weights *= scale[0]
+            return np.nan_to_num(weights, copy=False, nan=0.0)
+        weights[:, hit] = np.nan_to_num(weights[:, hit] * scale[hit], nan=0.0)
+        return weights
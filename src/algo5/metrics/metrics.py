@@ -12,15 +12,52 @@ def compute_nav(returns: pd.Series) -> pd.Series:
     return cum
 
 
-def compute_metrics(nav: pd.Series) -> dict[str, float]:
-    """NAV serisinden temel metrikleri hesaplar."""
-    nav = nav.astype(float)
-    rets: pd.Series = nav.pct_change().dropna()
-    vol: float = float(rets.std() * np.sqrt(252)) if len(rets) else 0.0
-    sharpe: float = (
-        float((rets.mean() / rets.std()) * np.sqrt(252)) if len(rets) and rets.std() > 0 else 0.0
-    )
-    rollmax: pd.Series = nav.expanding().max()
-    mdd: float = float(((nav - rollmax) / rollmax).min()) if len(nav) else 0.0
-    total_return: float = float(nav.iloc[-1] / nav.iloc[0] - 1.0) if len(nav) else 0.0
-    return {"sharpe": sharpe, "max_drawdown": mdd, "total_return": total_return, "vol": vol}
+METRIC_KEYS = ("sharpe", "max_drawdown", "total_return", "vol")
+_ANN = np.sqrt(252)
+
+
+def compute_metrics_batch(navs: np.ndarray) -> dict[str, np.ndarray]:
+    """(N, T) NAV/equity matrisi için ``compute_metrics``; her anahtar N uzunluklu dizi.
+
+    Pandas semantiği korunur: getiriler ``pct_change().dropna()``, std ``ddof=1``,
+    drawdown için NaN'ı atlayan koşan tepe. Seri başına Python döngüsü yoktur; matris
+    üzerinde birkaç vektörel geçiş yapılır (getiri, ortalama, kare sapma toplamı, koşan
+    tepe, min drawdown). Tüm değerler sonluysa maskesiz hızlı yol kullanılır.
+    """
+    x = np.asarray(navs, dtype=np.float64)
+    if x.ndim != 2:
+        raise ValueError(f"navs must be 2-D (N, T), got shape {x.shape}")
+    n, t = x.shape
+    if t == 0:
+        return {k: np.zeros(n) for k in METRIC_KEYS}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = x[:, 1:] / x[:, :-1] - 1.0
+        if np.isfinite(x).all():
+            cnt = np.full(n, t - 1)
+            mean = rets.mean(axis=1) if t > 1 else np.full(n, np.nan)
+            dev2 = ((rets - mean[:, None]) ** 2).sum(axis=1)
+            peak = np.maximum.accumulate(x, axis=1)
+            mdd = ((x - peak) / peak).min(axis=1)
+        else:
+            valid = ~np.isnan(rets)
+            cnt = valid.sum(axis=1)
+            r0 = np.where(valid, rets, 0.0)
+            mean = r0.sum(axis=1) / cnt
+            dev2 = np.where(valid, (rets - mean[:, None]) ** 2, 0.0).sum(axis=1)
+            peak = np.fmax.accumulate(x, axis=1)
+            dd = (x - peak) / peak
+            has = ~np.isnan(dd).all(axis=1)
+            mdd = np.full(n, np.nan)
+            mdd[has] = np.nanmin(dd[has], axis=1)
+        std = np.where(cnt > 1, np.sqrt(dev2 / (cnt - 1)), np.nan)
+        sharpe = np.where((cnt > 0) & (std > 0), mean / std * _ANN, 0.0)
+        vol = np.where(cnt > 0, std * _ANN, 0.0)
+        total = x[:, -1] / x[:, 0] - 1.0
+    return {"sharpe": sharpe, "max_drawdown": mdd, "total_return": total, "vol": vol}
+
+
+def compute_metrics(nav: pd.Series | np.ndarray) -> dict[str, float]:
+    """NAV serisinden temel metrikleri hesaplar (``compute_metrics_batch`` çekirdeği)."""
+    x = np.asarray(nav, dtype=np.float64).reshape(1, -1)
+    return {k: float(v[0]) for k, v in compute_metrics_batch(x).items()}
@@ -0,0 +1,146 @@
+"""``PortfolioUpdated`` event'lerinden O(1) bellekle canlı performans metrikleri."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from algo5.core.events import PortfolioUpdated
+
+_ANN = math.sqrt(252)
+
+
+def _pct_change(prev: float, cur: float) -> float:
+    """Pandas bölme semantiği: x/0 -> ±inf, 0/0 ve NaN -> NaN."""
+    if prev != 0:
+        return cur / prev - 1.0
+    if cur == 0 or cur != cur:
+        return math.nan
+    return math.copysign(math.inf, cur)
+
+
+@dataclass(frozen=True, slots=True)
+class PerformanceSnapshot:
+    timestamp: pd.Timestamp | None
+    n_updates: int
+    equity: float
+    total_return: float
+    sharpe: float
+    vol: float
+    max_drawdown: float
+    drawdown: float  # son tepeden mevcut düşüş
+    turnover: float  # işlem gören nosyonel: sum |Δcash|
+    traded_qty: float  # sum |Δposition|
+    exposure: float  # |equity - cash| / equity (son güncelleme)
+    avg_exposure: float
+
+
+@dataclass
+class OnlinePerformanceTracker:
+    """Her ``PortfolioUpdated``'de equity getirisini Welford ile biriktirir.
+
+    Tarihçe tutulmaz; ``snapshot()`` / ``metrics()`` istendiği an hesaplanır.
+    ``metrics()`` aynı equity dizisi üzerinde ``compute_metrics`` ile aynı değerleri verir
+    (NaN equity'li güncellemeler ``pct_change().dropna()``'daki gibi atlanır).
+    """
+
+    n_updates: int = 0
+    last_timestamp: pd.Timestamp | None = None
+    first_equity: float = math.nan
+    last_equity: float = math.nan
+    peak: float = math.nan
+    max_drawdown: float = math.nan
+    turnover: float = 0.0
+    traded_qty: float = 0.0
+    exposure: float = 0.0
+    _n: int = field(default=0, repr=False)  # getiri sayısı
+    _mean: float = field(default=0.0, repr=False)
+    _m2: float = field(default=0.0, repr=False)
+    _exp_sum: float = field(default=0.0, repr=False)
+    _cash: float | None = field(default=None, repr=False)
+    _pos: float | None = field(default=None, repr=False)
+
+    def attach(self, bus: Any) -> OnlinePerformanceTracker:
+        bus.subscribe(PortfolioUpdated, self.on_portfolio_updated)
+        return self
+
+    def on_portfolio_updated(self, event: PortfolioUpdated, bus: Any = None) -> None:
+        self.update(event.equity, event.cash, event.position, event.timestamp)
+
+    def update(
+        self,
+        equity: float,
+        cash: float = 0.0,
+        position: float = 0.0,
+        timestamp: pd.Timestamp | None = None,
+    ) -> None:
+        eq = float(equity)
+        if self.n_updates == 0:
+            self.first_equity = eq
+        else:
+            r = _pct_change(self.last_equity, eq)
+            if r == r:  # NaN değil
+                self._n += 1
+                d = r - self._mean
+                self._mean += d / self._n
+                self._m2 += d * (r - self._mean)
+        self.n_updates += 1
+        self.last_equity = eq
+        self.last_timestamp = timestamp
+
+        if eq == eq:
+            if not self.peak >= eq:  # ilk geçerli değer (peak NaN) dahil
+                self.peak = eq
+            dd = (eq - self.peak) / self.peak if self.peak else math.nan
+            if dd == dd and not self.max_drawdown <= dd:
+                self.max_drawdown = dd
+
+        if self._cash is not None and self._pos is not None:
+            self.turnover += abs(cash - self._cash)
+            self.traded_qty += abs(position - self._pos)
+        self._cash, self._pos = cash, position
+        self.exposure = abs(eq - cash) / eq if eq else 0.0
+        self._exp_sum += self.exposure
+
+    # ---------- snapshots ----------
+    def _std(self) -> float:
+        return math.sqrt(self._m2 / (self._n - 1)) if self._n >= 2 else math.nan
+
+    def metrics(self) -> dict[str, float]:
+        """``compute_metrics`` ile aynı anahtar ve değerler."""
+        std = self._std()
+        vol = std * _ANN if self._n else 0.0
+        sharpe = self._mean / std * _ANN if self._n and std > 0 else 0.0
+        if not self.n_updates:
+            return {"sharpe": 0.0, "max_drawdown": 0.0, "total_return": 0.0, "vol": 0.0}
+        total = self.last_equity / self.first_equity - 1.0 if self.first_equity else math.nan
+        return {
+            "sharpe": sharpe,
+            "max_drawdown": self.max_drawdown,
+            "total_return": total,
+            "vol": vol,
+        }
+
+    def snapshot(self) -> PerformanceSnapshot:
+        m = self.metrics()
+        peak, eq = self.peak, self.last_equity
+        return PerformanceSnapshot(
+            timestamp=self.last_timestamp,
+            n_updates=self.n_updates,
+            equity=eq,
+            total_return=m["total_return"],
+            sharpe=m["sharpe"],
+            vol=m["vol"],
+            max_drawdown=m["max_drawdown"],
+            drawdown=(eq - peak) / peak if peak else 0.0,
+            turnover=self.turnover,
+            traded_qty=self.traded_qty,
+            exposure=self.exposure,
+            avg_exposure=self._exp_sum / self.n_updates if self.n_updates else 0.0,
+        )
+
+
+__all__ = ["OnlinePerformanceTracker", "PerformanceSnapshot"]
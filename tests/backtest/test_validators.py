@@ -4,8 +4,10 @@ import pytest
 
 from algo5.engine.backtest.validators import (
     OHLCVSpec,
+    OHLCVStreamValidator,
     normalize_ohlcv,
     validate_ohlcv,
+    validate_ohlcv_stream,
 )
 
 
@@ -44,3 +46,68 @@ def test_normalize_localizes_and_casts():
     out = normalize_ohlcv(df)
     assert out.index.tz is not None
     assert out.dtypes["Open"].kind in ("f", "i")
+
+
+def _chunks(df, size=2):
+    return [df.iloc[i : i + size].copy() for i in range(0, len(df), size)]
+
+
+def _decision(fn):
+    try:
+        fn()
+    except ValueError as exc:
+        return str(exc)
+    return None
+
+
+@pytest.mark.parametrize(
+    "mutate, spec",
+    [
+        (lambda df: df, OHLCVSpec(require_volume=True)),
+        (lambda df: df.drop(columns=["Volume"]), OHLCVSpec(require_volume=True)),
+        (lambda df: df.assign(Close=df["Close"].where(df.index != df.index[3])), OHLCVSpec()),
+        (
+            lambda df: df.assign(Close=df["Close"].where(df.index != df.index[3])),
+            OHLCVSpec(allow_na=True),
+        ),
+        (lambda df: df.assign(Low=df["Low"].where(df.index != df.index[4], 99.0)), OHLCVSpec()),
+        (lambda df: df.tz_localize(None), OHLCVSpec()),
+        (lambda df: df.iloc[:0], OHLCVSpec()),
+    ],
+)
+def test_stream_matches_whole_frame_decision(mutate, spec):
+    df = mutate(_make_df(n=7))
+    whole = _decision(lambda: validate_ohlcv(df, spec=spec))
+    assert _decision(lambda: validate_ohlcv_stream(_chunks(df), spec=spec)) == whole
+
+
+def test_stream_normalizes_chunks_in_place_and_carries_state():
+    df = _make_df(tz=None, n=7).astype({"Open": str})
+    v = OHLCVStreamValidator(OHLCVSpec(require_volume=True))
+    chunks = _chunks(df, 3)
+    out = list(v.stream(chunks))
+    assert out[0] is chunks[0]  # kopya yok
+    pd.testing.assert_frame_equal(pd.concat(out), normalize_ohlcv(df))
+    rep = v.finish()
+    assert rep["rows"] == 7 and rep["chunks"] == 3 and rep["tz"] == "UTC"
+    assert rep["last_ts"] == normalize_ohlcv(df).index[-1] and rep["non_monotonic"] == 0
+
+
+def test_stream_rejects_tz_change_and_counts_back_steps():
+    df = _make_df(n=6)
+    parts = [df.iloc[:3], df.iloc[3:].tz_convert("Europe/Istanbul")]
+    with pytest.raises(ValueError, match="DatetimeIndex"):
+        validate_ohlcv_stream(parts)
+    rep = validate_ohlcv_stream([df.iloc[3:], df.iloc[:3]])
+    assert rep["non_monotonic"] == 1 and rep["first_ts"] == df.index[3]
+
+
+def test_stream_over_csv_reader_chunks(tmp_path):
+    df = _make_df(tz=None, n=9)
+    df.to_csv(tmp_path / "bars.csv")
+    reader = pd.read_csv(tmp_path / "bars.csv", index_col=0, parse_dates=True, chunksize=4)
+    v = OHLCVStreamValidator(OHLCVSpec(require_volume=True))
+    total = sum(len(c) for c in v.stream(reader))
+    assert total == 9 and v.finish()["nan_counts"] == dict.fromkeys(
+        ["Open", "High", "Low", "Close", "Volume"], 0
+    )
@@ -0,0 +1,116 @@
+import asyncio
+
+import pandas as pd
+
+from algo5.app.runtime import build_event_driven_app
+from algo5.core.async_bus import AsyncEventBus
+from algo5.core.events import PortfolioUpdated, Tick
+
+
+def _tick(i: int, symbol: str = "AAPL", c: float = 100.5) -> Tick:
+    ts = pd.Timestamp("2025-01-01 09:30:00") + pd.Timedelta(minutes=i)
+    return Tick(ts, symbol, 100.0, 101.0, 99.0, c, 1000.0)
+
+
+def test_block_policy_delivers_everything_in_order():
+    async def main():
+        bus = AsyncEventBus(maxsize=2, overflow="block")
+        seen = []
+
+        async def slow(e, _b):
+            await asyncio.sleep(0)
+            seen.append(e.ts.minute)
+
+        bus.subscribe(Tick, slow)
+        for i in range(10):
+            await bus.publish_async(_tick(i))
+        bus.publish_many([_tick(i) for i in range(10, 15)])  # senkron taşma -> backlog
+        await bus.drain()
+        await bus.aclose()
+        return seen, bus.stats()
+
+    seen, stats = asyncio.run(main())
+    assert seen == list(range(30, 45))
+    (s,) = stats.values()
+    assert s["processed"] == 15 and s["dropped"] == 0 and s["queued"] == 0
+
+
+def test_drop_oldest_keeps_latest_events():
+    async def main():
+        bus = AsyncEventBus(maxsize=3, overflow="drop_oldest")
+        seen = []
+        bus.subscribe(Tick, lambda e, _b: seen.append(e.ts.minute))
+        for i in range(10):  # worker henüz çalışmadı: kuyruk taşar
+            bus.publish(_tick(i))
+        await bus.drain()
+        return seen, bus.stats()
+
+    seen, stats = asyncio.run(main())
+    assert seen == [37, 38, 39]
+    assert next(iter(stats.values()))["dropped"] == 7
+
+
+def test_conflate_keeps_last_event_per_symbol():
+    async def main():
+        bus = AsyncEventBus(overflow="conflate")
+        seen = []
+        bus.subscribe(Tick, lambda e, _b: seen.append((e.symbol, e.c)))
+        for i in range(5):
+            bus.publish(_tick(i, "AAPL", c=100.0 + i))
+            bus.publish(_tick(i, "MSFT", c=200.0 + i))
+        await bus.drain()
+        return seen, bus.stats()
+
+    seen, stats = asyncio.run(main())
+    assert seen == [("AAPL", 104.0), ("MSFT", 204.0)]
+    assert next(iter(stats.values()))["conflated"] == 8
+
+
+def test_slow_subscriber_does_not_stall_fast_one():
+    async def main():
+        bus = AsyncEventBus(maxsize=100)
+        gate = asyncio.Event()
+        fast, slow = [], []
+
+        async def slow_h(e, _b):
+            await gate.wait()
+            slow.append(e)
+
+        bus.subscribe(Tick, slow_h)
+        bus.subscribe(Tick, lambda e, _b: fast.append(e))
+        for i in range(5):
+            await bus.publish_async(_tick(i))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        n_fast, n_slow = len(fast), len(slow)
+        gate.set()
+        await bus.drain()
+        return n_fast, n_slow, len(slow)
+
+    n_fast, n_slow, final_slow = asyncio.run(main())
+    assert n_fast == 5 and n_slow == 0 and final_slow == 5
+
+
+def test_runtime_with_async_bus_matches_sync_flow():
+    t1 = Tick(pd.Timestamp("2025-01-01 09:30:00"), "AAPL", 100.0, 101.0, 99.0, 100.5, 1000)
+    t2 = Tick(pd.Timestamp("2025-01-01 09:31:00"), "AAPL", 102.0, 103.0, 101.0, 102.6, 1200)
+
+    sync_bus, *_, sync_pf = build_event_driven_app(initial_cash=10_000.0)
+    for t in (t1, t2):
+        sync_bus.publish(t)
+
+    async def main():
+        bus, strat, risk, exe, pf = build_event_driven_app(
+            initial_cash=10_000.0, bus=AsyncEventBus()
+        )
+        updates = []
+        bus.subscribe(PortfolioUpdated, lambda e, _b: updates.append(e))
+        for t in (t1, t2):
+            await bus.publish_async(t)
+            await bus.drain()
+        await bus.aclose()
+        return pf, updates
+
+    pf, updates = asyncio.run(main())
+    assert updates and updates[-1].position == 0.0
+    assert pf.cash == sync_pf.cash and pf.realized_pnl == sync_pf.realized_pnl
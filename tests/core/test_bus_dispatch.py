@@ -0,0 +1,118 @@
+import pytest
+
+from algo5.core.bus import EventBus
+
+
+class Ping:
+    def __init__(self, n: int = 0) -> None:
+        self.n = n
+
+
+def test_subscribe_unsubscribe_rebuilds_table():
+    bus = EventBus()
+    seen = []
+
+    def h1(e, _b):
+        seen.append(("h1", e.n))
+
+    def h2(e, _b):
+        seen.append(("h2", e.n))
+
+    bus.subscribe(Ping, h1)
+    bus.subscribe(Ping, h2)
+    assert bus.handlers(Ping) == (h1, h2)
+
+    bus.publish(Ping(1))
+    assert bus.unsubscribe(Ping, h1) is True
+    assert bus.unsubscribe(Ping, h1) is False
+    bus.publish(Ping(2))
+    assert seen == [("h1", 1), ("h2", 1), ("h2", 2)]
+
+
+def test_subscribe_during_dispatch_applies_to_next_event():
+    bus = EventBus()
+    seen = []
+
+    def late(e, _b):
+        seen.append(("late", e.n))
+
+    def first(e, b):
+        seen.append(("first", e.n))
+        if e.n == 1:
+            b.subscribe(Ping, late)
+
+    bus.subscribe(Ping, first)
+    bus.publish(Ping(1))
+    bus.publish(Ping(2))
+    assert seen == [("first", 1), ("first", 2), ("late", 2)]
+
+
+def test_fast_policy_propagates_errors():
+    bus = EventBus(error_policy="fast")
+
+    def bad(_e, _b):
+        raise RuntimeError("boom")
+
+    bus.subscribe(Ping, bad)
+    with pytest.raises(RuntimeError, match="boom"):
+        bus.publish(Ping())
+
+
+def test_unknown_error_policy_rejected():
+    with pytest.raises(ValueError):
+        EventBus(error_policy="ignore")  # type: ignore[arg-type]
+
+
+def test_queue_nested_is_breadth_first_and_flat():
+    bus = EventBus(queue_nested=True)
+    order = []
+
+    def a(e, b):
+        order.append(("a", e.n))
+        if e.n < 2:
+            b.publish(Ping(e.n + 1))
+
+    def b_(e, _b):
+        order.append(("b", e.n))
+
+    bus.subscribe(Ping, a)
+    bus.subscribe(Ping, b_)
+    bus.publish(Ping(0))
+    # iç publish, dıştaki event'in tüm handler'ları bittikten sonra işlenir
+    assert order == [("a", 0), ("b", 0), ("a", 1), ("b", 1), ("a", 2), ("b", 2)]
+
+
+def test_queue_nested_handles_chains_deeper_than_recursion_limit():
+    import sys
+
+    bus = EventBus(error_policy="fast", queue_nested=True)
+    depth = sys.getrecursionlimit() * 2
+    count = [0]
+
+    def h(e, b):
+        count[0] += 1
+        if e.n > 0:
+            b.publish(Ping(e.n - 1))
+
+    bus.subscribe(Ping, h)
+    bus.publish(Ping(depth))
+    assert count[0] == depth + 1
+
+
+def test_queue_nested_fast_error_clears_pending():
+    bus = EventBus(error_policy="fast", queue_nested=True)
+    calls = []
+
+    def h(e, b):
+        calls.append(e.n)
+        if e.n == 0:
+            b.publish(Ping(1))
+            b.publish(Ping(2))
+        elif e.n == 1:
+            raise RuntimeError("stop")
+
+    bus.subscribe(Ping, h)
+    with pytest.raises(RuntimeError):
+        bus.publish(Ping(0))
+    bus.publish(Ping(5))
+    assert calls == [0, 1, 5]
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.core.bus import EventBus
+from algo5.core.events import Tick
+from algo5.data._utils import resample_ohlc
+from algo5.data.aggregator import BarAggregator, aggregate_frame
+
+
+def _minute_bars(n=3 * 1440, seed=0, tz="UTC"):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-03-01 07:13", periods=n, freq="min", tz=tz)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, n)))
+    df = pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 2e-4, n)),
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.integers(1, 100, n).astype(float),
+        },
+        index=idx,
+    )
+    keep = rng.random(n) > 0.2  # boşluklar: bazı kovalar tamamen boş kalır
+    keep[1000:1200] = False
+    return df[keep]
+
+
+@pytest.mark.parametrize("tz", ["UTC", None])
+def test_matches_resample_ohlc(tz):
+    df = _minute_bars(tz=tz)
+    rules = ["5min", "7min", "1h", "1D"]
+    out = aggregate_frame(df, rules)
+    for rule in rules:
+        pd.testing.assert_frame_equal(out[rule], resample_ohlc(df, rule), check_freq=False)
+
+
+def test_raw_ticks_match_resample():
+    rng = np.random.default_rng(1)
+    ts = pd.Timestamp("2024-01-02", tz="UTC") + pd.to_timedelta(
+        np.sort(rng.integers(0, 6 * 3600, 5_000)), unit="s"
+    )
+    px = 50 + np.cumsum(rng.normal(0, 0.05, ts.size))
+    qty = rng.integers(1, 10, ts.size).astype(float)
+    df = pd.DataFrame(
+        {"open": px, "high": px, "low": px, "close": px, "volume": qty}, index=ts.as_unit("ns")
+    )
+    agg = BarAggregator(["1min", "15min"])
+    bars = [
+        b for t, p, q in zip(ts, px, qty, strict=True) for b in agg.update("X", t, p, p, p, p, q)
+    ]
+    bars += agg.flush()
+    got = pd.DataFrame(
+        [(b.ts, b.o, b.h, b.low, b.c, b.v) for b in bars if b.timeframe == "15min"],
+        columns=["ts", "open", "high", "low", "close", "volume"],
+    ).set_index("ts")
+    got.index.name = None
+    pd.testing.assert_frame_equal(got, resample_ohlc(df, "15min"), check_freq=False)
+
+
+def test_emits_on_bus_at_boundaries():
+    bus = EventBus(error_policy="fast")
+    BarAggregator(["5min", "1h"]).attach(bus)
+    seen: list[Tick] = []
+    bus.subscribe(Tick, lambda e, _bus: seen.append(e) if e.timeframe else None)
+    t0 = pd.Timestamp("2024-01-01 09:00", tz="UTC")
+    for i in range(65):
+        for sym, px in (("AAPL", 100.0 + i), ("MSFT", 200.0 - i)):
+            bus.publish(Tick(t0 + pd.Timedelta(minutes=i), sym, px, px + 1, px - 1, px, 1.0))
+        if i == 5:  # 09:05 barı geldiğinde 09:00-09:05 kapanır (sembol başına)
+            assert [(b.symbol, b.timeframe, b.o, b.c, b.v) for b in seen] == [
+                ("AAPL", "5min", 100.0, 104.0, 5.0),
+                ("MSFT", "5min", 200.0, 196.0, 5.0),
+            ]
+    hours = [b for b in seen if b.timeframe == "1h"]
+    assert [(b.symbol, b.ts, b.h, b.low, b.v) for b in hours] == [
+        ("AAPL", t0, 160.0, 99.0, 60.0),
+        ("MSFT", t0, 201.0, 140.0, 60.0),
+    ]
+    assert len([b for b in seen if b.timeframe == "5min"]) == 2 * 12
+    assert all(b.ts.tz is not None for b in seen)
+
+
+def test_advance_closes_idle_bars_and_drops_late_data():
+    agg = BarAggregator(["5min"])
+    t0 = pd.Timestamp("2024-01-01 09:00")
+    agg.update("X", t0, 1.0, 2.0, 0.5, 1.5, 10.0)
+    assert agg.advance(t0 + pd.Timedelta(minutes=4)) == []
+    (bar,) = agg.advance(t0 + pd.Timedelta(minutes=5))
+    assert bar.ts == t0 and bar.c == 1.5 and bar.timeframe == "5min"
+    assert agg.update("X", t0 + pd.Timedelta(minutes=3), 9.0, 9.0, 9.0, 9.0) == []
+    assert agg.late == 1 and agg.flush() == []
+
+
+def test_advance_keeps_finer_bars_inside_open_coarser_bar():
+    agg = BarAggregator(["5min", "1h"])
+    t0 = pd.Timestamp("2024-01-01 10:00")
+    agg.update("X", t0, 1.0, 1.0, 1.0, 1.0, 1.0)
+    (bar,) = agg.advance(t0 + pd.Timedelta(minutes=5))
+    assert bar.timeframe == "5min" and bar.ts == t0
+    bars = []
+    for i in range(6, 30):
+        px = float(i)
+        bars += agg.update("X", t0 + pd.Timedelta(minutes=i), px, px, px, px, 1.0)
+    bars += agg.flush()
+    five = [(b.ts.minute, b.o, b.c, b.v) for b in bars if b.timeframe == "5min"]
+    assert five == [
+        (5, 6.0, 9.0, 4.0),
+        (10, 10.0, 14.0, 5.0),
+        (15, 15.0, 19.0, 5.0),
+        (20, 20.0, 24.0, 5.0),
+        (25, 25.0, 29.0, 5.0),
+    ]
+    (hour,) = [b for b in bars if b.timeframe == "1h"]
+    assert (hour.ts, hour.o, hour.h, hour.c, hour.v) == (t0, 1.0, 29.0, 29.0, 25.0)
+
+
+def test_rejects_bad_timeframes():
+    with pytest.raises(ValueError):
+        BarAggregator(["5min", "300s"])
+    with pytest.raises(ValueError):
+        BarAggregator(["1min", "5min"], source="1min")
@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+import pytest
+
 from algo5.data.feature_store.cache import set_cache_root
 from algo5.data.feature_store.store import FeatureStore
 
@@ -20,3 +24,61 @@ def test_overwrite(tmp_path, demo_df):
     st.save("unit/x", demo_df.iloc[:100], overwrite=True)
     out = st.load("unit/x")
     assert len(out) == 100
+
+
+def test_binary_table_keeps_dtypes_and_slices(tmp_path):
+    st = FeatureStore(tmp_path)
+    idx = pd.date_range("2024-01-01", periods=1000, freq="min", tz="Europe/Istanbul")
+    df = pd.DataFrame(
+        {
+            "close": np.linspace(1, 2, 1000),
+            "volume": np.arange(1000, dtype=np.int32),
+            "flag": np.arange(1000) % 3 == 0,
+            "sym": pd.Categorical(["A", "B"] * 500),
+            "note": ["x", None] * 500,
+        },
+        index=idx.rename("ts"),
+    )
+    path = st.save("unit/bin", df)
+    assert path.name == "schema.json"
+    pd.testing.assert_frame_equal(st.load("unit/bin"), df, check_freq=False)
+
+    part = st.load("unit/bin", columns=["volume"], start=idx[10], end="2024-01-01 00:20")
+    assert list(part.columns) == ["volume"]
+    assert part["volume"].dtype == np.int32
+    assert part.index[0] == idx[10] and part.index[-1] == idx[20]
+
+    with pytest.raises(KeyError):
+        st.load("unit/bin", columns=["nope"])
+
+
+def test_unsorted_index_and_csv_export(tmp_path, demo_df):
+    st = FeatureStore(tmp_path)
+    shuffled = demo_df.iloc[::-1]
+    st.save("unit/u", shuffled, overwrite=True)
+    out = st.load("unit/u", start="2024-01-10", end="2024-01-12")
+    assert list(out.index.day) == [12, 11, 10]
+
+    st.save("unit/u", demo_df, overwrite=True, format="csv")
+    assert not (tmp_path / "tables" / "unit_u" / "schema.json").exists()
+    csv = st.load("unit/u", columns=["Close"], start="2024-01-10", end="2024-01-12")
+    assert csv["Close"].tolist() == [109.0, 110.0, 111.0]
+    with pytest.raises(FileExistsError):
+        st.save("unit/u", demo_df)
+
+
+def test_nullable_columns_roundtrip(tmp_path):
+    st = FeatureStore(tmp_path)
+    idx = pd.date_range("2024-01-01", periods=4, freq="D", tz="UTC")
+    df = pd.DataFrame(
+        {
+            "flag": pd.array([True, None, False, True], dtype="boolean"),
+            "n": pd.array([1, None, 3, 4], dtype="Int64"),
+            "x": pd.array([0.5, 1.5, None, 2.5], dtype="Float64"),
+        },
+        index=idx,
+    )
+    st.save("unit/nullable", df)
+    pd.testing.assert_frame_equal(st.load("unit/nullable"), df, check_freq=False)
+    part = st.load("unit/nullable", columns=["n"], start=idx[1], end=idx[2])
+    assert part["n"].dtype == "Int64" and part["n"].isna().tolist() == [True, False]
@@ -1,3 +1,10 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
 from algo5.data.feature_store.cache import SmartCache, set_cache_root
 from algo5.data.feature_store.catalog import list_items, list_namespaces
 
@@ -17,3 +24,72 @@ def test_catalog_lists(tmp_path, monkeypatch):
     set_cache_root(root)
     assert "raw" in list_namespaces()
     assert set(list_items("raw")) == {"a", "b"}
+
+
+def test_binary_values_and_memory_tier(tmp_path):
+    c = SmartCache(tmp_path)
+    arr = np.arange(10.0)
+    df = pd.DataFrame(
+        {"a": [1.5, 2.5], "s": ["x", None]}, index=pd.date_range("2024", periods=2, tz="UTC")
+    )
+    assert c.set("feat", "arr", arr).suffix == ".npy"
+    assert c.set("feat", "df", df).suffix == ".npz"
+    c.set("feat", "ser", df["a"])
+    assert c.get("feat", "arr") is arr  # bellek katmanı
+    assert c.stats.mem_hits == 1
+
+    cold = SmartCache(tmp_path)  # yalnız disk
+    np.testing.assert_array_equal(cold.get("feat", "arr"), arr)
+    pd.testing.assert_frame_equal(cold.get("feat", "df"), df, check_freq=False)
+    pd.testing.assert_series_equal(cold.get("feat", "ser"), df["a"], check_freq=False)
+    assert cold.get("feat", "nope") is None
+    assert cold.stats.as_dict()["disk_hits"] == 3 and cold.stats.misses == 1
+
+    c.set("feat", "arr", {"now": "json"})  # tip değişince eski dosya silinir
+    assert not (tmp_path / "feat" / "arr.npy").exists()
+    set_cache_root(tmp_path)
+    assert list_items("feat") == ["arr", "df", "ser"]
+
+
+def test_memory_budget_lru_and_ttl(tmp_path, monkeypatch):
+    c = SmartCache(tmp_path, mem_max_bytes=2 * 800, ttl=60)
+    for k in "abc":
+        c.set("ns", k, np.zeros(100))  # 800 bayt
+    assert c.stats.mem_evictions == 1
+    assert c.get("ns", "a") is not None and c.stats.disk_hits == 1  # bellekten atılmıştı
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert c.get("ns", "b") is None
+    assert c.stats.expired == 1
+    assert c.keys("ns") == ["a", "c"]
+
+
+def test_disk_cap_evicts_least_recently_accessed(tmp_path):
+    c = SmartCache(tmp_path, disk_max_bytes=3 * 1000)
+    for i, k in enumerate("abc"):
+        p = c.set("ns", k, np.zeros(100))
+        os.utime(p, (1_000 + i, 1_000 + i))
+    c.clear_memory()
+    c.get("ns", "a")  # a en son erişilen olur
+    c.set("ns", "d", np.zeros(100))
+    assert c.keys("ns") == ["a", "c", "d"]
+    assert c.stats.disk_evictions == 1
+    assert c.disk_usage() <= 3 * 1000
+
+
+def test_frame_codec_edge_cases(tmp_path):
+    c = SmartCache(tmp_path)
+    idx = pd.date_range("2024-01-01", periods=3, freq="D", tz="UTC")
+    dup = pd.DataFrame([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], index=idx, columns=["a", "a"])
+    nullable = pd.DataFrame({"f": pd.array([True, None, False], dtype="boolean")}, index=idx)
+    for key, df in (("dup", dup), ("nullable", nullable)):
+        c.set("ns", key, df)
+        c.clear_memory()
+        pd.testing.assert_frame_equal(c.get("ns", key), df, check_freq=False)
+
+    mi = pd.DataFrame({"x": [1, 2]}, index=pd.MultiIndex.from_tuples([("a", 1), ("b", 2)]))
+    for bad in (mi, pd.Series([1.0, 2.0], name=("t", 1))):
+        with pytest.raises(TypeError):
+            c.set("ns", "bad", bad)
+    assert not list(tmp_path.rglob("*.tmp")) and c.get("ns", "bad") is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -24,3 +25,83 @@ def test_upsert_is_idempotent(tmp_path):
     rd = store.read(sym, ts)
     assert r1 == r2
     assert rd == feats
+
+
+def _features(n=3000, freq="min", start="2024-01-31 12:00"):
+    idx = pd.date_range(start, periods=n, freq=freq, tz="UTC")
+    return pd.DataFrame(
+        {"ma5": np.arange(n, dtype=float), "flag": np.arange(n) % 2 == 0, "n": np.arange(n)},
+        index=idx,
+    )
+
+
+def test_upsert_many_partitions_and_is_idempotent(tmp_path):
+    store = _mk_store(tmp_path)
+    df = _features(n=3 * 24 * 60)  # 31 Ocak -> 3 Şubat: iki aylık bölüm
+    c1 = store.upsert_many("AAPL", df)
+    seg_dir = tmp_path / "features" / "AAPL"
+    assert sorted(p.name for p in seg_dir.glob("*.npz")) == ["2024-01.npz", "2024-02.npz"]
+    manifest = (seg_dir / "manifest.jsonl").read_text().splitlines()
+    assert len(manifest) == 2
+
+    mtimes = {p: p.stat().st_mtime_ns for p in seg_dir.glob("*.npz")}
+    assert store.upsert_many("AAPL", df) == c1
+    assert (seg_dir / "manifest.jsonl").read_text().splitlines() == manifest
+    assert {p: p.stat().st_mtime_ns for p in seg_dir.glob("*.npz")} == mtimes
+
+    out = FeatureStore(tmp_path).read_range("AAPL")  # manifest'ten yeniden yüklenir
+    expected = df.set_axis(df.index.as_unit("ns"))
+    pd.testing.assert_frame_equal(out, expected, check_names=False, check_freq=False)
+
+
+def test_upsert_many_replaces_rows_and_read_falls_back(tmp_path):
+    store = _mk_store(tmp_path)
+    df = _features(n=100)
+    store.upsert_many("BTC/USDT", df)
+    upd = pd.DataFrame({"ma5": [-1.0], "rsi": [55.0]}, index=df.index[[10]])
+    store.upsert_many("BTC/USDT", upd)
+
+    ts = df.index[10]
+    assert store.read("BTC/USDT", ts) == {"ma5": -1.0, "rsi": 55.0}  # satır değişti
+    assert store.read("BTC/USDT", df.index[11]) == {"ma5": 11.0, "flag": False, "n": 11}
+    with pytest.raises(FileNotFoundError):
+        store.read("BTC/USDT", df.index[0] - pd.Timedelta(minutes=1))
+    lines = (tmp_path / "features" / "BTC_USDT" / "manifest.jsonl").read_text().splitlines()
+    assert len(lines) == 2  # append-only: aynı bölüm için ikinci kayıt
+
+
+def test_stored_nan_and_empty_values_are_not_gaps(tmp_path):
+    store = _mk_store(tmp_path)
+    idx = pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC")
+    store.upsert_many("X", pd.DataFrame({"x": [1.0, np.nan, 3.0], "tag": ["a", "", "c"]}, idx))
+    store.upsert_many("X", pd.DataFrame({"y": [7.0]}, index=idx[[2]]))  # yeni kolon
+
+    row = store.read("X", idx[1])
+    assert set(row) == {"x", "tag"} and np.isnan(row["x"]) and row["tag"] == ""
+    assert store.read("X", idx[2]) == {"y": 7.0}  # satır bazlı upsert: satır değişti
+    assert store.read("X", idx[0]) == {"x": 1.0, "tag": "a"}  # y bu satırda hiç yazılmadı
+
+
+def test_read_range_pushdown(tmp_path):
+    store = _mk_store(tmp_path)
+    df = _features(n=90, freq="D", start="2024-01-01")
+    store.upsert_many("ETH", df)
+    out = store.read_range("ETH", "2024-02-10", "2024-02-12", columns=["ma5"])
+    assert list(out.columns) == ["ma5"]
+    assert out["ma5"].tolist() == [40.0, 41.0, 42.0]
+    assert str(out.index.tz) == "UTC"
+    assert store.read_range("ETH", "2030-01-01").empty
+    parts = list(store.iter_range("ETH", "2024-01-20", "2024-03-05"))
+    assert [len(p) for p in parts] == [12, 29, 5]  # segment (ay) başına bir parça
+    pd.testing.assert_frame_equal(
+        pd.concat(parts), store.read_range("ETH", "2024-01-20", "2024-03-05")
+    )
+
+
+def test_catalog_journal_appends(tmp_path):
+    store = _mk_store(tmp_path)
+    ts = pd.Timestamp("2024-01-01 10:00", tz="UTC")
+    store.upsert("AAPL", ts, {"ma5": 1.0})
+    store.upsert("AAPL", ts + pd.Timedelta(minutes=1), {"ma5": 2.0})
+    assert len((tmp_path / "catalog.jsonl").read_text().splitlines()) == 2
+    assert FeatureStore(tmp_path)._catalog == store._catalog
@@ -1,6 +1,7 @@
 import numpy as np
+import pytest
 
-from algo5.data.integrity import Reproducibility, df_checksum
+from algo5.data.integrity import ChunkedFingerprint, Reproducibility, df_checksum
 
 
 def test_df_checksum_changes_when_data_changes(demo_df):
@@ -16,3 +17,34 @@ def test_reproducibility_seed_if_available():
     a = np.random.RandomState(r.get_strategy_seed("x")).rand()
     b = np.random.RandomState(r.get_strategy_seed("x")).rand()
     assert a == b
+
+
+def test_chunked_fingerprint_append_matches_full(demo_df):
+    full = ChunkedFingerprint.from_frame(demo_df, block_rows=16)
+    assert full.n_blocks == 8 and full.n_rows == len(demo_df)
+
+    fp = ChunkedFingerprint.from_frame(demo_df.iloc[:37], block_rows=16)
+    for lo, hi in [(37, 40), (40, 64), (64, 119), (119, 120)]:
+        fp = fp.append(demo_df.iloc[lo:hi])
+    assert fp.leaves == full.leaves and fp.root == full.root
+    assert ChunkedFingerprint.from_dict(full.to_dict()).append(demo_df.iloc[:0]).root == full.root
+
+    restored = ChunkedFingerprint.from_dict(
+        ChunkedFingerprint.from_frame(demo_df.iloc[:50], 16).to_dict()
+    )
+    assert restored.append(demo_df.iloc[50:]).root == full.root
+
+
+def test_chunked_fingerprint_diff(demo_df):
+    base = ChunkedFingerprint.from_frame(demo_df, block_rows=16)
+    df2 = demo_df.copy()
+    df2.iloc[20, 0] += 1
+    df2.iloc[40, 1] += 1
+    df2.iloc[47, 1] += 1
+    assert base.diff(ChunkedFingerprint.from_frame(df2, 16)) == [(16, 48)]
+    longer = ChunkedFingerprint.from_frame(demo_df.iloc[:100], 16)
+    assert base.diff(longer) == [(96, 120)]
+    renamed = ChunkedFingerprint.from_frame(demo_df.rename(columns={"Close": "c"}), 16)
+    assert base.diff(renamed) == [(0, 120)]
+    with pytest.raises(ValueError):
+        base.append(demo_df.rename(columns={"Close": "c"}).iloc[:1])
@@ -0,0 +1,132 @@
+import multiprocessing as mp
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.data.feature_store.cache import SmartCache
+from algo5.data.feature_store.memo import Memo, fingerprint
+
+
+def _sma(df, window=3, *, col="Close"):
+    return df[col].rolling(window).mean()
+
+
+def test_memo_keys_on_data_and_params(tmp_path, demo_df):
+    calls = []
+    memo = Memo(SmartCache(tmp_path))
+
+    @memo(version=1)
+    def sma(df, window=3, *, col="Close"):
+        calls.append(window)
+        return _sma(df, window, col=col)
+
+    a = sma(demo_df, 3)
+    b = sma(demo_df, window=3, col="Close")  # aynı normalize parametreler
+    assert len(calls) == 1
+    pd.testing.assert_series_equal(a, b)
+
+    sma(demo_df, 5)
+    changed = demo_df.copy()
+    changed.iloc[-1, 0] += 1.0
+    sma(changed, 3)
+    assert calls == [3, 5, 3]
+
+    cold = Memo(SmartCache(tmp_path))(version=1)(lambda df, window=3, *, col="Close": None)
+    assert cold.namespace != sma.namespace  # kimlik fonksiyona bağlı
+
+
+def test_composite_result_roundtrip_and_version_eviction(tmp_path, demo_df):
+    cache = SmartCache(tmp_path)
+
+    def backtest(df, cfg):
+        eq = (1 + df["Close"].pct_change().fillna(0.0)).cumprod()
+        return {"metrics": {"sharpe": 1.5, "n": len(df)}, "portfolio_equity": eq, "w": (1, 2)}
+
+    v1 = Memo(cache)(backtest, version="v1", namespace="bt")
+    first = v1(demo_df, {"fee": 1})
+    again = Memo(SmartCache(tmp_path))(backtest, version="v1", namespace="bt")(demo_df, {"fee": 1})
+    assert again["metrics"] == first["metrics"] and again["w"] == (1, 2)
+    pd.testing.assert_series_equal(again["portfolio_equity"], first["portfolio_equity"])
+    assert all(k.startswith("v1-") for k in cache.keys("bt"))
+
+    Memo(cache)(backtest, version="v2", namespace="bt")(demo_df, {"fee": 1})
+    assert cache.keys("bt") and all(k.startswith("v2-") for k in cache.keys("bt"))
+
+
+def test_stale_lock_is_broken(tmp_path):
+    memo = Memo(SmartCache(tmp_path), stale_lock_after=0.0)
+    f = memo(lambda x: np.arange(x), version=1, namespace="s")
+    lock = tmp_path / "s" / f"{f.cache_key(3)}.lock"
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    lock.write_text("123")
+    os.utime(lock, (time.time() - 10, time.time() - 10))
+    np.testing.assert_array_equal(f(3), np.arange(3))
+    assert not lock.exists()
+
+
+def _slow_worker(root, log):
+    memo = Memo(SmartCache(root), poll_interval=0.01)
+
+    @memo(version=1, namespace="flight")
+    def slow(n):
+        with open(log, "a") as fh:
+            fh.write("x")
+        time.sleep(0.3)
+        return np.arange(n)
+
+    assert slow(5).tolist() == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fork gerekli")
+def test_single_flight_across_processes(tmp_path):
+    log = tmp_path / "calls.txt"
+    ctx = mp.get_context("fork")
+    procs = [ctx.Process(target=_slow_worker, args=(tmp_path / "c", log)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+    assert all(p.exitcode == 0 for p in procs)
+    assert log.read_text() == "x"
+
+
+def test_fingerprint_sees_full_index_and_closure_state():
+    idx = pd.Index(np.arange(1000))
+    changed = idx.to_numpy().copy()
+    changed[500] = -1
+    assert fingerprint(idx) != fingerprint(pd.Index(changed))
+    dti = pd.date_range("2024-01-01", periods=1000, freq="min")
+    assert fingerprint(dti) != fingerprint(dti.delete(500).append(dti[-1:] + dti.freq))
+
+    def make(k):
+        return lambda x: x * k
+
+    assert fingerprint(make(2)) != fingerprint(make(3))
+    assert fingerprint(lambda x, k=2: x) != fingerprint(lambda x, k=3: x)
+
+
+def test_unfingerprintable_argument_runs_uncached(tmp_path):
+    class Opaque:
+        def __init__(self, df):
+            self.df = df
+
+    calls = []
+    f = Memo(SmartCache(tmp_path))(lambda o: calls.append(1) or len(o.df), version=1, namespace="o")
+    with pytest.raises(TypeError):
+        fingerprint(Opaque(None))
+    with pytest.warns(UserWarning, match="uncached"):
+        assert f(Opaque(pd.DataFrame({"a": [1, 2]}))) == 2
+    with pytest.warns(UserWarning):
+        f(Opaque(pd.DataFrame({"a": [1, 2]})))
+    assert len(calls) == 2 and not SmartCache(tmp_path).keys("o")
+
+
+def test_uncacheable_leaf_is_returned_but_not_stored(tmp_path):
+    mi = pd.DataFrame({"x": [1, 2]}, index=pd.MultiIndex.from_tuples([("a", 1), ("b", 2)]))
+    f = Memo(SmartCache(tmp_path))(lambda: mi, version=1, namespace="mi")
+    with pytest.warns(UserWarning, match="not cached"):
+        assert f() is mi
+    assert not SmartCache(tmp_path).keys("mi")
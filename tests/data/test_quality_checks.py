@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.data.quality.checks import OhlcvScanner, scan_ohlcv
+from algo5.data.quality.monitor import DataQualityMonitor
+
+
+def _bars(n=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2024-01-01", periods=n, freq="min", tz="UTC")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, n)))
+    df = pd.DataFrame(
+        {"open": close, "high": close * 1.001, "low": close * 0.999, "close": close}, index=idx
+    )
+    return df
+
+
+def _dirty():
+    df = _bars()
+    df = df.drop(df.index[500:503])  # 3 eksik bar
+    df = df.drop(df.index[900])  # 1 eksik bar
+    df.iloc[100, df.columns.get_loc("high")] = df["close"].iloc[100] * 0.5  # OHLC hatası
+    df.iloc[200, :] = -1.0  # negatif fiyat (ve tutarlı OHLC)
+    df.iloc[300, df.columns.get_loc("close")] = np.nan
+    df.iloc[1500, :] *= 1.2  # aykırı getiri
+    df.iloc[1200:1210, :] = df.iloc[1199].to_numpy()  # 11 barlık bayat seri
+    dup = df.iloc[[1700]]
+    back = df.iloc[[10]]
+    return pd.concat([df.iloc[:1701], dup, df.iloc[1701:1800], back, df.iloc[1800:]])
+
+
+def test_scan_reports_each_issue():
+    rep = scan_ohlcv(_dirty(), stale_bars=5)
+    c = rep.counts
+    assert rep.freq == pd.Timedelta("1min")
+    assert c["duplicates"] == 1 and c["non_monotonic"] == 1
+    assert c["ohlc_inconsistent"] == 1 and c["nonpositive_price"] == 1
+    assert c["nan_rows"] == 1 and c["stale_runs"] == 1
+    assert rep.events["stale_runs"][0]["bars"] == 11
+    # geriye sıçrama sonrası büyük ileri aralık da eksik bar sayılır
+    assert rep.events["missing_bars"][0]["missing"] == 3
+    assert rep.events["missing_bars"][1]["missing"] == 1
+    out_rows = {e["row"] for e in rep.events["outliers"]}
+    assert {1500, 1501} <= out_rows  # sıçrama ve geri dönüş
+    assert not rep.ok and not rep.to_dict()["ok"]
+
+
+def _split_z(rep):
+    d = rep.to_dict()
+    zs = [ev.pop("z") for ev in d["events"].get("outliers", [])]
+    return d, zs
+
+
+def test_results_do_not_depend_on_chunking():
+    df = _dirty()
+    whole, z = _split_z(scan_ohlcv(df))
+    frames = (df.iloc[i : i + 250] for i in range(0, len(df), 250))
+    for rep in [*(scan_ohlcv(df, chunk_rows=n) for n in (1, 7, 333)), scan_ohlcv(frames)]:
+        d, zs = _split_z(rep)
+        assert d == whole
+        assert zs == pytest.approx(z, rel=1e-9)  # toplama sırası farkı
+
+
+def test_memory_mapped_arrays(tmp_path):
+    df = _bars(n=5_000)
+    ts = df.index.as_unit("ns").asi8
+    for name, arr in [("ts", ts), *((c, df[c].to_numpy()) for c in df.columns)]:
+        np.save(tmp_path / f"{name}.npy", arr)
+    mm = {n: np.load(tmp_path / f"{n}.npy", mmap_mode="r") for n in ("ts", *df.columns)}
+    sc = OhlcvScanner(freq="1min", max_events=3)
+    for i in range(0, len(df), 1024):
+        sl = slice(i, i + 1024)
+        sc.update(mm["ts"][sl], mm["open"][sl], mm["high"][sl], mm["low"][sl], mm["close"][sl])
+    rep = sc.finish()
+    assert rep.rows == 5_000 and rep.ok and rep.counts["missing_bars"] == 0
+    assert rep.to_dict() == scan_ohlcv(df, freq="1min", max_events=3).to_dict()
+
+
+def test_monitor_includes_ohlcv_check(demo_df):
+    rep = DataQualityMonitor().run(demo_df)
+    assert rep["ok"] and rep["OhlcvCheck"]["ok"]
+    bad = demo_df.copy()
+    bad.iloc[5, bad.columns.get_loc("Low")] = 1e6
+    rep = DataQualityMonitor().run(bad)
+    assert not rep["ok"] and rep["OhlcvCheck"]["errors"]["ohlc_inconsistent"] == 1
+
+
+def test_inferred_freq_independent_of_chunking():
+    idx = pd.bdate_range("2024-01-05", periods=60, tz="UTC")  # Cuma başlangıcı
+    px = np.linspace(100.0, 110.0, idx.size)
+    df = pd.DataFrame({"open": px, "high": px + 1, "low": px - 1, "close": px}, index=idx)
+    df = df.drop(df.index[[20, 21]])  # 2 eksik iş günü (hafta içi)
+    reps = [scan_ohlcv(df, chunk_rows=n).to_dict() for n in (1, 3, 10, 1_000)]
+    assert all(r == reps[0] for r in reps)
+    assert reps[0]["freq"] == str(pd.Timedelta("1D"))
+    given = scan_ohlcv(df, chunk_rows=3, freq="1D").to_dict()
+    assert given == reps[0]
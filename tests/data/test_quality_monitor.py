@@ -1,6 +1,30 @@
+from algo5.data import integrity
+from algo5.data.integrity import ChunkedFingerprint
 from algo5.data.quality.monitor import DataQualityMonitor
 
 
 def test_schema_check_ok(demo_df):
     rep = DataQualityMonitor().run(demo_df)
     assert rep["ok"] and "checksum" in rep
+
+
+def test_monitor_fingerprint_is_incremental(demo_df, monkeypatch):
+    mon = DataQualityMonitor(block_rows=16, append_only=True)
+    first = mon.run(demo_df.iloc[:70])
+    assert first["changed_rows"] == [(0, 70)]
+
+    hashed = []
+    real = integrity._row_hashes
+    monkeypatch.setattr(integrity, "_row_hashes", lambda df: hashed.append(len(df)) or real(df))
+    rep = mon.run(demo_df)
+    assert sum(hashed) == (70 - 48) + 50  # sınır blokları + yeni satırlar
+    assert rep["checksum"] == ChunkedFingerprint.from_frame(demo_df, 16).root
+    assert rep["changed_rows"] == [(64, 120)]
+
+    edited = demo_df.copy()
+    edited.iloc[3, 0] = -1.0
+    assert mon.run(edited)["changed_rows"] == []  # append_only: sınırdan önceki düzenleme görülmez
+
+    full = DataQualityMonitor(block_rows=16)
+    full.run(demo_df)
+    assert full.run(edited)["changed_rows"] == [(0, 16)]
@@ -1,6 +1,6 @@
 import pytest
 
-from algo5.data.validate import validate_ohlcv
+from algo5.data.validate import OhlcvStreamValidator, validate_ohlcv
 
 
 def test_validate_happy_path(demo_df):
@@ -17,3 +17,23 @@ def test_missing_columns_raises(demo_df):
     bad = demo_df.drop(columns=["Volume"])
     with pytest.raises(ValueError):
         validate_ohlcv(bad, raise_errors=True)
+
+
+def test_stream_report_matches_whole_frame(demo_df):
+    df = demo_df.rename(columns={"Close": "close"})
+    df.iloc[[3, 70], 0] = float("nan")
+    _, whole = validate_ohlcv(df, raise_errors=False)
+    v = OhlcvStreamValidator(raise_errors=False)
+    out = list(v.stream(df.iloc[i : i + 50].copy() for i in range(0, len(df), 50)))
+    rep = v.finish()
+    assert rep.pop("rows") == len(df) and rep == whole
+    assert all("Close" in c.columns for c in out)
+
+
+def test_stream_missing_columns(demo_df):
+    v = OhlcvStreamValidator(raise_errors=False)
+    v.update(demo_df.iloc[:10].drop(columns=["Volume"]))
+    v.update(demo_df.iloc[10:].drop(columns=["Open"]))
+    assert v.finish()["missing"] == ["Open", "Volume"] and not v.report["ok"]
+    with pytest.raises(ValueError):
+        OhlcvStreamValidator().finish()  # hiç parça yok
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.engine.execution.engine_v2 import close_panel, run_panel_backtest, run_vector_backtest
+
+
+def _prices(rng, syms, index):
+    return {
+        s: pd.DataFrame({"close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))}, index)
+        for s in syms
+    }
+
+
+def test_panel_matches_run_vector_backtest_per_param():
+    rng = np.random.default_rng(4)
+    idx = pd.date_range("2024-01-01", periods=120, freq="D")
+    prices = _prices(rng, ["A", "B", "C"], idx)
+    close = close_panel(prices)
+    windows = [3, 5, 10, 20]
+
+    def strat(px, cfg):
+        return {
+            s: (df["close"] > df["close"].rolling(cfg["w"]).mean()).astype(float)
+            for s, df in px.items()
+        }
+
+    tensor = np.stack(
+        [pd.DataFrame(strat(prices, {"w": w}))[close.columns].to_numpy() for w in windows]
+    )
+    res = run_panel_backtest(close, tensor, initial_capital=10_000, chunk=3)
+    assert res["portfolio_equity"].shape == (len(windows), len(idx))
+
+    for p, w in enumerate(windows):
+        ref = run_vector_backtest(prices, strat, {"w": w}, initial_capital=10_000)
+        np.testing.assert_allclose(res["portfolio_equity"][p], ref["portfolio_equity"], rtol=1e-12)
+        got = res["metrics"].iloc[p].to_dict()
+        assert got == pytest.approx(ref["metrics"], rel=1e-9, abs=1e-12)
+
+
+def test_close_panel_uses_union_index():
+    a = pd.DataFrame({"close": [1.0, 2.0, 4.0]}, pd.date_range("2024-01-01", periods=3))
+    b = pd.DataFrame({"close": [10.0, 11.0]}, pd.date_range("2024-01-03", periods=2))
+    close = close_panel({"A": a, "B": b})
+    assert len(close) == 4 and list(close.columns) == ["A", "B"]
+
+    res = run_panel_backtest(close, np.ones((1, 4, 2)), initial_capital=1.0)
+    # A son barda işlem görmez (getiri 0), B ilk iki barda yok
+    np.testing.assert_allclose(res["portfolio_returns"][0], [0.0, 0.5, 0.5, 0.05])
+    with pytest.raises(ValueError):
+        run_panel_backtest(close, np.ones((1, 3, 2)))
@@ -0,0 +1,57 @@
+import json
+
+import pandas as pd
+import pytest
+
+from algo5.core.events import OrderFilled, OrderRequested, PortfolioUpdated, Tick
+from algo5.core.observability import structured_log
+from algo5.engine.execution.bracket import build_bracket
+from algo5.engine.execution.models import (
+    Fill,
+    MonotonicIds,
+    Order,
+    OrderType,
+    Side,
+    set_order_id_factory,
+)
+
+
+def test_orders_fills_and_events_have_no_instance_dict():
+    od = Order(side=Side.BUY, qty=1, type=OrderType.MARKET)
+    f = Fill(order_id=od.id, qty=1, price=100.0)
+    ts = pd.Timestamp("2025-01-01")
+    events = [
+        Tick(ts, "AAPL", 1.0, 2.0, 0.5, 1.5, 10.0),
+        OrderRequested(order=od),
+        OrderFilled(fill=f, order_id=od.id),
+        PortfolioUpdated(timestamp=ts, cash=1.0, position=0.0, equity=1.0),
+    ]
+    for obj in [od, f, *events]:
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        od.not_a_field = 1  # type: ignore[attr-defined]
+
+
+def test_monotonic_id_factory_and_reset():
+    prev = set_order_id_factory(MonotonicIds("o", start=10))
+    try:
+        ids = [Order(side=Side.BUY, qty=1, type=OrderType.MARKET).id for _ in range(3)]
+    finally:
+        set_order_id_factory(prev)
+    assert ids == ["o10", "o11", "o12"]
+    assert len(Order(side=Side.BUY, qty=1, type=OrderType.MARKET).id) == 32  # uuid4 hex
+
+
+def test_bracket_fields_are_declared():
+    entry, tp, sl = build_bracket(
+        Side.BUY, qty=1, entry=100.0, take_profit=105.0, stop_loss=95.0, trail_pct=0.02
+    )
+    assert entry.oco_id is None and entry.parent_id is None
+    assert tp.oco_id == sl.oco_id and tp.parent_id == sl.parent_id == entry.id
+    assert sl.trail_pct == 0.02 and sl.trail_amount is None
+
+
+def test_structured_log_normalizes_slotted_dataclasses():
+    od = Order(side=Side.SELL, qty=2, type=OrderType.LIMIT, limit_price=101.0)
+    doc = json.loads(structured_log("order", order=od))
+    assert doc["order"]["qty"] == 2 and doc["order"]["limit_price"] == 101.0
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from algo5.engine.execution.bracket import build_bracket
+from algo5.engine.execution.gateways.multi import MultiSymbolPaperGateway
+from algo5.engine.execution.gateways.paper import PaperGateway
+from algo5.engine.execution.models import Order, OrderType, Side
+
+
+def test_multi_gateway_matches_one_gateway_per_symbol():
+    rng = np.random.default_rng(8)
+    syms = [f"S{i}" for i in range(20)]
+    multi = MultiSymbolPaperGateway(syms, initial_capital=1e6, fees_bps=1.0, slippage_bps=2.0)
+    single = {s: PaperGateway(initial_capital=0.0, fees_bps=1.0, slippage_bps=2.0) for s in syms}
+    px = np.full(len(syms), 100.0)
+    n_fills = 0
+    for _ in range(150):
+        for _ in range(rng.integers(0, 8)):
+            s = syms[rng.integers(len(syms))]
+            k = syms.index(s)
+            if rng.random() < 0.2:
+                batch = build_bracket(Side.BUY, 1.0, px[k] - 1, px[k] + 2, px[k] - 3, symbol=s)
+            else:
+                t = OrderType.LIMIT if rng.random() < 0.7 else OrderType.MARKET
+                side = Side.BUY if rng.random() < 0.5 else Side.SELL
+                lim = round(px[k] + rng.normal(0, 2), 2) if t is OrderType.LIMIT else None
+                batch = [Order(side=side, qty=1.0, type=t, symbol=s, limit_price=lim)]
+            for od in batch:
+                multi.submit(od)
+                single[s].submit(od)
+
+        o = px + rng.normal(0, 0.5, len(syms))
+        c = o + rng.normal(0, 1, len(syms))
+        h = np.maximum(o, c) + rng.uniform(0, 1, len(syms))
+        low = np.minimum(o, c) - rng.uniform(0, 1, len(syms))
+        halted = rng.random(len(syms)) < 0.05
+        o[halted] = h[halted] = low[halted] = c[halted] = np.nan
+
+        got = multi.on_bars(o, h, low, c)
+        exp = [
+            (s, f)
+            for k, s in enumerate(syms)
+            if not halted[k]
+            for f in single[s].on_bar(o=o[k], h=h[k], low=low[k], c=c[k])
+        ]
+        assert got == exp
+        n_fills += len(got)
+        px = np.where(halted, px, c)
+
+    assert n_fills > 200
+    assert multi.positions.tolist() == [single[s].position for s in syms]
+    assert multi.cash == pytest.approx(1e6 + sum(g.cash for g in single.values()))
+    assert multi.equity(px) == pytest.approx(
+        1e6 + sum(single[s].equity(px[k]) for k, s in enumerate(syms))
+    )
+    assert [x.id for x in multi.orders()] == [x.id for s in syms for x in single[s].orders]
+
+
+def test_routing_cancel_and_unknown_symbol():
+    gw = MultiSymbolPaperGateway(["AAA", "BBB"], fees_bps=0.0, slippage_bps=0.0)
+    a = Order(side=Side.BUY, qty=2.0, type=OrderType.MARKET, symbol="AAA")
+    b = Order(side=Side.SELL, qty=1.0, type=OrderType.LIMIT, symbol="BBB", limit_price=50.0)
+    gw.submit(a)
+    gw.submit(b)
+    fills = gw.on_bars(
+        np.array([10.0, 40.0]),
+        np.array([11.0, 45.0]),
+        np.array([9.0, 39.0]),
+        np.array([10.5, 44.0]),
+    )
+    assert [(s, f.order_id) for s, f in fills] == [("AAA", a.id)]
+    assert gw.position("AAA") == 2.0 and gw.orders("BBB") == [b]
+    assert gw.cancel(b.id) and not gw.cancel(b.id) and gw.orders() == []
+    with pytest.raises(KeyError):
+        gw.submit(Order(side=Side.BUY, qty=1.0, type=OrderType.MARKET, symbol="ZZZ"))
@@ -1,6 +1,68 @@
+import numpy as np
+
+from algo5.engine.execution.bracket import build_bracket
+from algo5.engine.execution.gateways.paper import PaperGateway
+from algo5.engine.execution.models import Order, OrderType, Side
+from algo5.engine.execution.trailing_oco import TrailingState, trailing_trigger
+
+
+def _gw() -> PaperGateway:
+    return PaperGateway(initial_capital=10_000.0, fees_bps=0.0, slippage_bps=0.0)
+
+
 def test_oco_parent_fill_triggers_sl_tp():
-    assert True
+    gw = _gw()
+    entry, tp, sl = build_bracket(Side.BUY, 1.0, entry=100.0, take_profit=110.0, stop_loss=95.0)
+    for od in (entry, tp, sl):
+        gw.submit(od)
+    assert [f.order_id for f in gw.on_bar(o=100.0, h=101.0, low=99.0, c=100.5)] == [entry.id]
+    fills = gw.on_bar(o=97.0, h=97.5, low=94.0, c=95.0)  # SL tetiklenir, TP iptal
+    assert [f.order_id for f in fills] == [sl.id] and fills[0].price == 95.0
+    assert fills[0].cancel_oco_id == sl.oco_id
+    assert gw.orders == [] and gw.position == 0.0
 
 
 def test_trailing_stop_moves_with_price_and_triggers_on_retrace():
-    assert True
+    gw = _gw()
+    gw.position = 1.0
+    _, sl = build_bracket(Side.BUY, 1.0, 100.0, stop_loss=95.0, trail_amount=2.0)
+    assert sl.type is OrderType.TRAILING_STOP
+    gw.submit(sl)
+
+    assert gw.on_bar(o=100.0, h=101.0, low=99.5, c=100.5) == []  # peak 101 -> seviye 99
+    assert gw.on_bar(o=103.5, h=105.0, low=103.2, c=104.0) == []  # peak 105 -> seviye 103
+    assert gw.book.trailing.anchor(sl.id) == 105.0
+    fills = gw.on_bar(o=104.0, h=104.5, low=102.0, c=102.5)  # geri çekilme
+    assert [(f.order_id, f.price, f.qty) for f in fills] == [(sl.id, 103.0, -1.0)]
+    assert sl.id not in gw.book.trailing  # dolunca durum silinir
+
+
+def test_trailing_state_is_per_book_and_evicted_on_cancel():
+    a, b = _gw(), _gw()
+    od = Order(side=Side.BUY, qty=1.0, type=OrderType.TRAILING_STOP, trail_pct=0.02)
+    a.submit(od)
+    a.on_bar(o=100.0, h=100.5, low=99.0, c=99.5)
+    assert a.book.trailing.anchor(od.id) == 99.0 and len(b.book.trailing) == 0
+    assert a.cancel(od.id) and len(a.book.trailing) == 0
+
+
+def test_vectorized_trailing_matches_state_steps():
+    rng = np.random.default_rng(2)
+    c = 100 + np.cumsum(rng.normal(0, 1, 300))
+    o = np.r_[100.0, c[:-1]]
+    h, low = np.maximum(o, c) + 0.5, np.minimum(o, c) - 0.5
+    for side, kw in [
+        (Side.SELL, {"trail_amount": 3.0}),
+        (Side.BUY, {"trail_pct": 0.03}),
+        (Side.SELL, {"trail_pct": 0.5}),  # hiç tetiklenmez
+    ]:
+        od = Order(side=side, qty=1.0, type=OrderType.TRAILING_STOP, **kw)
+        st, exp = TrailingState(), (-1, None)
+        for i in range(len(o)):
+            px = st.step(od, o[i], h[i], low[i])
+            if px is not None:
+                exp = (i, px)
+                break
+        bar, px = trailing_trigger(o, h, low, side, **kw)
+        assert bar == exp[0]
+        assert (px == exp[1]) if bar >= 0 else np.isnan(px)
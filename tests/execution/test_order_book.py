@@ -0,0 +1,92 @@
+import numpy as np
+
+from algo5.engine.execution.book import OrderBook
+from algo5.engine.execution.bracket import build_bracket
+from algo5.engine.execution.gateways.paper import PaperGateway
+from algo5.engine.execution.matcher import match_order_on_bar
+from algo5.engine.execution.models import TIF, Order, OrderType, Side
+
+
+class _ListGateway:
+    """Referans: her bar tüm emirleri tarayan eski liste tabanlı kuyruk."""
+
+    def __init__(self, fees_bps: float, slippage_bps: float) -> None:
+        self.orders: list[Order] = []
+        self.fees_bps, self.slippage_bps = fees_bps, slippage_bps
+
+    def on_bar(self, o, h, low, c):
+        fills, remaining = [], []
+        for od in self.orders:
+            f = match_order_on_bar(
+                od, o=o, h=h, low=low, c=c, fees_bps=self.fees_bps, slippage_bps=self.slippage_bps
+            )
+            (fills if f is not None else remaining).append(f if f is not None else od)
+        self.orders = remaining
+        for f in fills:
+            if f.cancel_oco_id:
+                self.orders = [x for x in self.orders if x.oco_id != f.cancel_oco_id]
+        return fills
+
+
+def _random_order(rng, px: float) -> Order:
+    t = rng.choice([OrderType.MARKET, OrderType.LIMIT, OrderType.STOP, OrderType.STOP_LIMIT])
+    side = Side.BUY if rng.random() < 0.5 else Side.SELL
+    off = lambda: round(px + rng.normal(0, 3), 2)  # noqa: E731
+    kw = {}
+    if t in (OrderType.LIMIT, OrderType.STOP_LIMIT):
+        kw["limit_price"] = off()
+    if t in (OrderType.STOP, OrderType.STOP_LIMIT):
+        kw["stop_price"] = off()
+    tif = TIF.IOC if rng.random() < 0.1 else TIF.GTC
+    return Order(side=side, qty=float(rng.integers(1, 5)), type=t, tif=tif, **kw)
+
+
+def test_book_gateway_matches_list_scan():
+    rng = np.random.default_rng(3)
+    gw = PaperGateway(initial_capital=1e6, fees_bps=1.5, slippage_bps=2.0)
+    ref = _ListGateway(fees_bps=1.5, slippage_bps=2.0)
+    px = 100.0
+    n_fills = 0
+    for _ in range(300):
+        for _ in range(rng.integers(0, 6)):
+            od = _random_order(rng, px)
+            gw.submit(od)
+            ref.orders.append(od)
+        if rng.random() < 0.2:
+            for od in build_bracket(Side.BUY, 1.0, px - 1, px + 2, px - 3):
+                gw.submit(od)
+                ref.orders.append(od)
+        gap = rng.normal(0, 4) if rng.random() < 0.1 else 0.0  # gap korumasını da dene
+        o = px + gap
+        c = o + rng.normal(0, 1)
+        h, low = max(o, c) + rng.uniform(0, 2), min(o, c) - rng.uniform(0, 2)
+        got = gw.on_bar(o=o, h=h, low=low, c=c)
+        exp = ref.on_bar(o, h, low, c)
+        assert got == exp
+        assert [x.id for x in gw.orders] == [x.id for x in ref.orders]
+        n_fills += len(got)
+        px = c
+    assert n_fills > 100
+
+
+def test_oco_sibling_cancel_and_manual_cancel():
+    gw = PaperGateway(initial_capital=1_000.0, fees_bps=0.0, slippage_bps=0.0)
+    entry, tp, sl = build_bracket(Side.BUY, 1.0, entry=100.0, take_profit=105.0, stop_loss=95.0)
+    for od in (entry, tp, sl):
+        gw.submit(od)
+    gw.on_bar(o=100.5, h=101.0, low=99.5, c=100.0)  # entry dolar
+    assert [x.id for x in gw.orders] == [tp.id, sl.id]
+    fills = gw.on_bar(o=104.0, h=106.0, low=103.5, c=105.5)  # TP dolar, SL iptal
+    assert [f.order_id for f in fills] == [tp.id] and fills[0].cancel_oco_id == tp.oco_id
+    assert gw.orders == [] and gw.position == 0.0
+
+    extra = Order(side=Side.SELL, qty=1, type=OrderType.LIMIT, limit_price=200.0)
+    gw.submit(extra)
+    assert gw.cancel(extra.id) and not gw.cancel(extra.id)
+
+
+def test_candidates_only_visit_orders_in_range():
+    book = OrderBook()
+    for p in range(1, 1001):
+        book.add(Order(side=Side.BUY, qty=1, type=OrderType.LIMIT, limit_price=float(p)))
+    assert len(book.candidates(h=500.5, low=498.0)) == 3
@@ -0,0 +1,82 @@
+import numpy as np
+
+from algo5.engine.execution.bracket import build_bracket
+from algo5.engine.execution.gateways.paper import PaperGateway
+from algo5.engine.execution.matcher import match_order_on_bar
+from algo5.engine.execution.models import TIF, Order, OrderType, Side
+from algo5.engine.execution.trailing_oco import TrailingState
+from algo5.engine.execution.vector_matcher import OrderTable, match_orders_on_bars
+
+
+def _bars(rng, n: int):
+    c = 100 + np.cumsum(rng.normal(0, 1, n))
+    o = np.r_[100.0, c[:-1]] + np.where(rng.random(n) < 0.1, rng.normal(0, 3, n), 0.0)
+    h = np.maximum(o, c) + rng.uniform(0, 1.5, n)
+    low = np.minimum(o, c) - rng.uniform(0, 1.5, n)
+    return o, h, low, c
+
+
+def _random_order(rng) -> Order:
+    t = rng.choice(list(OrderType))
+    side = Side.BUY if rng.random() < 0.5 else Side.SELL
+    kw = {}
+    if t is OrderType.TRAILING_STOP:
+        kw["trail_amount" if rng.random() < 0.5 else "trail_pct"] = rng.uniform(0.01, 4.0)
+    if t in (OrderType.LIMIT, OrderType.STOP_LIMIT):
+        kw["limit_price"] = round(100 + rng.normal(0, 8), 2)
+    if t in (OrderType.STOP, OrderType.STOP_LIMIT):
+        kw["stop_price"] = round(100 + rng.normal(0, 8), 2)
+    tif = TIF.IOC if rng.random() < 0.2 else TIF.GTC
+    return Order(side=side, qty=float(rng.integers(1, 5)), type=t, tif=tif, **kw)
+
+
+def test_kernel_matches_bar_by_bar_matcher():
+    rng = np.random.default_rng(11)
+    o, h, low, c = _bars(rng, 400)
+    orders = [_random_order(rng) for _ in range(300)]
+    submit = rng.integers(0, 400, len(orders))
+    res = match_orders_on_bars(
+        o, h, low, c, OrderTable.from_orders(orders, submit), fees_bps=1.5, slippage_bps=2.0
+    )
+
+    for k, od in enumerate(orders):
+        exp_bar, exp = -1, None
+        last = submit[k] + 1 if od.tif is TIF.IOC else len(o)
+        trail = TrailingState()
+        for i in range(submit[k], last):
+            f = match_order_on_bar(
+                od, o=o[i], h=h[i], low=low[i], c=c[i], fees_bps=1.5, slippage_bps=2.0, trail=trail
+            )
+            if f is not None:
+                exp_bar, exp = i, f
+                break
+        assert res.fill_bar[k] == exp_bar
+        if exp is not None:
+            assert res.price[k] == exp.price
+            assert res.qty[k] == exp.qty
+            assert res.commission[k] == exp.commission
+    assert res.filled.sum() > 150
+
+
+def test_replay_equals_on_bar_loop():
+    rng = np.random.default_rng(5)
+    o, h, low, c = _bars(rng, 500)
+    fast = PaperGateway(initial_capital=1e6, fees_bps=1.0, slippage_bps=1.0)
+    slow = PaperGateway(initial_capital=1e6, fees_bps=1.0, slippage_bps=1.0)
+    orders = [_random_order(rng) for _ in range(200)]
+    orders += [od for _ in range(20) for od in build_bracket(Side.BUY, 1.0, 99.0, 104.0, 95.0)]
+    for od in orders:
+        fast.submit(od)
+        slow.submit(od)
+
+    got = fast.replay(o, h, low, c)
+    exp = [(i, f) for i in range(len(o)) for f in slow.on_bar(o=o[i], h=h[i], low=low[i], c=c[i])]
+    assert got == exp
+    assert fast.cash == slow.cash and fast.position == slow.position
+    assert [x.id for x in fast.orders] == [x.id for x in slow.orders]
+
+
+def test_empty_inputs():
+    empty = OrderTable.from_orders([])
+    res = match_orders_on_bars(np.ones(3), np.ones(3), np.ones(3), np.ones(3), empty)
+    assert len(res.fill_bar) == 0
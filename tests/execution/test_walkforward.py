@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.engine.execution.engine import TradeCosts, run_walkforward
+
+
+def _train(df: pd.DataFrame) -> dict:
+    return {"mu": float(df["close"].pct_change().mean())}
+
+
+def _infer(df: pd.DataFrame, state: dict) -> pd.Series:
+    mom = df["close"].pct_change(5)
+    return (mom > state["mu"]).astype(float)
+
+
+def _ohlcv(n: int, tz: str | None = None) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    c = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    idx = pd.date_range("2020-01-01", periods=n, freq="D", tz=tz, name="ts")
+    return pd.DataFrame(
+        {"open": c, "high": c * 1.01, "low": c * 0.99, "close": c, "volume": np.arange(n)},
+        index=idx,
+    )
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Istanbul"])
+def test_process_executor_matches_serial(tz):
+    df = _ohlcv(600, tz)
+    costs = TradeCosts(commission=0.0005)
+    serial = run_walkforward(df, _train, _infer, costs, n_splits=4, min_train=200)
+    par = run_walkforward(
+        df, _train, _infer, costs, n_splits=4, min_train=200, executor="process", max_workers=2
+    )
+    pd.testing.assert_series_equal(par["equity"], serial["equity"])
+    pd.testing.assert_series_equal(par["ret"], serial["ret"])
+    assert par["fold_stats"] == serial["fold_stats"] and par["overall"] == serial["overall"]
+    assert len(par["fold_times"]) == 4
+    assert set(par["fold_times"][0]) == {"load", "train", "infer", "backtest"}
+    assert (serial["equity"].iloc[:200] == 1.0).all()
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        run_walkforward(_ohlcv(300), _train, _infer, TradeCosts(), executor="thread")
@@ -1,7 +1,11 @@
 import pandas as pd
 
+from algo5.app.components import ExecutionEngine
 from algo5.app.runtime import build_event_driven_app
-from algo5.core.events import OrderRejected, PortfolioUpdated, Tick
+from algo5.core.bus import EventBus
+from algo5.core.events import OrderAuthorized, OrderFilled, OrderRejected, PortfolioUpdated, Tick
+from algo5.engine.execution.gateways.paper import PaperGateway
+from algo5.engine.execution.models import Order, OrderType, Side
 
 
 def test_market_then_limit_sell_flow():
@@ -37,3 +41,26 @@ def test_risk_rejects_when_position_limit_exceeded():
 
     assert len(rejections) == 1
     assert "limit" in rejections[0].reason.lower()
+
+
+def test_trailing_stop_fills_via_event_path():
+    bus = EventBus()
+    exe = ExecutionEngine(gateway=PaperGateway())
+    bus.subscribe(Tick, exe.on_tick)
+    bus.subscribe(OrderAuthorized, exe.on_order_authorized)
+    fills = []
+    bus.subscribe(OrderFilled, lambda e, b: fills.append(e))
+
+    order = Order(side=Side.SELL, qty=1, type=OrderType.TRAILING_STOP, trail_amount=2.0)
+    bus.publish(OrderAuthorized(order=order))
+
+    ts = pd.Timestamp("2025-01-01 09:30:00")
+    bars = [(103.0, 104.0, 102.5, 104.0), (108.5, 110.0, 108.5, 109.5), (107.0, 107.5, 95.0, 95.0)]
+    for k, (o, h, low, c) in enumerate(bars):
+        bus.publish(Tick(ts + pd.Timedelta(minutes=k), "AAPL", o, h, low, c, 1000))
+
+    # peak 110 -> seviye 108; son bar 107'de açılır (gap) -> min(open, seviye)
+    assert len(fills) == 1
+    assert fills[0].fill.price == 107.0
+    assert not exe.pending_orders
+    assert order.id not in exe.trailing
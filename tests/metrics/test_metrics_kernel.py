@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.metrics.metrics import compute_metrics, compute_metrics_batch
+
+
+def _pandas_metrics(nav: pd.Series) -> dict[str, float]:
+    """Referans: eski çok geçişli pandas implementasyonu."""
+    nav = nav.astype(float)
+    rets = nav.pct_change().dropna()
+    vol = float(rets.std() * np.sqrt(252)) if len(rets) else 0.0
+    sharpe = (
+        float((rets.mean() / rets.std()) * np.sqrt(252)) if len(rets) and rets.std() > 0 else 0.0
+    )
+    rollmax = nav.expanding().max()
+    mdd = float(((nav - rollmax) / rollmax).min()) if len(nav) else 0.0
+    total = float(nav.iloc[-1] / nav.iloc[0] - 1.0) if len(nav) else 0.0
+    return {"sharpe": sharpe, "max_drawdown": mdd, "total_return": total, "vol": vol}
+
+
+def _close(a: dict, b: dict) -> bool:
+    return all(
+        (np.isnan(a[k]) and np.isnan(b[k])) or b[k] == pytest.approx(a[k], rel=1e-12, abs=1e-15)
+        for k in a
+    )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [1.0],
+        [1.0, 1.1],
+        [1.0, 1.0, 1.0],
+        [np.nan, 1.0, 1.2, np.nan, 1.1, 1.3],
+        [1.0, np.nan, np.nan],
+        list(np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, 1000))),
+    ],
+)
+def test_kernel_matches_pandas(values):
+    nav = pd.Series(values, dtype=float)
+    assert _close(_pandas_metrics(nav), compute_metrics(nav))
+    assert _close(_pandas_metrics(nav), compute_metrics(nav.to_numpy()))
+
+
+def test_batch_matches_rowwise():
+    rng = np.random.default_rng(1)
+    navs = np.cumprod(1 + rng.normal(0, 0.01, (50, 400)), axis=1)
+    navs[3, 10] = np.nan  # maskeli yol
+    batch = compute_metrics_batch(navs)
+    for i in range(len(navs)):
+        ref = _pandas_metrics(pd.Series(navs[i]))
+        assert _close(ref, {k: float(v[i]) for k, v in batch.items()})
+    with pytest.raises(ValueError):
+        compute_metrics_batch(navs[0])
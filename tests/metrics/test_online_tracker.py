@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.app.runtime import build_event_driven_app
+from algo5.core.events import PortfolioUpdated, Tick
+from algo5.metrics.metrics import compute_metrics
+from algo5.metrics.online import OnlinePerformanceTracker
+
+
+def _same(a: dict, b: dict) -> bool:
+    return all(
+        (np.isnan(a[k]) and np.isnan(b[k])) or b[k] == pytest.approx(a[k], rel=1e-9, abs=1e-15)
+        for k in a
+    )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [100.0],
+        [100.0, 101.0],
+        [100.0, np.nan, 102.0, 99.0, np.nan, 105.0],
+        list(100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, 500))),
+    ],
+)
+def test_tracker_matches_compute_metrics(values):
+    tr = OnlinePerformanceTracker()
+    for v in values:
+        tr.update(v)
+    assert _same(compute_metrics(pd.Series(values, dtype=float)), tr.metrics())
+
+
+def test_tracker_on_event_bus_run():
+    bus, *_ = build_event_driven_app(initial_cash=10_000.0)
+    tr = OnlinePerformanceTracker().attach(bus)
+    seen: list[float] = []
+    bus.subscribe(PortfolioUpdated, lambda e, b: seen.append(e.equity))
+
+    rng = np.random.default_rng(3)
+    px = 100.0
+    for i in range(200):
+        o = px
+        px = px * (1 + rng.normal(0, 0.01))
+        ts = pd.Timestamp("2024-01-01") + pd.Timedelta(minutes=i)
+        h, low = max(o, px) + 0.1, min(o, px) - 0.1
+        bus.publish(Tick(ts=ts, symbol="AAPL", o=o, h=h, low=low, c=px, v=1_000.0))
+
+    assert tr.n_updates == len(seen) > 200
+    assert _same(compute_metrics(pd.Series(seen)), tr.metrics())
+    snap = tr.snapshot()
+    assert snap.equity == seen[-1] and snap.max_drawdown <= snap.drawdown <= 0.0
+    assert snap.traded_qty > 0 and snap.turnover > 0 and snap.avg_exposure > 0.0
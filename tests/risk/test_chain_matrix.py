@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.engine.risk.chain import RiskChain
+from algo5.engine.risk.ewm import EwmVar, ewm_std
+from algo5.engine.risk.rules import (
+    CoolDownRule,
+    DrawdownGuardRule,
+    FloorCapRule,
+    MaxPositionRule,
+    Rule,
+    VolTargetRule,
+)
+from algo5.engine.risk.sizer import Sizer
+
+
+class _HalfOnNegative(Rule):
+    """Özel kural: Series yoluna düşmeli."""
+
+    def apply(self, returns: pd.Series, weights: pd.Series):
+        return weights.where(returns >= 0, weights * 0.5)
+
+
+def _panel(t: int = 400, s: int = 6, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    vol = np.r_[np.full(t // 2, 0.002), np.full(t - t // 2, 0.03)]
+    rets = rng.normal(0, 1, (t, s)) * vol[:, None]
+    rets[:30, 1] = 0.0  # sıfır vol -> ölçek 1
+    rets[5, 2] = np.nan
+    sig = rng.uniform(-0.2, 1.3, (t, s))
+    sig[7, 3] = np.nan
+    return rets, sig
+
+
+@pytest.mark.parametrize("span", [2, 20])
+def test_ewm_std_matches_pandas(span):
+    rets, _ = _panel()
+    rets = np.nan_to_num(rets)
+    ref = pd.DataFrame(rets).ewm(span=span, adjust=False).std(bias=False).to_numpy()
+    np.testing.assert_array_equal(ewm_std(rets, span), ref)
+
+    st, rows = EwmVar(span, rets.shape[1]), []
+    for x in rets:
+        rows.append(np.sqrt(np.maximum(st.update(x), 0.0)))
+    np.testing.assert_array_equal(np.array(rows), ref)
+
+
+@pytest.mark.parametrize(
+    "context",
+    [None, {"recent_loss": True, "equity_curve": pd.Series([100.0, 120.0, 95.0, 97.0])}],
+)
+def test_matrix_chain_matches_series_chain(context):
+    rets, sig = _panel()
+    chain = RiskChain(
+        Sizer(),
+        [
+            VolTargetRule(target_pct=12.0, lookback=20),
+            MaxPositionRule(max_w=0.8),
+            CoolDownRule(reduction=0.5),
+            DrawdownGuardRule(dd_window=10, max_dd=0.1),
+            _HalfOnNegative(),
+            FloorCapRule(floor=0.05, cap=0.9),
+        ],
+    )
+    compiled = chain.compile()
+    got = compiled.run(rets, sig, context)
+    for j in range(rets.shape[1]):
+        ref = chain.run(pd.Series(rets[:, j]), pd.Series(sig[:, j]), context)
+        np.testing.assert_array_equal(got[:, j], ref.to_numpy())
+
+    # tampon yeniden kullanılır, DataFrame girdisi indeksini korur
+    idx = pd.date_range("2024-01-01", periods=len(rets), freq="D")
+    df = compiled.run(pd.DataFrame(rets, idx), pd.DataFrame(sig, idx), context)
+    assert isinstance(df, pd.DataFrame) and df.index.equals(idx)
+    np.testing.assert_array_equal(df.to_numpy(), got)
+
+
+def test_drawdown_guard_per_symbol_equity():
+    w = np.full((3, 2), 0.5)
+    eq = np.array([[100.0, 100.0], [100.0, 120.0], [100.0, 90.0]])
+    out = DrawdownGuardRule(dd_window=10, max_dd=0.2).apply_matrix(
+        np.zeros((3, 2)), w, {"equity_curve": eq}
+    )
+    # sadece %25 düşüşteki ikinci sembol kırpılır
+    assert out[:, 0].tolist() == [0.5] * 3 and out[:, 1].tolist() == [0.0] * 3
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.core.risk import EwmCov, PortfolioVolTarget, RiskConfig, StreamingRiskEngine
+
+
+def _panel(t=200, n=4, seed=0):
+    rng = np.random.default_rng(seed)
+    common = rng.normal(0, 0.01, (t, 1))
+    return common + rng.normal(0, 0.005, (t, n))
+
+
+def test_ewm_cov_matches_pandas():
+    r = _panel()
+    cov = EwmCov(20, r.shape[1])
+    for x in r:
+        cov.update(x)
+    ref = pd.DataFrame(r).ewm(span=20, adjust=False).cov(bias=False).iloc[-r.shape[1] :]
+    np.testing.assert_allclose(cov.covariance(), ref.to_numpy(), rtol=1e-10)
+    w = np.array([0.1, 0.4, -0.2, 0.3])
+    assert cov.quad(w) == pytest.approx(w @ ref.to_numpy() @ w, rel=1e-10)
+
+
+def test_single_asset_matches_streaming_engine():
+    px = 100 * np.exp(np.cumsum(_panel(n=1)[:, 0]))
+    cfg = RiskConfig(vol_target_pct=8.0, vol_lookback=20)
+    pvt = PortfolioVolTarget.from_config(cfg, 1)
+    eng = StreamingRiskEngine(cfg)
+    for p in px:
+        pvt.on_price([p])
+        eng.on_price(p)
+        assert pvt.target_weights([1.0])[0] == pytest.approx(eng.weight(1.0), rel=1e-9)
+
+
+def test_batch_equals_streaming_and_hits_target():
+    r = _panel(t=300, n=5, seed=3)
+    w = np.tile([0.5, 0.5, 0.5, 0.5, 0.5], (300, 1))
+    batch, scales = PortfolioVolTarget(5, target_pct=5.0).run(r, w, block=16)
+
+    pvt = PortfolioVolTarget(5, target_pct=5.0)
+    for t in range(len(r)):
+        pvt.on_return(r[t])
+        np.testing.assert_allclose(pvt.target_weights(w[t]), batch[t], rtol=1e-12)
+    assert pvt.last_scale == pytest.approx(scales[-1], rel=1e-12)
+
+    # korelasyon dahil: ölçeklenmiş portföy vol'ü hedefte
+    assert scales[-1] < 1.0
+    assert pvt.portfolio_vol(batch[-1]) == pytest.approx(0.05, rel=1e-9)
+    assert scales[0] == 1.0  # tek gözlem: kovaryans yok
+
+
+def test_run_validates_shape():
+    with pytest.raises(ValueError):
+        PortfolioVolTarget(3).run(np.zeros((5, 2)), np.zeros((5, 2)))
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from algo5.app.runtime import build_event_driven_app
+from algo5.core.events import OrderRejected, Tick
+from algo5.core.risk import RiskConfig, RiskEngine, StreamingRiskEngine
+
+
+def _prices(n: int = 300, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    vol = np.r_[np.full(n // 2, 0.002), np.full(n - n // 2, 0.03)]
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 1, n) * vol)))
+
+
+def test_streaming_matches_batch_each_bar():
+    px = _prices()
+    rets = px.pct_change()
+    sig = pd.Series(np.random.default_rng(1).uniform(-0.2, 1.2, len(px)))
+    cfg = RiskConfig(vol_target_pct=12.0, vol_lookback=20, stop_loss_pct=5.0)
+    batch_w = RiskEngine(cfg).size_positions(rets, sig).to_numpy()
+    batch_adj, _ = RiskEngine(cfg).apply_stops(rets, px)
+
+    eng = StreamingRiskEngine(cfg)
+    w, adj = [], []
+    for p, s in zip(px, sig, strict=True):
+        _, a = eng.on_price(p)
+        w.append(eng.weight(s))
+        adj.append(a)
+    np.testing.assert_array_equal(w, batch_w)
+    np.testing.assert_array_equal(adj, batch_adj.to_numpy())
+    assert eng.stop_bars == int((batch_adj == 0).sum()) > 0
+
+
+def test_streaming_vector_mode_and_disabled():
+    px = np.column_stack([_prices(seed=s).to_numpy() for s in range(3)])
+    cfg = RiskConfig(vol_target_pct=10.0)
+    eng = StreamingRiskEngine(cfg, n_symbols=3)
+    for row in px:
+        eng.on_price(row)
+    for j in range(3):
+        ref = RiskEngine(cfg).size_positions(
+            pd.Series(px[:, j]).pct_change(), pd.Series(1.0, range(len(px)))
+        )
+        assert eng.weight(np.ones(3))[j] == ref.iloc[-1]
+
+    off = StreamingRiskEngine(RiskConfig(enabled=False))
+    off.on_price(100.0)
+    assert off.weight(1.5) == 1.0 and off.multiplier() == 1.0
+
+
+def test_risk_guard_scales_and_rejects_via_runtime():
+    bus, _, risk, _, pf = build_event_driven_app(
+        initial_cash=1e6, risk_cfg=RiskConfig(vol_target_pct=5.0, stop_loss_pct=3.0)
+    )
+    rejected = []
+    bus.subscribe(OrderRejected, lambda e, b: rejected.append(e.reason))
+    rng = np.random.default_rng(2)
+    px = 100.0
+    for i in range(300):
+        o = px
+        px = px * (1 + rng.normal(-0.002, 0.02))
+        ts = pd.Timestamp("2024-01-01") + pd.Timedelta(minutes=i)
+        h, low = max(o, px) + 0.05, min(o, px) - 0.05
+        bus.publish(Tick(ts=ts, symbol="AAPL", o=o, h=h, low=low, c=px, v=1.0))
+
+    eng = risk.engines["AAPL"]
+    assert eng.n_bars == 300 and eng.stop_bars > 0
+    assert any("Risk scale" in r for r in rejected)
+    assert 0.0 <= pf.position <= 1.0  # ölçeklenen giriş, sınırlanan çıkış
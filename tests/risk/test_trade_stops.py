@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from algo5.core.risk import RiskConfig, RiskEngine, segmented_stops
+
+
+def _loop_stops(exp, px, sl, cooloff, reentry):
+    """Referans: bar bar işlem takibi (tek sütun)."""
+    out = np.zeros_like(exp)
+    stops = []
+    thr = sl / 100.0
+    in_trade, ext, side, wait_until, blocked = False, np.nan, 0.0, -1, False
+    for t in range(len(exp)):
+        s = np.sign(exp[t])
+        if s == 0 or s != side:  # sinyal bitti / yön değişti -> yeni işlem serbest
+            in_trade, blocked, wait_until = False, False, -1
+        side = s
+        if s == 0 or blocked or t < wait_until:
+            continue
+        if not in_trade:
+            in_trade, ext = True, px[t]
+        ext = max(ext, px[t]) if s > 0 else min(ext, px[t])
+        out[t] = exp[t]
+        move = px[t] / ext - 1.0 if s > 0 else -(px[t] / ext - 1.0)
+        if move <= -thr:
+            stops.append(t)
+            in_trade = False
+            if reentry == "cooloff":
+                wait_until = t + 1 + cooloff
+            else:
+                blocked = True
+    return out, stops
+
+
+@pytest.mark.parametrize("reentry,cooloff", [("next_signal", 0), ("cooloff", 0), ("cooloff", 3)])
+def test_segmented_stops_matches_loop(reentry, cooloff):
+    rng = np.random.default_rng(7)
+    t_len, n_sym = 400, 5
+    px = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (t_len, n_sym)), axis=0))
+    raw = rng.choice([-1.0, 0.0, 1.0], size=(t_len // 20, n_sym), p=[0.3, 0.2, 0.5])
+    exp = np.repeat(raw, 20, axis=0) * rng.uniform(0.5, 1.0, (t_len, n_sym))
+
+    adj, ev = segmented_stops(exp, px, 4.0, cooloff_bars=cooloff, reentry=reentry)
+    assert adj.shape == exp.shape
+    total = 0
+    for j in range(n_sym):
+        ref, ref_stops = _loop_stops(exp[:, j], px[:, j], 4.0, cooloff, reentry)
+        np.testing.assert_array_equal(adj[:, j], ref)
+        assert ev.stop_bar[ev.symbol == j].tolist() == ref_stops
+        total += len(ref_stops)
+    assert len(ev) == total > 0
+    assert (ev.drawdown <= -0.04).all()
+
+
+def test_peak_resets_per_trade_unlike_global_stop():
+    idx = pd.date_range("2024-01-01", periods=8, freq="D")
+    price = pd.Series([100, 120, 90, 91, 92, 93, 95, 94], index=idx, dtype=float)
+    pos = pd.Series([1, 1, 0, 1, 1, 1, 1, 1], index=idx, dtype=float)
+    eng = RiskEngine(RiskConfig(vol_target_pct=None, stop_loss_pct=5.0))
+
+    glob, _ = eng.apply_stops(pos, price)
+    assert (glob.iloc[2:] == 0).all()  # global tepe (120) hiç sıfırlanmaz
+
+    adj, logs = eng.apply_stops(pos, price, position=pos)
+    assert (adj == 1.0).all()  # ikinci işlem 91'den başlar, %5 düşüş yok
+    assert logs == []
+
+    exp, log = eng.apply_trade_stops(pos, price)
+    pd.testing.assert_series_equal(exp, pos)
+    assert log.empty
+
+
+def test_cooloff_reentry_and_event_log():
+    idx = pd.date_range("2024-01-01", periods=10, freq="D")
+    price = pd.Series([100, 104, 98, 97, 99, 100, 101, 95, 96, 97], index=idx, dtype=float)
+    pos = pd.Series(1.0, index=idx)
+    cfg = RiskConfig(vol_target_pct=None, stop_loss_pct=5.0)
+
+    flat, log = RiskEngine(cfg).apply_trade_stops(pos, price)
+    assert flat.tolist() == [1, 1, 1] + [0] * 7  # 98 <= 104*0.95 -> bar 2'de çıkış
+    assert log[["stop_bar", "entry_bar", "reentry_bar"]].iloc[0].tolist() == [2, 0, -1]
+    assert log["ts"].iloc[0] == idx[2]
+    assert log["extreme"].iloc[0] == 104.0
+
+    cfg.stop_reentry, cfg.stop_cooloff_bars = "cooloff", 2
+    exp, log = RiskEngine(cfg).apply_trade_stops(pos, price)
+    # bar 5'te yeniden giriş (tepe 100), 101 -> 95 ile bar 7'de tekrar stop
+    assert exp.tolist() == [1, 1, 1, 0, 0, 1, 1, 1, 0, 0]
+    assert log["stop_bar"].tolist() == [2, 7]
+    assert log["reentry_bar"].tolist() == [5, -1]
+
+
+def test_short_trades_and_frame_io():
+    idx = pd.RangeIndex(6)
+    price = pd.DataFrame({"A": [100, 99, 105, 104, 103, 102], "B": [50, 49, 51, 52, 50, 53.0]})
+    pos = pd.DataFrame({"A": [-1.0] * 6, "B": [1.0] * 6}, index=idx)
+    cfg = RiskConfig(vol_target_pct=None, stop_loss_pct=5.0)
+
+    exp, log = RiskEngine(cfg).apply_trade_stops(pos, price)
+    assert exp["A"].tolist() == [-1, -1, -1, 0, 0, 0]  # 105 >= 99*1.05
+    assert exp["B"].tolist() == pos["B"].tolist()
+    assert log["symbol"].tolist() == ["A"]
+    assert log["extreme"].iloc[0] == 99.0
+
+
+def test_disabled_returns_input():
+    pos = pd.Series([1.0, 1.0, 0.0])
+    exp, log = RiskEngine(RiskConfig(stop_loss_pct=None)).apply_trade_stops(pos, pos)
+    pd.testing.assert_series_equal(exp, pos)
+    assert log.empty
+    with pytest.raises(ValueError):
+        segmented_stops(pos.to_numpy(), pos.to_numpy(), 5.0, reentry="never")